@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+Deterministic inputs of the natlang benchmarks.
+
+Texts start with a bundled passage and go on with sentences generated from
+templates and word lists by a seeded random number generator, so that a
+given size and seed always give the same input, on every machine and
+without any download.
+"""
+
+import random
+import re
+from typing import List, Tuple
+
+# The opening of "Alice's Adventures in Wonderland", by Lewis Carroll (1865),
+# which is in the public domain.
+BUNDLED_TEXT = """\
+Alice was beginning to get very tired of sitting by her sister on the bank, \
+and of having nothing to do: once or twice she had peeped into the book her \
+sister was reading, but it had no pictures or conversations in it, "and what \
+is the use of a book," thought Alice "without pictures or conversations?"
+
+So she was considering in her own mind (as well as she could, for the hot day \
+made her feel very sleepy and stupid), whether the pleasure of making a \
+daisy-chain would be worth the trouble of getting up and picking the daisies, \
+when suddenly a White Rabbit with pink eyes ran close by her.
+
+There was nothing so very remarkable in that; nor did Alice think it so very \
+much out of the way to hear the Rabbit say to itself, "Oh dear! Oh dear! I \
+shall be late!" But when the Rabbit actually took a watch out of its \
+waistcoat-pocket, and looked at it, and then hurried on, Alice started to her \
+feet. In another moment down went Alice after it, never once considering how \
+in the world she was to get out again.
+"""
+
+_sentence_end = re.compile(r'(?<=[.?!"])\s+(?=[A-Z])')
+
+PEOPLE = ("Alice Smith", "John Jones", "Maria Garcia", "Wei Chen", "Omar Haddad")
+PLACES = ("London", "Berlin", "Paris", "Chicago", "Madrid", "Tokyo")
+COMPANIES = ("Google", "Siemens", "Toyota", "Microsoft", "Nestle")
+DAYS = ("Monday", "Tuesday", "Friday", "May 3", "Christmas Day")
+
+NOUNS = (
+    "house", "tree", "river", "book", "garden", "window", "child", "city",
+    "letter", "mountain", "goose", "mouse", "knife", "story", "company",
+)  # fmt: skip
+VERBS = (
+    "walked", "wrote", "found", "opened", "painted", "carried", "watched",
+    "bought", "remembered", "crossed",
+)  # fmt: skip
+ADJECTIVES = (
+    "small", "bright", "old", "quiet", "happy", "heavy", "strange", "green",
+    "careful", "large",
+)  # fmt: skip
+
+GERMAN_SENTENCES = (
+    "Der Hund schläft im Garten.",
+    "Wir fahren morgen mit dem Zug nach Hamburg.",
+    "Das Wetter ist heute sehr schön.",
+)
+
+TEMPLATES = (
+    "{person} {verb} the {adjective} {noun} in {place} on {day}.",
+    "The {adjective} {noun} was {verb} by {person}.",
+    "{company} paid ${amount} for {number} {noun}s in {place}.",
+    "Write to {email} or visit {url} for the {noun}.",
+    "Why had the {noun} {verb} the {adjective} {noun2}?",
+)
+
+
+def _sentence(rng: random.Random) -> str:
+    if rng.random() < 0.05:
+        return rng.choice(GERMAN_SENTENCES)
+    person = rng.choice(PEOPLE)
+    return rng.choice(TEMPLATES).format(
+        person=person,
+        place=rng.choice(PLACES),
+        company=rng.choice(COMPANIES),
+        day=rng.choice(DAYS),
+        noun=rng.choice(NOUNS),
+        noun2=rng.choice(NOUNS),
+        verb=rng.choice(VERBS),
+        adjective=rng.choice(ADJECTIVES),
+        amount=rng.randrange(10, 10000),
+        number=rng.randrange(2, 100),
+        email="%s@example.org" % person.split()[0].lower(),
+        url="https://example.org/%s" % rng.choice(NOUNS),
+    )
+
+
+def sentences(count: int, seed: int = 0) -> List[str]:
+    """
+    Return ``count`` sentences: those of the bundled passage first, and
+    then generated ones.
+    """
+    result = [
+        sentence
+        for paragraph in BUNDLED_TEXT.split("\n\n")
+        for sentence in _sentence_end.split(paragraph.strip())
+    ][:count]
+    rng = random.Random(seed)
+    while len(result) < count:
+        result.append(_sentence(rng))
+    return result
+
+
+def text(count: int, seed: int = 0) -> str:
+    """
+    Return a text of ``count`` sentences, in paragraphs of four sentences.
+    """
+    parts = sentences(count, seed)
+    return "\n\n".join(" ".join(parts[i : i + 4]) for i in range(0, len(parts), 4))
+
+
+def words(count: int, seed: int = 0) -> List[str]:
+    """
+    Return ``count`` words drawn from the word lists, some of them repeated
+    as in running text.
+    """
+    vocabulary = NOUNS + VERBS + ADJECTIVES
+    rng = random.Random(seed)
+    return [rng.choice(vocabulary) for _ in range(count)]
+
+
+def misspelled(count: int, seed: int = 0) -> List[str]:
+    """
+    Return ``count`` words, about half of them with a character deleted,
+    doubled or swapped with the next one.
+    """
+    rng = random.Random(seed + 1)
+    result = []
+    for word in words(count, seed):
+        if len(word) > 3 and rng.random() < 0.5:
+            i = rng.randrange(1, len(word) - 1)
+            edit = rng.randrange(3)
+            if edit == 0:
+                word = word[:i] + word[i + 1 :]
+            elif edit == 1:
+                word = word[:i] + word[i] + word[i:]
+            else:
+                word = word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+        result.append(word)
+    return result
+
+
+def pairs(count: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """
+    Return ``count`` pairs of nouns.
+    """
+    rng = random.Random(seed)
+    return [(rng.choice(NOUNS), rng.choice(NOUNS)) for _ in range(count)]
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the natlang builtins.
+
+Each builtin exported by pymathics.natlang is evaluated on inputs of
+increasing size from ``corpus``, which is deterministic and needs no
+download. For each builtin, this measures:
+
+* the cold latency: the first evaluation, in a fresh process, which loads
+  the models and tables the builtin needs;
+* the peak memory of that process, and its memory once the module is loaded;
+* the warm latency for each input size: the median of repeated evaluations,
+  with the throughput in characters of input per second.
+
+Run from the top directory of the repository::
+
+    python benchmark/run.py --output results.json
+    python benchmark/run.py --baseline baseline.json
+    python benchmark/run.py --save-baseline baseline.json
+
+With ``--baseline``, the results are compared with those of an earlier run
+and the exit status is 1 if a builtin got slower by more than the tolerance.
+The comparison goes to the standard error, like the progress of the run, so
+that the standard output only has the results.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+import corpus
+
+# The input of a case is in this Mathics variable.
+INPUT = "BenchmarkInput"
+
+# For each builtin, the kind of its input and the expression evaluated.
+# Kinds are "text" (a text of n sentences), "sentences", "words",
+# "misspelled", "pairs" (lists of n items), "count" (the integer n) and
+# "none", for builtins whose work does not depend on an input.
+CASES = {
+    "Antonyms": ("words", "Antonyms[%s]"),
+    "Containing": ("text", 'TextCases[%s, Containing["Sentence", "City"]]'),
+    "DeleteStopwords": ("text", "DeleteStopwords[%s]"),
+    "DictionaryLookup": ("words", "DictionaryLookup[StringTake[#, 2] ~~ ___] & /@ %s"),
+    "DictionaryWordQ": ("misspelled", "DictionaryWordQ[%s]"),
+    "LanguageIdentify": ("sentences", "LanguageIdentify[%s]"),
+    "NatlangProfile": ("none", "NatlangProfile[False]"),
+    "NatlangStatistics": ("none", "NatlangStatistics[]"),
+    "Pluralize": ("words", "Pluralize[%s]"),
+    "RandomWord": ("count", 'RandomWord["Noun", %s]'),
+    "Singularize": ("words", "Singularize[%s]"),
+    "SpellingCorrect": ("text", "SpellingCorrect[%s]"),
+    "SpellingCorrectionList": ("misspelled", "SpellingCorrectionList[%s]"),
+    "Synonyms": ("words", "Synonyms[%s]"),
+    "TextCases": ("text", 'TextCases[%s, "Person"]'),
+    "TextLemmas": ("text", "TextLemmas[%s]"),
+    "TextPosition": ("text", 'TextPosition[%s, "City"]'),
+    "TextSentences": ("text", "TextSentences[%s]"),
+    "TextStructure": ("text", 'TextStructure[%s, "ConstituentString"]'),
+    "TextWords": ("text", "TextWords[%s]"),
+    "WordCount": ("text", "WordCount[%s]"),
+    "WordData": ("words", 'WordData[%s, "Definitions"]'),
+    "WordDefinition": ("words", "WordDefinition /@ %s"),
+    "WordFrequency": ("text", 'WordFrequency[%s, "the"]'),
+    "WordLemma": ("words", "WordLemma[%s]"),
+    "WordList": ("none", "Length[WordList[]]"),
+    "WordNetSimilarity": ("pairs", "WordNetSimilarity[%s]"),
+    "WordSimilarity": ("pairs", "WordSimilarity @@@ %s"),
+    "WordStem": ("words", "WordStem[%s]"),
+}
+
+# Builtins not benchmarked, with the reason.
+SKIPPED = {
+    # It freezes the objects of the process against garbage collection,
+    # which would change the measures of the builtins run after it.
+    "NatlangPreload": "changes the garbage collection of the process",
+}
+
+DEFAULT_SIZES = (1, 10, 100, 1000)
+
+
+def make_input(kind: str, size: int):
+    """
+    Return the input of ``kind`` and ``size`` as a Python value, and its
+    number of characters.
+    """
+    if kind == "text":
+        value = corpus.text(size)
+        return value, len(value)
+    if kind == "sentences":
+        value = corpus.sentences(size)
+    elif kind == "words":
+        value = corpus.words(size)
+    elif kind == "misspelled":
+        value = corpus.misspelled(size)
+    elif kind == "pairs":
+        value = [list(pair) for pair in corpus.pairs(size)]
+        return value, sum(len(a) + len(b) for a, b in value)
+    elif kind == "count":
+        return size, 0
+    else:
+        return None, 0
+    return value, sum(map(len, value))
+
+
+def peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux gives kilobytes, macOS bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class Runner:
+    """
+    Mathics session with the module loaded, evaluating the cases.
+    """
+
+    def __init__(self):
+        from mathics.core.load_builtin import import_and_load_builtins
+        from mathics.session import MathicsSession
+
+        import_and_load_builtins()
+        self.session = MathicsSession(
+            character_encoding="ASCII", add_builtin=True, catch_interrupt=False
+        )
+        self.evaluate('LoadModule["pymathics.natlang"]')
+
+    def evaluate(self, expression: str):
+        return self.session.evaluate(expression)
+
+    def set_input(self, value):
+        from mathics.core.convert.python import from_python
+
+        # The input is assigned once, so that parsing it is not measured.
+        self.session.evaluation.definitions.set_ownvalue(
+            "Global`" + INPUT, from_python(value)
+        )
+
+    def time(self, expression: str) -> float:
+        self.session.evaluation.out.clear()
+        start = time.perf_counter()
+        self.evaluate(expression + ";")
+        seconds = time.perf_counter() - start
+        messages = [out.text for out in self.session.evaluation.out]
+        if messages:
+            print("  %s: %s" % (expression, "; ".join(messages)), file=sys.stderr)
+        return seconds
+
+
+def expression(name: str) -> str:
+    template = CASES[name][1]
+    return template % INPUT if "%s" in template else template
+
+
+def run_cold(name: str, size: int) -> dict:
+    """
+    Measure the first evaluation of the case of ``name`` in this process,
+    on an input of size 1, and the peak memory of the process once the case
+    is evaluated on an input of ``size``.
+    """
+    runner = Runner()
+    loaded_kb = peak_rss_kb()
+    kind = CASES[name][0]
+    runner.set_input(make_input(kind, 1)[0])
+    seconds = runner.time(expression(name))
+    runner.set_input(make_input(kind, size)[0])
+    runner.time(expression(name))
+    return {
+        "cold_seconds": seconds,
+        "loaded_rss_kb": loaded_kb,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def cold(name: str, size: int) -> dict:
+    """
+    Run the cold measure of ``name`` in a fresh process.
+    """
+    completed = subprocess.run(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--cold",
+            name,
+            "--sizes",
+            str(size),
+        ],
+        stdout=subprocess.PIPE,
+    )
+    if completed.returncode != 0:
+        return {"error": "exit status %d" % completed.returncode}
+    return json.loads(completed.stdout)
+
+
+def warm(runner: Runner, name: str, sizes: List[int], repeat: int) -> dict:
+    kind = CASES[name][0]
+    results = {}
+    for size in sizes if kind != "none" else [0]:
+        value, characters = make_input(kind, size)
+        runner.set_input(value)
+        runner.time(expression(name))  # loads what the input needs
+        times = [runner.time(expression(name)) for _ in range(repeat)]
+        median = statistics.median(times)
+        results[str(size)] = {
+            "seconds": median,
+            "min_seconds": min(times),
+            "characters": characters,
+            "throughput": characters / median if characters and median else None,
+        }
+    return results
+
+
+def run(names: List[str], sizes: List[int], repeat: int) -> dict:
+    from pymathics.natlang.version import __version__
+
+    results = {}
+    runner = None
+    for name in names:
+        print(name, file=sys.stderr)
+        result = cold(name, max(sizes))
+        if runner is None:
+            runner = Runner()
+        result["warm"] = warm(runner, name, sizes, repeat)
+        results[name] = result
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "natlang": __version__,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sizes": sizes,
+        "repeat": repeat,
+        "skipped": SKIPPED,
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    Print the ratio of each time to that of the baseline to the standard
+    error, and return the measures slower than the baseline by more than
+    ``tolerance``.
+    """
+    regressions = []
+
+    def check(label: str, seconds: Optional[float], base: Optional[float]):
+        if not seconds or not base:
+            return
+        ratio = seconds / base
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  SLOWER"
+            regressions.append(label)
+        print(
+            "%-40s %10.4fs %10.4fs %6.2fx%s" % (label, base, seconds, ratio, flag),
+            file=sys.stderr,
+        )
+
+    print("%-40s %11s %11s %7s" % ("", "baseline", "current", "ratio"), file=sys.stderr)
+    for name, result in sorted(results["results"].items()):
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        check(name + " cold", result.get("cold_seconds"), base.get("cold_seconds"))
+        for size, measure in result["warm"].items():
+            base_measure = base["warm"].get(size)
+            if base_measure is not None:
+                check(
+                    "%s warm %s" % (name, size),
+                    measure["seconds"],
+                    base_measure["seconds"],
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("names", nargs="*", help="builtins to benchmark (all)")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma-separated input sizes (%(default)s)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="warm evaluations (%(default)s)"
+    )
+    parser.add_argument("--output", help="file to save the results in, as JSON")
+    parser.add_argument("--baseline", help="results to compare with")
+    parser.add_argument("--save-baseline", help="file to save the results in")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="slowdown allowed before a regression is reported (%(default)s)",
+    )
+    parser.add_argument("--cold", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    if args.cold:
+        # Only the results go to the standard output.
+        stdout, sys.stdout = sys.stdout, sys.stderr
+        try:
+            result = run_cold(args.cold, max(sizes))
+        finally:
+            sys.stdout = stdout
+        json.dump(result, stdout)
+        return
+
+    import pymathics.natlang
+
+    exported = [
+        name
+        for name in pymathics.natlang.__all__
+        if name[:1].isupper() and name not in SKIPPED
+    ]
+    missing = sorted(set(exported) - set(CASES))
+    if missing:
+        sys.exit("no benchmark for %s" % ", ".join(missing))
+    names = args.names or exported
+    unknown = sorted(set(names) - set(CASES))
+    if unknown:
+        sys.exit("unknown builtins %s" % ", ".join(unknown))
+
+    results = run(names, sizes, args.repeat)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as output:
+                json.dump(results, output, indent=2, sort_keys=True)
+    if not (args.output or args.save_baseline):
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline: Dict = json.load(baseline_file)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            sys.exit("slower than the baseline: %s" % ", ".join(regressions))
+
+
+if __name__ == "__main__":
+    main()
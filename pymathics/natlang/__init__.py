@@ -47,8 +47,9 @@ from pymathics.natlang.linguistic_data import (
     WordData,
     WordDefinition,
     WordList,
+    WordNetSimilarity,
 )
-from pymathics.natlang.manipulate import Pluralize
+from pymathics.natlang.manipulate import Pluralize, Singularize
 from pymathics.natlang.normalization import (
     DeleteStopwords,
     TextCases,
@@ -59,14 +60,22 @@ from pymathics.natlang.normalization import (
 )
 from pymathics.natlang.textual_analysis import (
     Containing,
+    SpellingCorrect,
     SpellingCorrectionList,
+    TextLemmas,
     WordCount,
     WordFrequency,
+    WordLemma,
     WordSimilarity,
     WordStem,
 )
 
 from pymathics.natlang.linguistic_data.translation import LanguageIdentify
+from pymathics.natlang.resources import (
+    NatlangPreload,
+    NatlangProfile,
+    NatlangStatistics,
+)
 from pymathics.natlang.version import __version__
 
 pymathics_version_data = {
@@ -83,11 +92,17 @@ __all__ = [
     "DictionaryLookup",
     "DictionaryWordQ",
     "LanguageIdentify",
+    "NatlangPreload",
+    "NatlangProfile",
+    "NatlangStatistics",
     "Pluralize",
     "RandomWord",
+    "Singularize",
+    "SpellingCorrect",
     "SpellingCorrectionList",
     "Synonyms",
     "TextCases",
+    "TextLemmas",
     "TextPosition",
     "TextSentences",
     "TextStructure",
@@ -96,7 +111,9 @@ __all__ = [
     "WordData",
     "WordDefinition",
     "WordFrequency",
+    "WordLemma",
     "WordList",
+    "WordNetSimilarity",
     "WordSimilarity",
     "WordStem",
     "__version__",
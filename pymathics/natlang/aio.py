@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+
+"""
+Asynchronous interface to the natlang engines
+
+The coroutines of this module do the work of the functions of
+``pymathics.natlang.api`` in an executor, so that an asyncio event loop is
+not blocked while texts are parsed, WordNet is loaded or spelling
+suggestions are computed. For instance::
+
+    from pymathics.natlang import aio
+
+    words = await aio.text_words(["Hickory, dickory, dock!"])
+
+The texts and words that concurrent requests ask for within ``batch_wait``
+seconds, with the same function and options, are processed together: one
+call in the executor, and so one ``nlp.pipe`` batch for the texts to parse.
+
+The work runs on a pool of threads, unless ``configure()`` sets another
+executor, such as a pool of processes, which run the CPU-bound work in
+parallel.
+
+Each coroutine takes the arguments of the function of the same name of
+``pymathics.natlang.api``, and returns its result.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from pymathics.natlang import api
+
+# Don't consider this for user documentation
+no_doc = True
+
+# Requests are batched for at most batch_wait seconds, or until batch_size
+# items are queued.
+batch_wait = 0.005
+batch_size = 256
+
+_executor: Optional[Executor] = None
+_own_executor = False
+_executor_lock = threading.Lock()
+
+# The coalescers of each event loop, by function and options.
+_coalescers = weakref.WeakKeyDictionary()
+
+
+def _load_languages(languages: Sequence[str]):
+    from pymathics.natlang.resources import preload
+
+    preload(list(languages), None, False)
+
+
+def _make_executor(
+    executor: Union[str, Executor], max_workers: Optional[int], languages
+) -> Tuple[Executor, bool]:
+    """
+    Return the executor described by ``executor``, and whether it is made
+    here.
+    """
+    if executor == "thread":
+        executor = ThreadPoolExecutor(
+            max_workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix="natlang-aio",
+        )
+        own = True
+    elif executor == "process":
+        executor = ProcessPoolExecutor(
+            max_workers,
+            initializer=_load_languages if languages else None,
+            initargs=(tuple(languages),),
+        )
+        own = True
+    elif isinstance(executor, Executor):
+        own = False
+    else:
+        raise ValueError("unknown executor %s" % executor)
+    return executor, own
+
+
+def configure(
+    executor: Union[str, Executor] = "thread",
+    max_workers: Optional[int] = None,
+    languages: Sequence[str] = (),
+):
+    """
+    Run the work in ``executor``: "thread" for a pool of threads, "process"
+    for a pool of processes, each loading the models of ``languages`` when
+    it starts, or an executor made by the caller.
+    """
+    global _executor, _own_executor
+    executor, own = _make_executor(executor, max_workers, languages)
+    with _executor_lock:
+        previous, previous_own = _executor, _own_executor
+        _executor, _own_executor = executor, own
+    if previous is not None and previous_own:
+        previous.shutdown(wait=False)
+
+
+def _get_executor() -> Executor:
+    global _executor, _own_executor
+    with _executor_lock:
+        if _executor is None:
+            _executor, _own_executor = _make_executor("thread", None, ())
+        return _executor
+
+
+class _Batch:
+    """
+    Items queued for one call of a function, with the futures of the
+    requests waiting for their part of the results.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.requests = []
+        self.handle = None
+
+
+class _Coalescer:
+    """
+    Queue of the requests of one event loop for ``function`` with
+    ``arguments``, which is called once for the items of all the requests
+    queued within ``batch_wait`` seconds of the first one.
+    """
+
+    def __init__(self, loop, function: Callable[..., list], arguments: tuple):
+        self._loop = loop
+        self._function = function
+        self._arguments = arguments
+        self._batch: Optional[_Batch] = None
+
+    def submit(self, items: list) -> asyncio.Future:
+        future = self._loop.create_future()
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _Batch()
+            batch.handle = self._loop.call_later(batch_wait, self._flush, batch)
+        start = len(batch.items)
+        batch.items.extend(items)
+        batch.requests.append((future, start, len(batch.items)))
+        if len(batch.items) >= batch_size:
+            batch.handle.cancel()
+            self._flush(batch)
+        return future
+
+    def _flush(self, batch: _Batch):
+        if self._batch is batch:
+            self._batch = None
+        done = self._loop.run_in_executor(
+            _get_executor(), self._function, batch.items, *self._arguments
+        )
+        done.add_done_callback(lambda result: self._resolve(batch, result))
+
+    @staticmethod
+    def _resolve(batch: _Batch, done: asyncio.Future):
+        error = None if done.cancelled() else done.exception()
+        for future, start, end in batch.requests:
+            if future.done():  # cancelled by its caller
+                continue
+            if done.cancelled():
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(done.result()[start:end])
+
+
+async def _coalesced(function: Callable[..., list], items, *arguments) -> list:
+    """
+    Return ``function(items, *arguments)``, computed in the executor
+    together with the items of the concurrent requests for ``function`` with
+    the same ``arguments``.
+    """
+    items = list(items)
+    if not items:
+        return []
+    loop = asyncio.get_running_loop()
+    coalescers = _coalescers.get(loop)
+    if coalescers is None:
+        coalescers = _coalescers[loop] = {}
+    key = (function, arguments)
+    coalescer = coalescers.get(key)
+    if coalescer is None:
+        coalescer = coalescers[key] = _Coalescer(loop, function, arguments)
+    return await coalescer.submit(items)
+
+
+async def _offloaded(function: Callable, *arguments):
+    """
+    Return ``function(*arguments)``, computed in the executor.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), function, *arguments)
+
+
+async def load(languages: Sequence[str] = ("English",)) -> List[str]:
+    """
+    Load the models, WordNet and tables of ``languages``, as
+    ``pymathics.natlang.resources.preload()`` does, and return their names.
+    A pool of processes loads them in each process as it starts instead,
+    with the ``languages`` given to ``configure()``.
+    """
+    from pymathics.natlang.resources import preload
+
+    return await _offloaded(preload, list(languages), None, False)
+
+
+async def parse(
+    texts: Sequence[str], language: str = "English", disable: Sequence[str] = ()
+) -> list:
+    return await _coalesced(api.parse, texts, language, tuple(disable))
+
+
+async def text_words(texts: Sequence[str], language: str = "English") -> list:
+    return await _coalesced(api.text_words, texts, language)
+
+
+async def text_sentences(texts: Sequence[str], language: str = "English") -> list:
+    return await _coalesced(api.text_sentences, texts, language)
+
+
+async def text_cases(
+    texts: Sequence[str], form: str, language: str = "English"
+) -> list:
+    return await _coalesced(api.text_cases, texts, form, language)
+
+
+async def text_lemmas(
+    texts: Sequence[str], language: str = "English", method: str = "Lookup"
+) -> list:
+    return await _coalesced(api.text_lemmas, texts, language, method)
+
+
+async def word_lemmas(
+    words: Sequence[str], language: str = "English", method: str = "Lookup"
+) -> list:
+    return await _coalesced(api.word_lemmas, words, language, method)
+
+
+async def word_stems(words: Sequence[str], language: str = "English") -> list:
+    return await _coalesced(api.word_stems, words, language)
+
+
+async def spelling_corrections(
+    words: Sequence[str], language: str = "English", method: str = "Enchant"
+) -> list:
+    return await _coalesced(api.spelling_corrections, words, language, method)
+
+
+async def synonyms(words: Sequence[str], language: str = "English") -> list:
+    return await _coalesced(api.synonyms, words, language)
+
+
+async def antonyms(words: Sequence[str], language: str = "English") -> list:
+    return await _coalesced(api.antonyms, words, language)
+
+
+async def dictionary_word_q(
+    words: Sequence[str], language: str = "English", include_inflections=True
+) -> list:
+    return await _coalesced(api.dictionary_word_q, words, language, include_inflections)
+
+
+async def dictionary_lookup(
+    pattern: str, language: str = "English", n: Optional[int] = None
+) -> list:
+    return await _offloaded(api.dictionary_lookup, pattern, language, n)
+
+
+async def word_list(type: str = "All", language: str = "English") -> list:
+    return await _offloaded(api.word_list, type, language)
+
+
+async def random_words(
+    n: int,
+    type: str = "All",
+    language: str = "English",
+    rng: Optional[random.Random] = None,
+) -> list:
+    # A pool of processes draws with a copy of rng, whose state is not
+    # advanced here.
+    return await _offloaded(api.random_words, n, type, language, rng)
+
+
+async def pluralize(words: Sequence[str]) -> list:
+    return await _coalesced(api.pluralize, words)
+
+
+async def singularize(words: Sequence[str]) -> list:
+    return await _coalesced(api.singularize, words)
+
+
+async def identify_languages(
+    texts: Sequence[str],
+    languages: Optional[Sequence[str]] = None,
+    method: str = "Automatic",
+) -> list:
+    return await _coalesced(
+        api.identify_languages,
+        texts,
+        None if languages is None else tuple(languages),
+        method,
+    )
+
+
+async def rank_languages(
+    texts: Sequence[str],
+    n: int,
+    languages: Optional[Sequence[str]] = None,
+    method: str = "Automatic",
+) -> list:
+    return await _coalesced(
+        api.rank_languages,
+        texts,
+        n,
+        None if languages is None else tuple(languages),
+        method,
+    )
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+
+"""
+Python interface to the natlang engines
+
+The functions of this module do the work of the natlang builtins on Python
+values, without a Mathics3 session: they take lists of ``str`` and return a
+list with the result for each item, in the same order. The items of a list
+are processed in one batch, each distinct word once, by the same models,
+tables and caches as the builtins, and by the natlang server if one is
+running. For instance::
+
+    from pymathics.natlang import api
+
+    api.text_words(["Hickory, dickory, dock!", "The mouse ran up the clock."])
+    api.synonyms(["big", "fdasfdsafdsa"])
+
+A function raises ``NatlangError`` when the work cannot be done, e.g.
+because a model is not installed or the language is not supported; and
+``ValueError`` for a method or form it does not know.
+"""
+
+import random
+import re
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from mathics.builtin.atomic.strings import anchor_pattern
+from mathics.builtin.codetables import iso639_3
+
+from pymathics.natlang.inflection import Inflections
+from pymathics.natlang.langid import (
+    classify,
+    language_code,
+    language_name,
+    rank,
+    sample_lengths,
+)
+from pymathics.natlang.linguistic_data import _matches, _related_names, _word_predicate
+from pymathics.natlang.nltk import load_inflections, load_words
+from pymathics.natlang.normalization import _words
+from pymathics.natlang.spacy import _forms, _language_codes, _pipe
+from pymathics.natlang.textual_analysis import (
+    _language_code,
+    _lemma_text,
+    _lemma_words,
+    _lemmatize,
+    _spelling_corrections,
+    _stem_function,
+    _stem_text,
+)
+from pymathics.natlang.util import NatlangError
+
+# Don't consider this for user documentation
+no_doc = True
+
+__all__ = [
+    "NatlangError",
+    "antonyms",
+    "dictionary_lookup",
+    "dictionary_word_q",
+    "identify_languages",
+    "parse",
+    "pluralize",
+    "random_words",
+    "rank_languages",
+    "singularize",
+    "spelling_corrections",
+    "synonyms",
+    "text_cases",
+    "text_lemmas",
+    "text_sentences",
+    "text_words",
+    "word_lemmas",
+    "word_list",
+    "word_stems",
+]
+
+
+def _unsupported(language: str) -> NatlangError:
+    return NatlangError('language "%s" is not supported' % language, "lang", language)
+
+
+def _code(codes: Callable[[str], Optional[str]], language: str) -> str:
+    """
+    Return the code of ``language`` given by ``codes``, or raise NatlangError
+    if it has none.
+    """
+    code = codes(language)
+    if code is None:
+        raise _unsupported(language)
+    return code
+
+
+def _distinct(words: Sequence[str], function) -> list:
+    """
+    Return ``function(word)`` for each of ``words``, called once for each
+    distinct word.
+    """
+    results = {}
+    for word in words:
+        if word not in results:
+            results[word] = function(word)
+    return [results[word] for word in words]
+
+
+# Texts
+
+
+def parse(
+    texts: Sequence[str], language: str = "English", disable: Sequence[str] = ()
+) -> list:
+    """
+    Return the spaCy docs of ``texts``, parsed in one batch by the model of
+    ``language`` without the components in ``disable``.
+    """
+    return _pipe(_code(_language_codes.get, language), list(texts), tuple(disable))
+
+
+def text_words(texts: Sequence[str], language: str = "English") -> List[List[str]]:
+    """
+    Return the words of each of ``texts``, as ``TextWords`` does.
+    """
+    return [[word.text for word in _words(doc)] for doc in parse(texts, language)]
+
+
+def text_sentences(texts: Sequence[str], language: str = "English") -> List[List[str]]:
+    """
+    Return the sentences of each of ``texts``, as ``TextSentences`` does.
+    """
+    return [[sent.text for sent in doc.sents] for doc in parse(texts, language)]
+
+
+def text_cases(
+    texts: Sequence[str], form: str, language: str = "English"
+) -> List[List[str]]:
+    """
+    Return the cases of ``form``, such as "Person" or "Noun", in each of
+    ``texts``, as ``TextCases`` does.
+    """
+    if form not in _forms:
+        raise ValueError("unknown text form %s" % form)
+    cases = _forms[form]
+    return [[item.text for item in cases(doc)] for doc in parse(texts, language)]
+
+
+def text_lemmas(
+    texts: Sequence[str], language: str = "English", method: str = "Lookup"
+) -> List[List[str]]:
+    """
+    Return the lemmas of the words of each of ``texts``, as ``TextLemmas``
+    does with ``method``, "Lookup" or "Rule".
+    """
+    code = _code(_language_code, language)
+    return [_lemma_words(lemmas) for lemmas in _lemmatize(list(texts), method, code)]
+
+
+# Words
+
+
+def word_lemmas(
+    words: Sequence[str], language: str = "English", method: str = "Lookup"
+) -> List[str]:
+    """
+    Return the lemma of each of ``words``, as ``WordLemma`` does with
+    ``method``, "Lookup" or "Rule".
+    """
+    code = _code(_language_code, language)
+    distinct = list(dict.fromkeys(words))
+    lemmas = dict(zip(distinct, map(_lemma_text, _lemmatize(distinct, method, code))))
+    return [lemmas[word] for word in words]
+
+
+def word_stems(words: Sequence[str], language: str = "English") -> List[str]:
+    """
+    Return the stem of each of ``words``, or, for a text, the text with
+    each of its words stemmed, as ``WordStem`` does.
+    """
+    code = _code(_language_code, language)
+    stem = _stem_function(code)
+    return _distinct(words, lambda word: _stem_text(word, stem, code))
+
+
+def spelling_corrections(
+    words: Sequence[str], language: str = "English", method: str = "Enchant"
+) -> List[List[str]]:
+    """
+    Return the suggestions for each of ``words``, as
+    ``SpellingCorrectionList`` does with ``method``, "Enchant" or
+    "SymSpell".
+    """
+    code = _code(iso639_3.get, language)
+    corrections = _spelling_corrections(list(words), method, code)
+    return [list(corrections(word)) for word in words]
+
+
+def _related(
+    relation: str, words: Sequence[str], language: str
+) -> List[Optional[List[str]]]:
+    related = _related_names(list(words), _code(iso639_3.get, language), relation)
+    return [
+        (
+            None
+            if related[word] is None
+            else [name.replace("_", " ") for name in related[word]]
+        )
+        for word in words
+    ]
+
+
+def synonyms(
+    words: Sequence[str], language: str = "English"
+) -> List[Optional[List[str]]]:
+    """
+    Return the synonyms of each of ``words``, or None for a word that is not
+    in the thesaurus, as ``Synonyms`` does.
+    """
+    return _related("Synonyms", words, language)
+
+
+def antonyms(
+    words: Sequence[str], language: str = "English"
+) -> List[Optional[List[str]]]:
+    """
+    Return the antonyms of each of ``words``, or None for a word that is not
+    in the thesaurus, as ``Antonyms`` does.
+    """
+    return _related("Antonyms", words, language)
+
+
+def dictionary_lookup(
+    pattern: str, language: str = "English", n: Optional[int] = None
+) -> List[str]:
+    """
+    Return the sorted words of the dictionary of ``language`` that the
+    regular expression ``pattern`` matches entirely, ignoring case, or the
+    first ``n`` of them, as ``DictionaryLookup`` does.
+    """
+    compiled = re.compile(anchor_pattern("(?:%s)" % pattern), flags=re.IGNORECASE)
+    return _matches(_code(iso639_3.get, language), compiled, n)
+
+
+def dictionary_word_q(
+    words: Sequence[str], language: str = "English", include_inflections=True
+) -> List[bool]:
+    """
+    Return whether each of ``words`` is in the dictionary of ``language``,
+    as ``DictionaryWordQ`` does.
+    """
+    word_q = _word_predicate(_code(iso639_3.get, language), include_inflections)
+    return _distinct(words, word_q)
+
+
+def word_list(type: str = "All", language: str = "English") -> List[str]:
+    """
+    Return the words of ``type``, such as "Noun", in the dictionary of
+    ``language``, as ``WordList`` does.
+    """
+    return list(load_words(_code(iso639_3.get, language), type))
+
+
+def random_words(
+    n: int,
+    type: str = "All",
+    language: str = "English",
+    rng: Optional[random.Random] = None,
+) -> List[str]:
+    """
+    Return ``n`` random words of ``type`` from the dictionary of
+    ``language``, drawn with ``rng`` if given.
+    """
+    words = load_words(_code(iso639_3.get, language), type)
+    return [word.replace("_", " ") for word in (rng or random).choices(words, k=n)]
+
+
+def _inflections() -> Inflections:
+    # Without WordNet, the rules alone inflect the words, as the builtins do.
+    try:
+        return load_inflections()
+    except NatlangError:
+        return Inflections()
+
+
+def pluralize(words: Sequence[str]) -> List[str]:
+    """
+    Return the plural form of each of the English ``words``.
+    """
+    return _distinct(words, _inflections().plural)
+
+
+def singularize(words: Sequence[str]) -> List[str]:
+    """
+    Return the singular form of each of the English ``words``.
+    """
+    return _distinct(words, _inflections().singular)
+
+
+# Languages
+
+
+def _langid_settings(languages: Optional[Sequence[str]], method: str) -> dict:
+    if method not in sample_lengths:
+        raise ValueError("unknown language identification method %s" % method)
+    codes = None
+    if languages is not None:
+        codes = [language_code(name) for name in languages]
+        if not codes or None in codes:
+            raise ValueError("unknown languages in %s" % ", ".join(languages))
+        codes = frozenset(codes)
+    return {"codes": codes, "sample_length": sample_lengths[method]}
+
+
+def identify_languages(
+    texts: Sequence[str],
+    languages: Optional[Sequence[str]] = None,
+    method: str = "Automatic",
+) -> List[Optional[str]]:
+    """
+    Return the name of the language of each of ``texts``, among
+    ``languages`` if given, as ``LanguageIdentify`` does.
+    """
+    settings = _langid_settings(languages, method)
+    return [language_name(code) for code, _ in classify(list(texts), **settings)]
+
+
+def rank_languages(
+    texts: Sequence[str],
+    n: int,
+    languages: Optional[Sequence[str]] = None,
+    method: str = "Automatic",
+) -> List[List[Tuple[Optional[str], float]]]:
+    """
+    Return the ``n`` most likely languages of each of ``texts``, with their
+    probabilities, as ``LanguageIdentify[text, n]`` does.
+    """
+    settings = _langid_settings(languages, method)
+    return [
+        [(language_name(code), probability) for code, probability in ranked]
+        for ranked in rank(list(texts), n, **settings)
+    ]
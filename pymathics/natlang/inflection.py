@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+Inflected forms of English words
+
+The forms of the WordNet lemmas are computed once using pattern's rules and
+kept on disk in a memory-mapped table; other words go through the rules.
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+from pattern.en import comparative, lexeme, pluralize, singularize, superlative
+
+from pymathics.natlang.lexicon import MappedStringTable
+from pymathics.natlang.util import cached_file
+
+# Don't consider this for user documentation
+no_doc = True
+
+# Keys in the table are prefixed by the kind of form they map to.
+_PLURAL = "n:"
+_SINGULAR = "s:"
+_VERB = "v:"
+_ADJECTIVE = "a:"
+
+_SEPARATOR = "|"
+
+
+def _entries(
+    nouns: Iterable[str], verbs: Iterable[str], adjectives: Iterable[str]
+) -> Dict[str, str]:
+    entries = {}
+    for noun in sorted(set(nouns)):
+        plural = pluralize(noun)
+        entries[_PLURAL + noun] = plural
+        if plural != noun:
+            entries.setdefault(_SINGULAR + plural, noun)
+    for verb in set(verbs):
+        entries[_VERB + verb] = _SEPARATOR.join(lexeme(verb))
+    for adjective in set(adjectives):
+        entries[_ADJECTIVE + adjective] = _SEPARATOR.join(
+            (comparative(adjective), superlative(adjective))
+        )
+    return entries
+
+
+class Inflections:
+    """
+    Lookup of plural, singular, verb and adjective forms.
+    """
+
+    def __init__(self, table=None):
+        self.table = {} if table is None else table
+
+    @classmethod
+    def load(
+        cls,
+        language_code: str,
+        nouns: List[str],
+        verbs: List[str],
+        adjectives: List[str],
+    ) -> "Inflections":
+        """
+        Open the table for these words, building and saving it first if
+        needed. If it cannot be saved, it is kept in memory.
+        """
+        digest = hashlib.sha1()
+        for words in (nouns, verbs, adjectives):
+            digest.update("\n".join(words).encode("utf-8"))
+            digest.update(b"\0")
+        name = "inflections-%s-%s.bin" % (language_code, digest.hexdigest()[:16])
+
+        def build() -> "Inflections":
+            return cls(
+                _entries(
+                    *(
+                        (word.replace("_", " ") for word in words)
+                        for words in (nouns, verbs, adjectives)
+                    )
+                )
+            )
+
+        return cached_file(
+            name,
+            lambda path: cls(MappedStringTable(path)),
+            build,
+            lambda path, inflections: MappedStringTable.write(path, inflections.table),
+        )
+
+    def _get(self, prefix: str, word: str) -> Optional[str]:
+        return self.table.get(prefix + word)
+
+    def plural(self, word: str) -> str:
+        plural = self._get(_PLURAL, word)
+        return pluralize(word) if plural is None else plural
+
+    def singular(self, word: str) -> str:
+        singular = self._get(_SINGULAR, word)
+        return singularize(word) if singular is None else singular
+
+    def verb_forms(self, word: str) -> List[str]:
+        forms = self._get(_VERB, word)
+        return lexeme(word) if forms is None else forms.split(_SEPARATOR)
+
+    def adjective_forms(self, word: str) -> List[str]:
+        forms = self._get(_ADJECTIVE, word)
+        if forms is None:
+            return [comparative(word), superlative(word)]
+        return forms.split(_SEPARATOR)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""
+Instrumentation of the natlang builtins
+
+Counts the calls of the builtins and of the engines behind them, with their
+latencies and the number of characters they process, the loads of models
+and tables, with the time they take, and the hits of the caches.
+
+Nothing is recorded until ``enable()`` is called, or if the environment
+variable MATHICS3_NATLANG_STATISTICS is set; until then, an instrumented
+function costs one test of a flag.
+"""
+
+import functools
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from typing import Callable, Dict, Optional
+
+from mathics.core.atoms import String
+from mathics.core.builtin import Builtin
+from mathics.core.list import ListExpression
+
+from pymathics.natlang.profiling import profiled
+
+# Don't consider this for user documentation
+no_doc = True
+
+# Upper bounds, in seconds, of the latency histogram buckets; the last
+# bucket has the latencies above the last bound.
+latency_bounds = (1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+_enabled = bool(os.environ.get("MATHICS3_NATLANG_STATISTICS"))
+_lock = threading.Lock()
+_timers: Dict[str, "_Timer"] = {}
+_loads: Dict[str, list] = {}
+_caches = weakref.WeakValueDictionary()
+
+
+class _Timer:
+    __slots__ = ("calls", "seconds", "characters", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.characters = 0
+        self.histogram = [0] * (len(latency_bounds) + 1)
+
+    def to_dict(self) -> dict:
+        buckets = ["<=%gs" % bound for bound in latency_bounds]
+        buckets.append(">%gs" % latency_bounds[-1])
+        return {
+            "Calls": self.calls,
+            "Seconds": self.seconds,
+            "Characters": self.characters,
+            "Latencies": dict(zip(buckets, self.histogram)),
+        }
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(flag: bool = True):
+    """
+    Start, or with ``flag`` false stop, recording statistics.
+    """
+    global _enabled
+    _enabled = bool(flag)
+
+
+def reset():
+    """
+    Forget the statistics recorded so far.
+    """
+    with _lock:
+        _timers.clear()
+        _loads.clear()
+    for cache in list(_caches.values()):
+        cache.hits = cache.misses = 0
+
+
+def record(name: str, seconds: float, characters: int = 0):
+    """
+    Record a call of ``name`` lasting ``seconds``.
+    """
+    with _lock:
+        timer = _timers.get(name)
+        if timer is None:
+            timer = _timers[name] = _Timer()
+        timer.calls += 1
+        timer.seconds += seconds
+        timer.characters += characters
+        timer.histogram[bisect_left(latency_bounds, seconds)] += 1
+
+
+def record_load(name: str, seconds: float):
+    """
+    Record a load of a model or a table by ``name``, lasting ``seconds``.
+    """
+    with _lock:
+        load = _loads.setdefault(name, [0, 0.0])
+        load[0] += 1
+        load[1] += seconds
+
+
+def register_cache(name: str, cache):
+    """
+    Report the hits and misses of ``cache``, which counts them in its
+    ``hits`` and ``misses`` attributes, under ``name``.
+    """
+    _caches[name] = cache
+
+
+def timed(name: str, size: Optional[Callable[..., int]] = None):
+    """
+    Decorator recording the calls of a function under ``name``. ``size``,
+    called with the arguments of the function, gives the number of
+    characters processed.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(
+                    name,
+                    time.perf_counter() - start,
+                    size(*args, **kwargs) if size is not None else 0,
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def _characters(arguments: dict) -> int:
+    """
+    Count the characters of the strings among ``arguments``, and in lists
+    among them.
+    """
+    count = 0
+    for value in arguments.values():
+        if isinstance(value, String):
+            count += len(value.value)
+        elif isinstance(value, ListExpression):
+            for element in value.elements:
+                if isinstance(element, String):
+                    count += len(element.value)
+    return count
+
+
+class _InstrumentedBuiltin(Builtin):
+    """
+    Builtin whose evaluations are recorded under its name, from the
+    matching of a rule to the expression returned, and profiled when
+    profiling is on.
+    """
+
+    def get_functions(self, prefix="eval", is_pymodule=False):
+        name = self.get_name(short=True)
+
+        def size(**kwargs):
+            return _characters(kwargs)
+
+        for rule, function in super().get_functions(prefix, is_pymodule):
+            if prefix == "eval":
+                function = profiled(name, size)(timed(name, size)(function))
+            yield rule, function
+
+
+def statistics() -> dict:
+    """
+    Return the statistics recorded so far: for each instrumented builtin or
+    engine, its calls, their total time, the characters processed and a
+    histogram of their latencies; for each kind of model or table, its loads
+    and their total time; and for each cache, its hits and misses.
+    """
+    with _lock:
+        timers = {name: timer.to_dict() for name, timer in sorted(_timers.items())}
+        loads = {
+            name: {"Loads": count, "Seconds": seconds}
+            for name, (count, seconds) in sorted(_loads.items())
+        }
+    caches = {}
+    for name, cache in sorted(_caches.items()):
+        lookups = cache.hits + cache.misses
+        caches[name] = {
+            "Hits": cache.hits,
+            "Misses": cache.misses,
+            "HitRate": cache.hits / lookups if lookups else 0.0,
+            "Size": len(cache),
+        }
+    return {"Calls": timers, "Loads": loads, "Caches": caches}
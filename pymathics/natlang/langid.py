@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+"""
+langid backend
+"""
+
+import copy
+import re
+from typing import FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+import langid.langid  # see https://github.com/saffsd/langid.py
+import numpy as np
+import pycountry
+
+from pymathics.natlang.instrumentation import timed
+from pymathics.natlang.util import load_once
+
+# Don't consider this for user documentation
+no_doc = True
+
+# Number of texts whose feature vectors are classified together.
+batch_size = 1024
+
+# Long texts are classified from at most max_windows windows of window_size
+# characters, read until a language is more likely than confidence_threshold.
+window_size = 2048
+max_windows = 8
+confidence_threshold = 0.999
+
+# Length above which texts are sampled with each method; "Full" reads whole
+# texts.
+sample_lengths = {
+    "Automatic": window_size * max_windows,
+    "Sample": 0,
+    "Full": None,
+}
+
+# A sentence or paragraph whose language is less likely than min_probability
+# is taken to be in the language of the text before it.
+min_probability = 0.5
+
+# Separators of the segments whose language language_spans() identifies.
+_separators = {
+    "Sentence": re.compile(r"(?<=[.!?\u3002\uff01\uff1f])\s+|\n\s*\n"),
+    "Paragraph": re.compile(r"\n\s*\n"),
+}
+
+_identifiers = {}
+_language_names = {}
+_language_codes = {}
+
+
+def _base_identifier() -> langid.langid.LanguageIdentifier:
+    # Decompressing the model takes seconds, so it is done once.
+    return load_once(
+        _identifiers,
+        None,
+        lambda: langid.langid.LanguageIdentifier.from_modelstring(
+            langid.langid.model, norm_probs=False
+        ),
+    )
+
+
+def identifier(codes: Optional[FrozenSet[str]] = None):
+    """
+    Return a langid identifier whose candidate languages are those of the
+    ISO 639-1 ``codes``, or all of them if ``codes`` is None.
+    """
+    if codes is None:
+        return _base_identifier()
+
+    def load():
+        # A restricted identifier has its own, smaller, copies of the model
+        # arrays; the tokenizer tables are shared.
+        result = copy.copy(_base_identifier())
+        result.set_languages(sorted(codes))
+        return result
+
+    return load_once(_identifiers, codes, load)
+
+
+def language_name(code: str) -> Optional[str]:
+    """
+    Return the English name of the language of the ISO 639-1 ``code``.
+    """
+    if code not in _language_names:
+        language = pycountry.languages.get(alpha_2=code)
+        _language_names[code] = None if language is None else language.name
+    return _language_names[code]
+
+
+def language_code(name: str) -> Optional[str]:
+    """
+    Return the ISO 639-1 code of the language called ``name``, if langid
+    knows that language.
+    """
+    if not _language_codes:
+        codes = {}
+        for code in _base_identifier().nb_classes:
+            code_name = language_name(code)
+            if code_name is not None:
+                codes[code_name] = code
+        # Filled at once, so that other threads never see part of it.
+        _language_codes.update(codes)
+    return _language_codes.get(name)
+
+
+def _log_probabilities(identifier, texts: Sequence[str]) -> np.ndarray:
+    features = np.array([identifier.instance2fv(text) for text in texts])
+    return features @ identifier.nb_ptc + identifier.nb_pc
+
+
+def _normalize(log_probabilities: np.ndarray) -> np.ndarray:
+    """
+    Turn each row of log-probabilities into a probability distribution.
+    """
+    probabilities = np.exp(
+        log_probabilities - log_probabilities.max(axis=-1, keepdims=True)
+    )
+    return probabilities / probabilities.sum(axis=-1, keepdims=True)
+
+
+def _window_starts(length: int) -> List[int]:
+    """
+    Return the starts of ``max_windows`` windows evenly spread over a text
+    of ``length`` characters, in the bit-reversed order of their numbers,
+    so that the first windows are already spread over the text.
+    """
+    last = length - window_size
+    order = sorted(
+        range(max_windows),
+        key=lambda i: int(format(i, "0%db" % max_windows.bit_length())[::-1], 2),
+    )
+    return [last * i // (max_windows - 1) for i in order]
+
+
+def _sampled_probabilities(identifier, text: str) -> np.ndarray:
+    """
+    Classify windows of ``text`` until the most likely language is more
+    likely than ``confidence_threshold``, or ``max_windows`` windows have
+    been read.
+
+    Feature vectors count n-grams, so the sum of those of the windows read
+    classifies their concatenation.
+    """
+    features = None
+    for n, start in enumerate(_window_starts(len(text)), 1):
+        # Start at a word, not within one.
+        space = text.find(" ", start, start + 64)
+        if space >= 0:
+            start = space + 1
+        window = identifier.instance2fv(text[start : start + window_size])
+        features = window if features is None else features + window
+        probabilities = _normalize(features @ identifier.nb_ptc + identifier.nb_pc)
+        if n > 1 and probabilities.max() >= confidence_threshold:
+            break
+    return probabilities
+
+
+def _probabilities(
+    identifier, texts: Sequence[str], sample_length: Optional[int]
+) -> Iterator[Tuple[str, np.ndarray]]:
+    """
+    Yield each distinct text of ``texts`` with the probabilities of the
+    languages of ``identifier``. Texts longer than ``sample_length``
+    characters are sampled; the feature vectors of up to ``batch_size``
+    other texts are scored together.
+    """
+    batch = []
+    for text in dict.fromkeys(texts):
+        if sample_length is not None and len(text) > max(sample_length, window_size):
+            yield text, _sampled_probabilities(identifier, text)
+            continue
+        batch.append(text)
+        if len(batch) == batch_size:
+            yield from zip(batch, _normalize(_log_probabilities(identifier, batch)))
+            batch = []
+    if batch:
+        yield from zip(batch, _normalize(_log_probabilities(identifier, batch)))
+
+
+@timed("langid classify", size=lambda texts, *args, **kwargs: sum(map(len, texts)))
+def classify(
+    texts: Sequence[str],
+    codes: Optional[FrozenSet[str]] = None,
+    sample_length: Optional[int] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Return the most likely language of each of ``texts``, as an ISO 639-1
+    code, with its probability. Each distinct text is classified once.
+    """
+    classifier = identifier(codes)
+    classes = classifier.nb_classes
+    results = {}
+    for text, probabilities in _probabilities(classifier, texts, sample_length):
+        i = probabilities.argmax()
+        results[text] = (str(classes[i]), float(probabilities[i]))
+    return [results[text] for text in texts]
+
+
+@timed("langid rank", size=lambda texts, *args, **kwargs: sum(map(len, texts)))
+def rank(
+    texts: Sequence[str],
+    count: int,
+    codes: Optional[FrozenSet[str]] = None,
+    sample_length: Optional[int] = None,
+) -> List[List[Tuple[str, float]]]:
+    """
+    Return the ``count`` most likely languages of each of ``texts``, with
+    their probabilities, from the most likely one.
+    """
+    classifier = identifier(codes)
+    classes = classifier.nb_classes
+    count = min(count, len(classes))
+    results = {}
+    for text, probabilities in _probabilities(classifier, texts, sample_length):
+        top = np.argpartition(-probabilities, count - 1)[:count]
+        top = top[np.argsort(-probabilities[top], kind="stable")]
+        results[text] = [(str(classes[i]), float(probabilities[i])) for i in top]
+    return [results[text] for text in texts]
+
+
+def _segments(text: str, unit: str) -> Iterator[Tuple[int, int]]:
+    start = 0
+    for separator in _separators[unit].finditer(text):
+        if separator.start() > start:
+            yield start, separator.start()
+        start = separator.end()
+    if start < len(text):
+        yield start, len(text)
+
+
+def language_spans(
+    text: str,
+    unit: str = "Sentence",
+    codes: Optional[FrozenSet[str]] = None,
+    sample_length: Optional[int] = None,
+) -> Iterator[Tuple[int, int, str, float]]:
+    """
+    Identify the language of each sentence or paragraph of ``text``, as
+    ``unit`` says, and yield ``(start, end, code, probability)`` for each run
+    of consecutive segments in the same language, where ``probability`` is
+    the mean of those of the segments, weighted by their lengths. Segments
+    whose language is uncertain are joined to the run before them.
+
+    Segments are classified ``batch_size`` at a time, so the first spans
+    are produced before the whole text is classified.
+    """
+    classifier = identifier(codes)
+    classes = classifier.nb_classes
+    positions = {code: i for i, code in enumerate(classes)}
+    run = None  # start, end, code, weighted probability
+
+    def flush(batch):
+        nonlocal run
+        texts = [text[start:end] for start, end in batch]
+        probabilities = dict(_probabilities(classifier, texts, sample_length))
+        for (start, end), segment in zip(batch, texts):
+            row = probabilities[segment]
+            i = row.argmax()
+            if run is not None and (run[2] == classes[i] or row[i] < min_probability):
+                # A segment too short to be told apart stays in the run.
+                weight = float(row[positions[run[2]]]) * (end - start)
+                run = (run[0], end, run[2], run[3] + weight)
+                continue
+            if run is not None:
+                yield run[0], run[1], run[2], run[3] / (run[1] - run[0])
+            run = (start, end, str(classes[i]), float(row[i]) * (end - start))
+
+    batch = []
+    for segment in _segments(text, unit):
+        batch.append(segment)
+        if len(batch) == batch_size:
+            yield from flush(batch)
+            batch = []
+    yield from flush(batch)
+    if run is not None:
+        yield run[0], run[1], run[2], run[3] / (run[1] - run[0])
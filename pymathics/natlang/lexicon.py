@@ -0,0 +1,647 @@
+# -*- coding: utf-8 -*-
+
+"""
+Word-list tables and indexes used by the WordNet-based builtins.
+"""
+
+import math
+import mmap
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence as SequenceABC
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+try:
+    from re import _casefix, _parser
+
+    _extra_cases = _casefix._EXTRA_CASES
+except ImportError:  # Python 3.10
+    import sre_compile
+    import sre_parse as _parser
+
+    _extra_cases = sre_compile._ignorecase_fixes
+
+from pymathics.natlang.util import LRUCache, write_atomically
+
+# Don't consider this for user documentation
+no_doc = True
+
+# Characters that re.IGNORECASE considers equal besides their lower-case
+# form, e.g. "s" and "ſ", are folded onto a single representative.
+_fold_table = {i: min(i, *others) for i, others in _extra_cases.items()}
+
+
+def _fold(s: str) -> str:
+    """
+    Fold ``s`` the way re.IGNORECASE compares characters, keeping one
+    character per character of ``s``.
+    """
+    folded = s.lower()
+    if len(folded) != len(s):
+        folded = "".join(c.lower()[:1] for c in s)
+    folded = folded.translate(_fold_table)
+    # Share the string when folding does not change it.
+    return s if folded == s else folded
+
+
+def _literal_runs(pattern) -> Tuple[str, List[str]]:
+    """
+    Inspect a compiled regular expression and return its literal prefix,
+    and the literal substrings any match must contain, both folded.
+    """
+    prefix = None
+    runs = []
+    run = []
+
+    def close_run():
+        if run:
+            runs.append("".join(run))
+            run.clear()
+
+    def walk(items):
+        nonlocal prefix
+        for op, av in items:
+            if op == _parser.LITERAL:
+                run.append(_fold(chr(av)))
+            elif op == _parser.AT and av in (
+                _parser.AT_BEGINNING,
+                _parser.AT_BEGINNING_STRING,
+            ):
+                continue
+            elif op == _parser.SUBPATTERN and not av[1] and not av[2]:
+                walk(av[-1])
+            else:
+                if prefix is None:
+                    prefix = "".join(run)
+                close_run()
+
+    walk(_parser.parse(pattern.pattern, pattern.flags).data)
+    if prefix is None:
+        prefix = "".join(run)
+    close_run()
+    return prefix, runs
+
+
+class WordSubset(SequenceABC):
+    """
+    Read-only view of the words of a ``WordTable`` selected by an array of
+    positions.
+    """
+
+    __slots__ = ("positions", "words")
+
+    def __init__(self, words: Tuple[str, ...], positions: array):
+        self.words = words
+        self.positions = positions
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.words[j] for j in self.positions[i]]
+        return self.words[self.positions[i]]
+
+    def __iter__(self) -> Iterator[str]:
+        words = self.words
+        return (words[j] for j in self.positions)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+class WordTable:
+    """
+    The sorted, interned words of a language, stored once. Word types such
+    as "Noun" are kept as arrays of positions into this table.
+    """
+
+    def __init__(self, words_by_type: Dict[str, Iterable[str]]):
+        lists = {ilk: list(words) for ilk, words in words_by_type.items()}
+        self.words = tuple(
+            sorted(set(sys.intern(word) for words in lists.values() for word in words))
+        )
+        position = {word: i for i, word in enumerate(self.words)}
+        self._subsets = {}
+        self._word_set = None
+        for ilk, words in lists.items():
+            positions = array("I", sorted(position[word] for word in words))
+            if len(positions) == len(self.words) and len(set(positions)) == len(
+                positions
+            ):
+                self._subsets[ilk] = self.words
+            else:
+                self._subsets[ilk] = WordSubset(self.words, positions)
+
+    def has_type(self, ilk: str) -> bool:
+        return ilk in self._subsets
+
+    def has_word(self, word: str) -> bool:
+        """
+        Check in constant time whether ``word`` is in the table.
+        """
+        if self._word_set is None:
+            self._word_set = frozenset(self.words)
+        return word in self._word_set
+
+    def subset(self, ilk: str) -> Sequence[str]:
+        """
+        Return the sorted words of type ``ilk``, including repetitions
+        when a word is listed more than once for that type.
+        """
+        return self._subsets[ilk]
+
+
+class MappedStringTable:
+    """
+    Read-only mapping from strings to strings, stored in a file sorted by
+    key and memory-mapped, so that it is shared between processes and only
+    the pages that are looked up are read.
+
+    The file holds a magic string, the number of records, the offsets of
+    the records, and then the records themselves, "key\\tvalue" in UTF-8.
+    """
+
+    magic = b"NLSTAB01"
+
+    def __init__(self, path: str):
+        with open(path, "rb") as table_file:
+            self._mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(self.magic)] != self.magic:
+            raise ValueError("%s is not a string table" % path)
+        header = len(self.magic) + 4
+        (count,) = memoryview(self._mmap)[len(self.magic) : header].cast("I")
+        self._offsets = memoryview(self._mmap)[header : header + 4 * (count + 1)].cast(
+            "I"
+        )
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key(self, i: int) -> bytes:
+        start = self._offsets[i]
+        return self._mmap[start : self._mmap.find(b"\t", start, self._offsets[i + 1])]
+
+    def get(self, key: str, default=None):
+        encoded = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key(low) == encoded:
+            start = self._offsets[low] + len(encoded) + 1
+            return self._mmap[start : self._offsets[low + 1]].decode("utf-8")
+        return default
+
+    def keys(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._key(i).decode("utf-8")
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        for i in range(self._count):
+            record = self._mmap[self._offsets[i] : self._offsets[i + 1]]
+            key, value = record.decode("utf-8").split("\t", 1)
+            yield key, value
+
+    @classmethod
+    def write(cls, path: str, items: Dict[str, str]):
+        """
+        Write ``items`` to ``path``. The file is replaced atomically, so
+        that readers never see a partial table.
+        """
+        records = sorted(
+            (key.encode("utf-8"), value.encode("utf-8")) for key, value in items.items()
+        )
+        offsets = array("I")
+        position = len(cls.magic) + 4 + 4 * (len(records) + 1)
+        for key, value in records:
+            offsets.append(position)
+            position += len(key) + 1 + len(value)
+        offsets.append(position)
+
+        def write_records(table_file: BinaryIO):
+            table_file.write(cls.magic)
+            table_file.write(array("I", [len(records)]).tobytes())
+            table_file.write(offsets.tobytes())
+            for key, value in records:
+                table_file.write(key + b"\t" + value)
+
+        write_atomically(path, write_records)
+
+
+class WordIndex:
+    """
+    Index over a sorted list of words, used to narrow down the candidates
+    that a regular expression has to be matched against.
+
+    Literal prefixes are looked up by bisection in the folded words; literal
+    infixes and suffixes through a trigram index that is built on first use.
+    """
+
+    def __init__(self, words: Sequence[str]):
+        self.words = words
+        self.keys = [_fold(word) for word in words]
+        self._prefix_order = sorted(range(len(words)), key=self.keys.__getitem__)
+        self._prefix_keys = [self.keys[i] for i in self._prefix_order]
+        self._trigrams = None
+
+    def _trigram_index(self) -> dict:
+        if self._trigrams is None:
+            trigrams = {}
+            for i, key in enumerate(self.keys):
+                for gram in set(key[j : j + 3] for j in range(len(key) - 2)):
+                    postings = trigrams.get(gram)
+                    if postings is None:
+                        trigrams[gram] = postings = array("I")
+                    postings.append(i)
+            self._trigrams = trigrams
+        return self._trigrams
+
+    def _with_prefix(self, prefix: str) -> List[int]:
+        start = bisect_left(self._prefix_keys, prefix)
+        end = bisect_left(self._prefix_keys, prefix + "\U0010ffff", start)
+        return sorted(self._prefix_order[start:end])
+
+    def _with_trigrams(self, runs: List[str]) -> Optional[List[int]]:
+        grams = set(run[j : j + 3] for run in runs for j in range(len(run) - 2))
+        if not grams:
+            return None
+        trigrams = self._trigram_index()
+        postings = sorted((trigrams.get(gram, ()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(other)
+        return sorted(candidates)
+
+    def candidates(self, pattern) -> Optional[List[int]]:
+        """
+        Return the sorted positions of the words that may match ``pattern``,
+        or None if the index cannot narrow the search.
+        """
+        try:
+            prefix, runs = _literal_runs(pattern)
+        except (_parser.error, RecursionError):
+            return None
+
+        by_prefix = self._with_prefix(prefix) if prefix else None
+        if by_prefix is not None and (len(prefix) >= 3 or len(by_prefix) < 1000):
+            return by_prefix
+        by_trigrams = self._with_trigrams(runs)
+        if by_trigrams is None or (
+            by_prefix is not None and len(by_prefix) <= len(by_trigrams)
+        ):
+            return by_prefix
+        return by_trigrams
+
+    def search(self, pattern) -> Iterator[str]:
+        """
+        Iterate in order over the words that ``pattern`` matches.
+        """
+        words = self.words
+        positions = self.candidates(pattern)
+        if positions is None:
+            candidates = words
+        else:
+            candidates = (words[i] for i in positions)
+        match = pattern.match
+        for word in candidates:
+            if match(word):
+                yield word
+
+
+# Node number of the root that is simulated above all the taxonomies of
+# a part of speech, as NLTK does for similarity measures.
+FAKE_ROOT = -1
+
+# Synsets of adjective satellites are stored with the adjectives.
+_file_pos = {"a": "a", "s": "a", "n": "n", "r": "r", "v": "v"}
+
+
+class RelationGraph:
+    """
+    Hypernym relations between synsets, stored in compressed sparse row
+    (CSR) arrays in both directions, together with the minimum and maximum
+    depth of each synset.
+
+    The similarity measures follow the definitions used by NLTK's WordNet
+    reader, including its simulated root for taxonomies that need one.
+    """
+
+    ancestors_cache_size = 4096
+
+    def __init__(self, synsets: Iterable[Tuple[str, int, Sequence[Tuple[str, int]]]]):
+        """
+        ``synsets`` yields ``(pos, offset, hypernyms)`` for each synset, in
+        the order of the WordNet data files, where ``hypernyms`` are the
+        ``(pos, offset)`` pairs of the synset's hypernyms and instance
+        hypernyms.
+        """
+        self.pos = bytearray()
+        self.offsets = array("I")
+        self._files = {}
+        pending = []
+        for pos, offset, hypernyms in synsets:
+            file_pos = _file_pos[pos]
+            first, _ = self._files.get(file_pos, (len(self.offsets), None))
+            self._files[file_pos] = (first, len(self.offsets) + 1)
+            self.pos.append(ord(pos))
+            self.offsets.append(offset)
+            pending.append(hypernyms)
+
+        self._up_start = array("I", [0])
+        self._up = array("I")
+        children = [0] * len(self.offsets)
+        for hypernyms in pending:
+            for pos, offset in hypernyms:
+                parent = self.node(pos, offset)
+                if parent is not None:
+                    self._up.append(parent)
+                    children[parent] += 1
+            self._up_start.append(len(self._up))
+        del pending
+
+        self._down_start = array("I", [0])
+        for count in children:
+            self._down_start.append(self._down_start[-1] + count)
+        self._down = array("I", bytes(4 * len(self._up)))
+        fill = array("I", self._down_start[:-1])
+        for node in range(len(self.offsets)):
+            for parent in self.parents(node):
+                self._down[fill[parent]] = node
+                fill[parent] += 1
+
+        self._compute_depths()
+        self._taxonomy_depths = {}
+        self._taxonomy_depths_lock = threading.Lock()
+        self._ancestors = LRUCache(self.ancestors_cache_size)
+
+    def _compute_depths(self):
+        size = len(self.offsets)
+        self.min_depth = array("H", bytes(2 * size))
+        self.max_depth = array("H", bytes(2 * size))
+        # Visit the synsets from the roots down, each one once all its
+        # hypernyms have been visited.
+        remaining = array("I", (len(self.parents(node)) for node in range(size)))
+        queue = [node for node in range(size) if not remaining[node]]
+        while queue:
+            node = queue.pop()
+            for child in self.children(node):
+                depth = self.min_depth[node] + 1
+                if self.min_depth[child] == 0 or depth < self.min_depth[child]:
+                    self.min_depth[child] = depth
+                depth = self.max_depth[node] + 1
+                if depth > self.max_depth[child]:
+                    self.max_depth[child] = depth
+                remaining[child] -= 1
+                if not remaining[child]:
+                    queue.append(child)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def node(self, pos: str, offset: int) -> Optional[int]:
+        """
+        Return the node of the synset of part of speech ``pos`` at ``offset``
+        in its data file, or None if there is no such synset.
+        """
+        first, last = self._files.get(_file_pos.get(pos), (0, 0))
+        i = bisect_left(self.offsets, offset, first, last)
+        if i < last and self.offsets[i] == offset:
+            return i
+        return None
+
+    def key(self, node: int) -> Tuple[str, int]:
+        """
+        Return the part of speech and the offset of the synset of ``node``.
+        """
+        return chr(self.pos[node]), self.offsets[node]
+
+    def parents(self, node: int) -> array:
+        return self._up[self._up_start[node] : self._up_start[node + 1]]
+
+    def children(self, node: int) -> array:
+        return self._down[self._down_start[node] : self._down_start[node + 1]]
+
+    def closure(
+        self, node: int, upward: bool = True, depth: Optional[int] = None
+    ) -> List[int]:
+        """
+        Return, breadth-first, the nodes reachable from ``node`` going up
+        to hypernyms, or down to hyponyms, at most ``depth`` steps away.
+        """
+        step = self.parents if upward else self.children
+        seen = {node}
+        result = []
+        level = [node]
+        distance = 0
+        while level and (depth is None or distance < depth):
+            distance += 1
+            next_level = []
+            for current in level:
+                for other in step(current):
+                    if other not in seen:
+                        seen.add(other)
+                        next_level.append(other)
+            result.extend(next_level)
+            level = next_level
+        return result
+
+    def ancestors(self, node: int) -> Dict[int, int]:
+        """
+        Return the shortest distance from ``node`` to each of its hypernyms,
+        direct or not, including ``node`` itself at distance 0.
+        """
+        if node == FAKE_ROOT:
+            return {FAKE_ROOT: 0}
+        distances = self._ancestors.get(node)
+        if distances is None:
+            distances = {node: 0}
+            level = [node]
+            distance = 0
+            while level:
+                distance += 1
+                next_level = []
+                for current in level:
+                    for parent in self.parents(current):
+                        if parent not in distances:
+                            distances[parent] = distance
+                            next_level.append(parent)
+                level = next_level
+            self._ancestors[node] = distances
+        return distances
+
+    def needs_root(self, node: int) -> bool:
+        return node != FAKE_ROOT and self.pos[node] != ord("n")
+
+    def _depth(self, depths: array, node: int) -> int:
+        return 0 if node == FAKE_ROOT else depths[node]
+
+    def _distances(self, node: int, simulate_root: bool) -> Dict[int, int]:
+        distances = self.ancestors(node)
+        if simulate_root and node != FAKE_ROOT:
+            distances = dict(distances)
+            distances[FAKE_ROOT] = max(distances.values()) + 1
+        return distances
+
+    def shortest_path_distance(
+        self, node1: int, node2: int, simulate_root: bool = False
+    ) -> Optional[int]:
+        if node1 == node2:
+            return 0
+        distances1 = self._distances(node1, simulate_root)
+        distances2 = self._distances(node2, simulate_root)
+        if len(distances2) < len(distances1):
+            distances1, distances2 = distances2, distances1
+        lengths = [d + distances2[a] for a, d in distances1.items() if a in distances2]
+        return min(lengths) if lengths else None
+
+    def taxonomy_depth(self, pos: str, simulate_root: bool) -> int:
+        key = (pos, simulate_root)
+        with self._taxonomy_depths_lock:
+            depth = self._taxonomy_depths.get(key)
+            if depth is None:
+                code = ord(pos)
+                depth = max(
+                    (d for p, d in zip(self.pos, self.max_depth) if p == code),
+                    default=0,
+                )
+                if simulate_root:
+                    depth += 1
+                self._taxonomy_depths[key] = depth
+        return depth
+
+    def path_similarity(self, node1: int, node2: int) -> Optional[float]:
+        distance = self.shortest_path_distance(
+            node1, node2, self.needs_root(node1) or self.needs_root(node2)
+        )
+        if distance is None:
+            return None
+        return 1.0 / (distance + 1)
+
+    def lch_similarity(self, node1: int, node2: int) -> Optional[float]:
+        """
+        Leacock-Chodorow similarity. Both synsets must have the same
+        part of speech.
+        """
+        if self.pos[node1] != self.pos[node2]:
+            return None
+        need_root = self.needs_root(node1)
+        depth = self.taxonomy_depth(chr(self.pos[node1]), need_root)
+        distance = self.shortest_path_distance(node1, node2, need_root)
+        if distance is None or depth == 0:
+            return None
+        return -math.log((distance + 1) / (2.0 * depth))
+
+    def wup_similarity(
+        self, node1: int, node2: int, sort_key: Callable[[int], str]
+    ) -> Optional[float]:
+        """
+        Wu-Palmer similarity. ``sort_key`` gives the name of a synset and is
+        used to choose among equally deep common hypernyms.
+        """
+        need_root = self.needs_root(node1) or self.needs_root(node2)
+        ancestors2 = self.ancestors(node2)
+        common = [a for a in self.ancestors(node1) if a in ancestors2]
+        if need_root:
+            common.append(FAKE_ROOT)
+        if not common:
+            return None
+
+        min_depth = self.min_depth
+        deepest = max(self._depth(min_depth, a) for a in common)
+        subsumers = [a for a in common if self._depth(min_depth, a) == deepest]
+        if node1 in subsumers:
+            subsumer = node1
+        else:
+            subsumer = min(subsumers, key=sort_key)
+
+        depth = self._depth(self.max_depth, subsumer) + 1
+        length1 = self.shortest_path_distance(node1, subsumer, need_root)
+        length2 = self.shortest_path_distance(node2, subsumer, need_root)
+        if length1 is None or length2 is None:
+            return None
+        return (2.0 * depth) / (length1 + length2 + 2 * depth)
+
+
+class Thesaurus:
+    """
+    Synonyms and antonyms of the lemmas of a language. Each lemma is mapped
+    to the synsets it belongs to, and each synset keeps the names of its
+    lemmas and of their antonyms, so that a lookup is a few dictionary hits.
+    """
+
+    def __init__(
+        self,
+        synsets: Iterable[Tuple[str, Sequence[str], Sequence[str]]],
+        morphy: Optional[Callable[[str, str], Iterable[str]]] = None,
+    ):
+        """
+        ``synsets`` yields ``(pos, names, antonyms)`` for each synset, where
+        ``names`` are the lemma names of the synset and ``antonyms`` the
+        names of their antonyms. ``morphy``, if given, maps a word and a part
+        of speech to the base forms under which it should be looked up.
+        """
+        self.pos = bytearray()
+        self._names = []
+        self._antonyms = {}
+        self._lemma_synsets = {}
+        self._morphy = morphy
+        for pos, names, antonyms in synsets:
+            synset = len(self._names)
+            self.pos.append(ord(_file_pos[pos]))
+            self._names.append(tuple(sys.intern(name) for name in names))
+            if antonyms:
+                self._antonyms[synset] = tuple(
+                    sys.intern(name) for name in sorted(set(antonyms))
+                )
+            for name in names:
+                synsets_of = self._lemma_synsets.setdefault(
+                    sys.intern(name.lower()), array("I")
+                )
+                if not synsets_of or synsets_of[-1] != synset:
+                    synsets_of.append(synset)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def senses(self, word: str) -> List[int]:
+        """
+        Return the synsets of ``word``, in the order in which WordNet's
+        ``synsets()`` would list them.
+        """
+        word = word.lower().replace(" ", "_")
+        if self._morphy is None:
+            return list(self._lemma_synsets.get(word, ()))
+
+        senses = []
+        seen = set()
+        for pos in "nvar":
+            code = ord(pos)
+            for form in self._morphy(word, pos):
+                for synset in self._lemma_synsets.get(form, ()):
+                    if self.pos[synset] == code and synset not in seen:
+                        seen.add(synset)
+                        senses.append(synset)
+        return senses
+
+    def synonyms(self, senses: Iterable[int]) -> Set[str]:
+        return {name for synset in senses for name in self._names[synset]}
+
+    def antonyms(self, senses: Iterable[int]) -> Set[str]:
+        return {name for synset in senses for name in self._antonyms.get(synset, ())}
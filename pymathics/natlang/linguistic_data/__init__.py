@@ -16,26 +16,31 @@ See the corresponding <url>:WMA:https://reference.wolfram.com/language/guide/Lin
 
 import re
 from itertools import islice
-from typing import Optional
+from typing import Callable, List, Optional
 
 from mathics.builtin.atomic.strings import anchor_pattern
 from mathics.builtin.numbers.randomnumbers import RandomEnv
-from mathics.core.atoms import String
+from mathics.core.atoms import Integer, Real, String
 from mathics.core.builtin import Builtin, MessageException
 from mathics.core.convert.expression import Expression, to_expression
 from mathics.core.convert.regex import to_regex
-from mathics.core.element import ElementsProperties
 from mathics.core.evaluation import Evaluation
 from mathics.core.list import ListExpression
 from mathics.core.symbols import Symbol, SymbolFalse, SymbolList, SymbolTrue
 from mathics.core.systemsymbols import SymbolMissing, SymbolRule, SymbolStringExpression
 
+from pymathics.natlang.lexicon import FAKE_ROOT, Thesaurus
 from pymathics.natlang.nltk import (
     WordProperty,
     _WordListBuiltin,
     _wordnet_pos_to_type,
     _WordNetBuiltin,
+    load_thesaurus,
+    load_word_index,
+    load_word_table,
+    load_wordnet,
 )
+from pymathics.natlang.server import request
 from pymathics.natlang.textual_analysis import WordStem
 from pymathics.natlang.util import merge_dictionaries
 
@@ -46,7 +51,127 @@ StringNotAvailable = String("NotAvailable")
 StringUnkownWord = String("UnknownWord")
 
 
-class Antonyms(_WordListBuiltin):
+def _antonyms(thesaurus: Thesaurus, word: str, senses: List[int]) -> set:
+    return thesaurus.antonyms(senses)
+
+
+def _synonyms(thesaurus: Thesaurus, word: str, senses: List[int]) -> set:
+    # Exclude the original word
+    canonic_word = word.lower().replace(" ", "_")
+    return {name for name in thesaurus.synonyms(senses) if name.lower() != canonic_word}
+
+
+# The functions giving the related names of a word from its senses.
+_relations = {
+    "Antonyms": _antonyms,
+    "Synonyms": _synonyms,
+}
+
+
+def _related_words(words: list, language_code: str, relation: str) -> dict:
+    """
+    Return the sorted names related to each of ``words`` by ``relation``, a
+    key of ``_relations``, in the thesaurus of ``language_code``, an ISO
+    639-3 code, or None for the words not in the thesaurus.
+    """
+    if relation not in _relations:
+        raise ValueError("unknown relation %s" % relation)
+    related_names = _relations[relation]
+    thesaurus = load_thesaurus(language_code)
+
+    related = {}
+    for word in words:
+        senses = thesaurus.senses(word)
+        if senses:
+            related[word] = sorted(related_names(thesaurus, word, senses))
+        else:
+            related[word] = None
+    return related
+
+
+def _related_names(words: list, language_code: str, relation: str) -> dict:
+    """
+    Return the related names of each distinct word of ``words``, as
+    ``_related_words()`` does, looked up by the natlang server if one is
+    running.
+    """
+    words = list(dict.fromkeys(words))
+    response = request(
+        "related", relation=relation, language=language_code, words=words
+    )
+    if response is None:
+        return _related_words(words, language_code, relation)
+    return dict(zip(words, response[0]["result"]))
+
+
+class _ThesaurusBuiltin(_WordListBuiltin):
+    """
+    Common code for the builtins that look words up in the thesaurus of a
+    language.
+    """
+
+    # Set checking that the number of arguments required is one.
+    eval_error = Builtin.generic_argument_error
+    expected_args = 1
+
+    # The relation looked up, a key of _relations, set by each builtin.
+    _relation: str
+
+    def _lookup(self, words: list, evaluation: Evaluation, options: dict):
+        """
+        Return the list of related words of each distinct word of ``words``.
+        """
+        language_name = self._language_name(evaluation, options)
+        related = self._wordnet_data(
+            lambda language_code: _related_names(words, language_code, self._relation),
+            language_name,
+            evaluation,
+        )
+        if related is None:
+            return
+
+        strings = self._strings(language_name)
+        return {
+            word: (
+                Expression(SymbolMissing, StringUnkownWord)
+                if names is None
+                else ListExpression(
+                    *(strings.string(name.replace("_", " ")) for name in names)
+                )
+            )
+            for word, names in related.items()
+        }
+
+    def eval(self, word, evaluation: Evaluation, options: dict):
+        "%(name)s[word_String,  OptionsPattern[%(name)s]]"
+        results = self._lookup([word.value], evaluation, options)
+        if results is None:
+            return Expression(SymbolMissing, StringNotAvailable)
+        return results[word.value]
+
+    def eval_list(self, words, evaluation: Evaluation, options: dict):
+        "%(name)s[words_List,  OptionsPattern[%(name)s]]"
+        results = self._lookup(
+            [word.value for word in words.elements if isinstance(word, String)],
+            evaluation,
+            options,
+        )
+        if results is None:
+            return Expression(SymbolMissing, StringNotAvailable)
+
+        return ListExpression(
+            *(
+                (
+                    results[word.value]
+                    if isinstance(word, String)
+                    else Expression(SymbolMissing, StringUnkownWord)
+                )
+                for word in words.elements
+            )
+        )
+
+
+class Antonyms(_ThesaurusBuiltin):
     """
     <url>:Antonyms:
     https://www.merriam-webster.com/dictionary/antonym</url>
@@ -57,6 +182,9 @@ class Antonyms(_WordListBuiltin):
     <dl>
       <dt>'Antonyms["word"]'
       <dd>returns a list of the antonyms associated with string "word".
+
+      <dt>'Antonyms[{"word1", "word2", ...}]'
+      <dd>returns the list of antonyms of each word.
     </dl>
 
     >> Antonyms["big"]
@@ -71,35 +199,28 @@ class Antonyms(_WordListBuiltin):
     >> Antonyms["fdasfdsafdsa"]
      = Missing[UnknownWord]
 
+    >> Antonyms[{"big", "fdasfdsafdsa"}]
+     = {{little, small}, Missing[UnknownWord]}
     """
 
-    # Set checking that the number of arguments required is one.
-    eval_error = Builtin.generic_argument_error
-    expected_args = 1
-
     summary_text = "list antonyms for a word"
 
-    def eval(self, word, evaluation: Evaluation, options: dict):
-        "Antonyms[word_String,  OptionsPattern[Antonyms]]"
+    _relation = "Antonyms"
 
-        wordnet, _ = self._load_wordnet(
-            evaluation, self._language_name(evaluation, options)
-        )
-        if not wordnet:
-            return Expression(SymbolMissing, StringNotAvailable)
 
-        wordnet_synsets = wordnet.synsets(word.value)
-        if len(wordnet_synsets) == 0:
-            return Expression(SymbolMissing, StringUnkownWord)
-
-        antonyms = set()
-        # Get all synsets for the word
-        for syn in wordnet_synsets:
-            for lemma in syn.lemmas():
-                for ant in lemma.antonyms():
-                    antonyms.add(ant.name().replace("_", " "))
-
-        return ListExpression(*(String(word) for word in sorted(antonyms)))
+def _matches(language_code: str, pattern, n: Optional[int]) -> list:
+    """
+    Return the sorted words of the dictionary of ``language_code``, an ISO
+    639-3 code, matching the compiled regular expression ``pattern``, or the
+    first ``n`` of them.
+    """
+    matches = (
+        word.replace("_", " ")
+        for word in load_word_index(language_code).search(pattern)
+    )
+    if n is not None:
+        matches = islice(matches, 0, n)
+    return sorted(matches)
 
 
 class DictionaryLookup(_WordListBuiltin):
@@ -138,20 +259,15 @@ class DictionaryLookup(_WordListBuiltin):
 
         return re.compile(re_patt, flags=re.IGNORECASE)
 
-    def search(self, dictionary_words, pattern):
-        for dictionary_word in dictionary_words:
-            if pattern.match(dictionary_word):
-                yield dictionary_word.replace("_", " ")
-
     def lookup(self, language_name, word, n, evaluation):
         pattern = self.compile(word, evaluation)
         if pattern:
-            dictionary_words = self._words(language_name, "All", evaluation)
-            if dictionary_words is not None:
-                matches = self.search(dictionary_words, pattern)
-                if n is not None:
-                    matches = islice(matches, 0, n)
-                return ListExpression(*(String(word) for word in sorted(matches)))
+            matches = self._wordnet_data(
+                _matches, language_name, evaluation, pattern, n
+            )
+            if matches is not None:
+                strings = self._strings(language_name)
+                return ListExpression(*(strings.string(word) for word in matches))
 
     def eval_english(self, word, evaluation):
         "DictionaryLookup[word_]"
@@ -170,7 +286,31 @@ class DictionaryLookup(_WordListBuiltin):
         return self.lookup(language, word, n.value, evaluation)
 
 
-class DictionaryWordQ(_WordNetBuiltin):
+def _word_predicate(
+    language_code: str, include_inflections: bool
+) -> Callable[[str], bool]:
+    """
+    Return a function telling whether a word is in the dictionary of
+    ``language_code``, an ISO 639-3 code.
+    """
+    wordnet = load_wordnet(language_code)
+    word_table = load_word_table(language_code)
+
+    # WordNet's morphological analysis is only available for English.
+    morphy = None
+    if language_code == "eng" and include_inflections:
+        morphy = wordnet.morphy
+
+    def word_q(word: str) -> bool:
+        word = word.lower()
+        if word_table.has_word(word):
+            return True
+        return morphy is not None and morphy(word) is not None
+
+    return word_q
+
+
+class DictionaryWordQ(_WordListBuiltin):
     """
     <url>:WMA link:
     https://reference.wolfram.com/language/ref/DictionaryWordQ.html</url>
@@ -178,6 +318,9 @@ class DictionaryWordQ(_WordNetBuiltin):
     <dl>
       <dt>'DictionaryWordQ'[$word$]
       <dd>returns True if $word$ is a word usually found in dictionaries, and False otherwise.
+
+      <dt>'DictionaryWordQ'[{$word_1$, $word_2$, ...}]
+      <dd>returns a list with the result for each $word_i$.
     </dl>
 
     >> DictionaryWordQ["couch"]
@@ -185,22 +328,57 @@ class DictionaryWordQ(_WordNetBuiltin):
 
     >> DictionaryWordQ["meep-meep"]
      = False
+
+    >> DictionaryWordQ[{"couch", "meep-meep"}]
+     = {True, False}
+
+    By default, inflected forms of English words are accepted too:
+    >> DictionaryWordQ["couches"]
+     = True
+
+    >> DictionaryWordQ["couches", IncludeInflections -> False]
+     = False
     """
 
+    options = merge_dictionaries(
+        _WordListBuiltin.options,
+        {
+            "IncludeInflections": "True",
+        },
+    )
     summary_text = "check if a word is in our word dictionary"
 
+    def _word_q(self, evaluation: Evaluation, options: dict):
+        return self._wordnet_data(
+            _word_predicate,
+            self._language_name(evaluation, options),
+            evaluation,
+            self.get_option(options, "IncludeInflections", evaluation) is SymbolTrue,
+        )
+
     def eval(self, word, evaluation: Evaluation, options: dict):
         "DictionaryWordQ[word_String,  OptionsPattern[DictionaryWordQ]]"
-        if not isinstance(word, String):
-            return False
-        wordnet, language_code = self._load_wordnet(
-            evaluation, self._language_name(evaluation, options)
-        )
-        if wordnet:
-            if list(wordnet.synsets(word.value.lower(), None, language_code)):
-                return SymbolTrue
-            else:
+        word_q = self._word_q(evaluation, options)
+        if word_q is not None:
+            return SymbolTrue if word_q(word.value) else SymbolFalse
+
+    def eval_list(self, words, evaluation: Evaluation, options: dict):
+        "DictionaryWordQ[words_List,  OptionsPattern[DictionaryWordQ]]"
+        word_q = self._word_q(evaluation, options)
+        if word_q is None:
+            return
+
+        known = {}
+
+        def result(word):
+            if not isinstance(word, String):
                 return SymbolFalse
+            found = known.get(word.value)
+            if found is None:
+                found = known[word.value] = word_q(word.value)
+            return SymbolTrue if found else SymbolFalse
+
+        return ListExpression(*(result(word) for word in words.elements))
 
 
 class RandomWord(_WordListBuiltin):
@@ -229,11 +407,15 @@ class RandomWord(_WordListBuiltin):
     summary_text = "generate a random word"
 
     def _random_words(self, type, n, evaluation: Evaluation, options: dict):
-        words = self._words(self._language_name(evaluation, options), type, evaluation)
+        language_name = self._language_name(evaluation, options)
+        words = self._words(language_name, type, evaluation)
         if words is not None:
+            strings = self._strings(language_name)
             with RandomEnv(evaluation) as rand:
                 return [
-                    String(words[rand.randint(0, len(words) - 1)].replace("_", " "))
+                    strings.string(
+                        words[rand.randint(0, len(words) - 1)].replace("_", " ")
+                    )
                     for _ in range(n)
                 ]
 
@@ -256,7 +438,7 @@ class RandomWord(_WordListBuiltin):
             return ListExpression(*words)
 
 
-class Synonyms(_WordListBuiltin):
+class Synonyms(_ThesaurusBuiltin):
     """
     <url>:Synonyms:
     https://www.merriam-webster.com/dictionary/synonym</url>
@@ -266,7 +448,10 @@ class Synonyms(_WordListBuiltin):
 
     <dl>
       <dt>'Synonyms["word"]'
-      <dd>returns a list of the antonyms associated with string "word".
+      <dd>returns a list of the synonyms associated with string "word".
+
+      <dt>'Synonyms[{"word1", "word2", ...}]'
+      <dd>returns the list of synonyms of each word.
     </dl>
 
     >> Synonyms["forget"]
@@ -278,38 +463,14 @@ class Synonyms(_WordListBuiltin):
     >> Synonyms["fdasfdsafdsa"]
      = Missing[UnknownWord]
 
+    The synonyms are looked up in the WordNet of the given language:
+    >> Synonyms["perro", Language -> "Spanish"]
+     = ...
     """
 
-    # Set checking that the number of arguments required is one.
-    eval_error = Builtin.generic_argument_error
-    expected_args = 1
-
     summary_text = "list synonyms for a word"
 
-    def eval(self, word, evaluation: Evaluation, options: dict):
-        "Synonyms[word_String,  OptionsPattern[Antonyms]]"
-
-        wordnet, _ = self._load_wordnet(
-            evaluation, self._language_name(evaluation, options)
-        )
-        if not wordnet:
-            return Expression(SymbolMissing, StringNotAvailable)
-
-        wordnet_synsets = wordnet.synsets(word.value)
-        if len(wordnet_synsets) == 0:
-            return Expression(SymbolMissing, StringUnkownWord)
-
-        canonic_word = word.value.lower()
-
-        synonyms = set()
-        # Get all synsets for the word
-        for syn in wordnet_synsets:
-            for lemma in syn.lemmas():
-                # Exclude the original word
-                if lemma.name().lower() != canonic_word:
-                    synonyms.add(lemma.name().replace("_", " "))
-
-        return ListExpression(*(String(word) for word in sorted(synonyms)))
+    _relation = "Synonyms"
 
 
 class WordData(_WordListBuiltin):
@@ -324,6 +485,9 @@ class WordData(_WordListBuiltin):
 
       <dt>'WordData'[$word$, $property$]
       <dd>returns detailed information about a word regarding $property$, e.g. "Definitions" or "Examples".
+
+      <dt>'WordData'[{$word_1$, $word_2$, ...}, {$property_1$, $property_2$, ...}]
+      <dd>returns, for each $word_i$, the list of its values for each $property_j$.
     </dl>
 
     The following are valid properties:
@@ -332,6 +496,7 @@ class WordData(_WordListBuiltin):
       <li> InflectedForms
       <li> Synonyms, Antonyms
       <li> BroaderTerms, NarrowerTerms
+      <li> AllBroaderTerms, AllNarrowerTerms
       <li> WholeTerms, PartTerms, MaterialTerms
       <li> EntailedTerms, CausesTerms
       <li> UsageField
@@ -339,63 +504,143 @@ class WordData(_WordListBuiltin):
       <li> Lookup
     </ul>
 
+    A list of three strings whose second element is a part of speech, like \
+    {"fish", "Verb", "Angle"}, is a word sense rather than a list of words.
+
+    The senses of each word are looked up only once, however many properties are requested.
+
+    "AllBroaderTerms" and "AllNarrowerTerms" follow the hypernym relations transitively, \
+    up to the number of steps given by the option 'RelationDepth'.
+
     >> WordData["riverside", "Definitions"]
      = {{riverside, Noun, Bank} -> the bank of a river}
 
     >> WordData[{"fish", "Verb", "Angle"}, "Examples"]
      = {{fish, Verb, Angle} -> {fish for compliments}}
+
+    >> WordData[{"riverside", "gram"}, {"PartsOfSpeech", "PorterStem"}]
+     = {{{Noun}, riversid}, {{Noun}, gram}}
+
+    >> WordData["riverside", "AllBroaderTerms", RelationDepth -> 1] == WordData["riverside", "BroaderTerms"]
+     = True
     """
 
     messages = merge_dictionaries(
         _WordNetBuiltin.messages,
         {
             "notprop": "WordData[] does not recognize `1` as a valid property.",
+            "rdepth": "Value of option RelationDepth -> `1` should be a positive integer or Infinity.",
+        },
+    )
+    options = merge_dictionaries(
+        _WordListBuiltin.options,
+        {
+            "RelationDepth": "Infinity",
         },
     )
     summary_text = "retrieve an association with properties of a word"
 
-    def _parse_word(self, word):
-        if isinstance(word, String):
-            return word.value.lower()
-        elif word.get_head_name() == "System`List":
-            if len(word.elements) == 3 and all(
-                isinstance(s, String) for s in word.elements
-            ):
-                return tuple(s.value for s in word.elements)
-
-    def _standard_property(
-        self, py_word, py_form, py_property, wordnet, language_code, evaluation
-    ):
-        senses = self._senses(py_word, wordnet, language_code)
-        if not senses:
-            return Expression(SymbolMissing, StringNotAvailable)
-        elif py_form == "List":
-            word_property = WordProperty(self._short_syn_form, wordnet, language_code)
-            property_getter = getattr(
-                word_property, "%s" % self._underscore(py_property), None
-            )
-            if property_getter:
-                return ListExpression(
-                    *[property_getter(syn, desc) for syn, desc in senses]
-                )
-        elif py_form in ("Rules", "ShortRules"):
+    _word_types = ("Adjective", "Adverb", "Noun", "Verb")
+
+    def _is_word_list(self, word) -> bool:
+        if word.get_head() is not SymbolList:
+            return False
+        elements = word.elements
+        return not (
+            len(elements) == 3
+            and all(isinstance(s, String) for s in elements)
+            and elements[1].value in self._word_types
+        )
+
+    def _relation_depth(self, evaluation: Evaluation, options: dict):
+        depth = self.get_option(options, "RelationDepth", evaluation)
+        if isinstance(depth, Integer) and depth.value > 0:
+            return depth.value
+        if depth.has_form("DirectedInfinity", 1):
+            return None
+        evaluation.message(self.get_name(), "rdepth", depth)
+        return False
+
+    def _property_getters(
+        self, py_properties, py_form, wordnet, language_code, evaluation, options
+    ) -> Optional[list]:
+        """
+        Return, for each property, the function that computes it from a sense,
+        or the name of the property when it is not computed sense by sense.
+        """
+        word_property = None
+        if py_form in ("List", "Rules", "ShortRules"):
+            relation_depth = self._relation_depth(evaluation, options)
+            if relation_depth is False:
+                return None
             syn_form = (lambda s: s) if py_form == "Rules" else (lambda s: s[0])
-            word_property = WordProperty(syn_form, wordnet, language_code)
-            property_getter = getattr(
-                word_property, self._underscore(py_property), None
+            word_property = WordProperty(
+                syn_form,
+                wordnet,
+                language_code,
+                lambda: self._relation_graph(wordnet),
+                relation_depth,
+                self._inflections,
             )
-            if property_getter:
-                list_expr_elements = [
-                    to_expression(SymbolRule, desc, property_getter(syn, desc))
-                    for syn, desc in senses
-                ]
-                return ListExpression(*list_expr_elements)
-        evaluation.message(self.get_name(), "notprop", property)
 
-    def _parts_of_speech(self, py_word, wordnet, language_code):
-        parts = set(
-            syn.pos() for syn, _ in self._senses(py_word, wordnet, language_code)
-        )
+        getters = []
+        for py_property in py_properties:
+            if py_property in ("PartsOfSpeech", "PorterStem"):
+                getters.append(py_property)
+                continue
+            property_getter = None
+            if word_property is not None:
+                property_getter = getattr(
+                    word_property, self._underscore(py_property), None
+                )
+            if property_getter is None:
+                evaluation.message(self.get_name(), "notprop", String(py_property))
+                return None
+            getters.append(property_getter)
+        return getters
+
+    def _property_values(
+        self, word, py_word, getters, py_form, wordnet, language_code
+    ) -> list:
+        """
+        Compute the properties of a word, resolving its senses only once.
+        """
+        senses = None
+        values = []
+        for property_getter in getters:
+            if property_getter == "PorterStem":
+                if isinstance(word, String):
+                    values.append(String(WordStem.porter(word.value)))
+                else:
+                    values.append(Expression(SymbolMissing, StringNotAvailable))
+                continue
+
+            if senses is None:
+                senses = self._senses(py_word, wordnet, language_code) or []
+            if property_getter == "PartsOfSpeech":
+                values.append(self._parts_of_speech(senses))
+            elif not senses:
+                values.append(Expression(SymbolMissing, StringNotAvailable))
+            elif py_form == "List":
+                values.append(
+                    to_expression(
+                        SymbolList,
+                        *[property_getter(syn, desc) for syn, desc in senses],
+                    )
+                )
+            else:
+                values.append(
+                    ListExpression(
+                        *[
+                            to_expression(SymbolRule, desc, property_getter(syn, desc))
+                            for syn, desc in senses
+                        ]
+                    )
+                )
+        return values
+
+    def _parts_of_speech(self, senses):
+        parts = set(syn.pos() for syn, _ in senses)
         if not parts:
             return Expression(SymbolMissing, StringNotAvailable)
         else:
@@ -422,16 +667,79 @@ class WordData(_WordListBuiltin):
         if not py_word:
             return
 
-        if py_property == "PartsOfSpeech":
-            return self._parts_of_speech(py_word, wordnet, language_code)
+        getters = self._property_getters(
+            [py_property], py_form, wordnet, language_code, evaluation, options
+        )
+        if getters is None:
+            return
 
         try:
-            return self._standard_property(
-                py_word, py_form, py_property, wordnet, language_code, evaluation
-            )
+            return self._property_values(
+                word, py_word, getters, py_form, wordnet, language_code
+            )[0]
         except MessageException as e:
             e.message(evaluation)
 
+    def _properties(
+        self, words, properties, py_form, evaluation: Evaluation, options: dict
+    ) -> Optional[Expression]:
+        if isinstance(properties, String):
+            py_properties = [properties.value]
+        elif properties.get_head() is SymbolList and all(
+            isinstance(p, String) for p in properties.elements
+        ):
+            py_properties = [p.value for p in properties.elements]
+        else:
+            return
+
+        batch = self._is_word_list(words)
+        if batch:
+            word_list = words.elements
+        elif isinstance(words, String) or words.get_head() is SymbolList:
+            if isinstance(properties, String):
+                return self._property(
+                    words, properties.value, py_form, evaluation, options
+                )
+            word_list = [words]
+        else:
+            return
+
+        wordnet, language_code = self._load_wordnet(
+            evaluation, self._language_name(evaluation, options)
+        )
+        if not wordnet:
+            return
+
+        py_words = [self._parse_word(word) for word in word_list]
+        if not all(py_words):
+            return
+
+        getters = self._property_getters(
+            py_properties, py_form, wordnet, language_code, evaluation, options
+        )
+        if getters is None:
+            return
+
+        # Repeated words are looked up once.
+        rows = {}
+        try:
+            for word, py_word in zip(word_list, py_words):
+                if py_word not in rows:
+                    values = self._property_values(
+                        word, py_word, getters, py_form, wordnet, language_code
+                    )
+                    if isinstance(properties, String):
+                        rows[py_word] = values[0]
+                    else:
+                        rows[py_word] = ListExpression(*values)
+        except MessageException as e:
+            e.message(evaluation)
+            return
+
+        if batch:
+            return ListExpression(*[rows[py_word] for py_word in py_words])
+        return rows[py_words[0]]
+
     def eval(self, word, evaluation: Evaluation, options: dict) -> Optional[Expression]:
         "WordData[word_, OptionsPattern[WordData]]"
         if word.get_head() is SymbolStringExpression:
@@ -457,26 +765,21 @@ class WordData(_WordListBuiltin):
 
     def eval_property(self, word, property, evaluation: Evaluation, options: dict):
         "WordData[word_, property_String, OptionsPattern[WordData]]"
-        if word.get_head is SymbolStringExpression:
+        if word.get_head() is SymbolStringExpression:
             if property.get_string_value() == "Lookup":
                 return Expression(SymbolDictionaryLookup, word)
-        elif isinstance(word, String) or word.get_head() is SymbolList:
-            return self._property(
-                word, property.get_string_value(), "ShortRules", evaluation, options
-            )
+        else:
+            return self._properties(word, property, "ShortRules", evaluation, options)
+
+    def eval_properties(self, word, properties, evaluation: Evaluation, options: dict):
+        "WordData[word_, properties_List, OptionsPattern[WordData]]"
+        return self._properties(word, properties, "ShortRules", evaluation, options)
 
     def eval_property_form(
         self, word, property, form, evaluation: Evaluation, options: dict
     ):
-        "WordData[word_, property_String, form_String, OptionsPattern[WordData]]"
-        if isinstance(word, String) or word.get_head() is SymbolList:
-            return self._property(
-                word,
-                property.value,
-                form.value,
-                evaluation,
-                options,
-            )
+        "WordData[word_, property:(_String|_List), form_String, OptionsPattern[WordData]]"
+        return self._properties(word, property, form.value, evaluation, options)
 
 
 class WordDefinition(_WordNetBuiltin):
@@ -533,24 +836,134 @@ class WordList(_WordListBuiltin):
 
     def eval(self, evaluation: Evaluation, options: dict):
         "WordList[OptionsPattern[]]"
-        words = self._words(self._language_name(evaluation, options), "All", evaluation)
-        if words is not None:
-            words_mathics = (String(word) for word in words)
-            result = ListExpression(
-                *words_mathics,
-                elements_properties=ElementsProperties(False, False, True),
-            )
-            return result
+        return self._word_list(
+            self._language_name(evaluation, options), "All", evaluation
+        )
 
     def eval_type(self, wordtype, evaluation: Evaluation, options: dict):
         "WordList[wordtype_String, OptionsPattern[]]"
-        words = self._words(
-            self._language_name(evaluation, options),
-            wordtype.value,
-            evaluation,
+        return self._word_list(
+            self._language_name(evaluation, options), wordtype.value, evaluation
         )
-        if words is not None:
-            return ListExpression(
-                *(String(word) for word in words),
-                elements_properties=ElementsProperties(False, False, True),
-            )
+
+
+class WordNetSimilarity(_WordNetBuiltin):
+    """
+    <url>:WordNet similarity measures:
+    https://www.nltk.org/howto/wordnet.html</url>
+
+    <dl>
+      <dt>'WordNetSimilarity'[$word_1$, $word_2$]
+      <dd>returns the similarity between the closest senses of $word_1$ and $word_2$ \
+          in the WordNet hypernym taxonomy.
+
+      <dt>'WordNetSimilarity'[{{$word_1$, $word_2$}, {$word_3$, $word_4$}, ...}]
+      <dd>returns the similarity of each pair of words.
+    </dl>
+
+    The option 'Method' selects the measure: "Path" (the default), "WuPalmer" or \
+    "LeacockChodorow". A word can also be given as a sense like {"fish", "Verb", "Angle"}.
+
+    >> WordNetSimilarity["dog", "dog"]
+     = 1.
+
+    >> WordNetSimilarity[{{"dog", "cat"}, {"dog", "car"}}, Method -> "WuPalmer"]
+     = {..., ...}
+    """
+
+    messages = merge_dictionaries(
+        _WordNetBuiltin.messages,
+        {
+            "method": 'Method `1` should be "Path", "WuPalmer" or "LeacockChodorow".',
+        },
+    )
+    options = merge_dictionaries(
+        _WordNetBuiltin.options,
+        {
+            "Method": '"Path"',
+        },
+    )
+    summary_text = "measure the similarity of words in the WordNet taxonomy"
+
+    def _similarity(self, evaluation: Evaluation, options: dict):
+        wordnet, language_code = self._load_wordnet(
+            evaluation, self._language_name(evaluation, options)
+        )
+        if not wordnet:
+            return
+
+        method = self.get_option(options, "Method", evaluation)
+        py_method = method.get_string_value()
+        if py_method not in ("Path", "WuPalmer", "LeacockChodorow"):
+            evaluation.message(self.get_name(), "method", method)
+            return
+
+        graph = self._relation_graph(wordnet)
+        if py_method == "Path":
+            measure = graph.path_similarity
+        elif py_method == "LeacockChodorow":
+            measure = graph.lch_similarity
+        else:
+
+            def synset_name(node):
+                if node == FAKE_ROOT:
+                    return "*ROOT*"
+                pos, offset = graph.key(node)
+                return wordnet.synset_from_pos_and_offset(pos, offset).name()
+
+            def measure(node1, node2):
+                return graph.wup_similarity(node1, node2, synset_name)
+
+        # Senses are resolved once per word for a whole batch.
+        word_nodes = {}
+
+        def nodes(py_word):
+            result = word_nodes.get(py_word)
+            if result is None:
+                senses = self._senses(py_word, wordnet, language_code) or []
+                result = [graph.node(syn.pos(), syn.offset()) for syn, _ in senses]
+                result = word_nodes[py_word] = [n for n in result if n is not None]
+            return result
+
+        def similarity(py_word1, py_word2):
+            values = [
+                measure(node1, node2)
+                for node1 in nodes(py_word1)
+                for node2 in nodes(py_word2)
+            ]
+            values = [value for value in values if value is not None]
+            if not values:
+                return Expression(SymbolMissing, StringNotAvailable)
+            return Real(max(values))
+
+        return similarity
+
+    def eval(self, word1, word2, evaluation: Evaluation, options: dict):
+        "WordNetSimilarity[word1:(_String|_List), word2:(_String|_List), OptionsPattern[WordNetSimilarity]]"
+        py_word1 = self._parse_word(word1)
+        py_word2 = self._parse_word(word2)
+        if not (py_word1 and py_word2):
+            return
+
+        similarity = self._similarity(evaluation, options)
+        if similarity is not None:
+            return similarity(py_word1, py_word2)
+
+    def eval_pairs(self, pairs, evaluation: Evaluation, options: dict):
+        "WordNetSimilarity[pairs_List, OptionsPattern[WordNetSimilarity]]"
+        py_pairs = []
+        for pair in pairs.elements:
+            if not pair.has_form("List", 2):
+                return
+            py_pair = tuple(self._parse_word(word) for word in pair.elements)
+            if not all(py_pair):
+                return
+            py_pairs.append(py_pair)
+
+        similarity = self._similarity(evaluation, options)
+        if similarity is not None:
+            results = {}
+            for py_pair in py_pairs:
+                if py_pair not in results:
+                    results[py_pair] = similarity(*py_pair)
+            return ListExpression(*(results[py_pair] for py_pair in py_pairs))
@@ -13,20 +13,29 @@ Language Translation
 #
 # TODO: WordTranslation, TextTranslation
 
-from typing import Union
+from typing import Optional, Union
 
-import langid  # see https://github.com/saffsd/langid.py
-import pycountry
-from mathics.core.atoms import String
-from mathics.core.builtin import Builtin
+from mathics.core.atoms import Integer, Real, String
 from mathics.core.evaluation import Evaluation
+from mathics.core.expression import Expression
+from mathics.core.list import ListExpression
 from mathics.core.symbols import Symbol
-from mathics.core.systemsymbols import SymbolFailed
+from mathics.core.systemsymbols import SymbolAutomatic, SymbolFailed, SymbolRule
+
+from pymathics.natlang.instrumentation import _InstrumentedBuiltin
+from pymathics.natlang.langid import (
+    classify,
+    language_code,
+    language_name,
+    language_spans,
+    rank,
+    sample_lengths,
+)
 
 sort_order = "Language Translation"
 
 
-class LanguageIdentify(Builtin):
+class LanguageIdentify(_InstrumentedBuiltin):
     """
     <url>:WMA link:
     https://reference.wolfram.com/language/ref/LanguageIdentify.html</url>
@@ -34,21 +43,178 @@ class LanguageIdentify(Builtin):
     <dl>
       <dt>'LanguageIdentify'[$text$]
       <dd>returns the name of the language used in $text$.
+
+      <dt>'LanguageIdentify'[{$text_1$, $text_2$, ...}]
+      <dd>returns the name of the language used in each $text_i$.
+
+      <dt>'LanguageIdentify'[$text$, $n$]
+      <dd>returns the $n$ most likely languages of $text$, with their \
+          probabilities.
+
+      <dt>'LanguageIdentify'[$text$, "Sentence"]
+      <dd>splits $text$ into runs of sentences in the same language, and \
+          returns the position of each run with its language and probability.
+
+      <dt>'LanguageIdentify'[$text$, "Paragraph"]
+      <dd>does the same with paragraphs.
     </dl>
 
+    The option 'Languages' restricts the candidates to a list of languages, \
+    which is faster and avoids confusing a language with a close one.
+
+    With 'Method -> Automatic', the default, texts longer than 16384 \
+    characters are sampled: windows spread over the text are read \
+    until one language is clearly the most likely. 'Method -> "Sample"' \
+    samples any text longer than a window, and 'Method -> "Full"' reads \
+    whole texts.
+
     >> LanguageIdentify["eins zwei drei"]
      = German
+
+    >> LanguageIdentify[{"eins zwei drei", "one two three"}]
+     = {German, English}
+
+    >> LanguageIdentify["ciao a tutti", Languages -> {"English", "Italian"}]
+     = Italian
+
+    >> Keys[LanguageIdentify["eins zwei drei", 3]]
+     = {German, Luxembourgish, Dutch}
+
+    >> LanguageIdentify["The weather is nice today. Das Wetter ist heute schön.", "Sentence"][[All, ;;2]]
+     = {{{1, 26}, English}, {{28, 54}, German}}
     """
 
+    options = {
+        "Languages": "Automatic",
+        "Method": "Automatic",
+    }
+
+    messages = {
+        "langs": "Languages `1` should be Automatic or a list of the names of languages langid knows.",
+        "method": 'Method `1` should be Automatic, "Full" or "Sample".',
+        "unit": 'The text should be split into a "Sentence" or a "Paragraph" instead of `1`.',
+    }
+
+    requires = ("langid", "pycountry")
     summary_text = "determine the predominant human language in a string"
 
-    def eval(self, text: String, evaluation: Evaluation) -> Union[Symbol, String]:
-        "LanguageIdentify[text_String]"
+    def _settings(self, evaluation: Evaluation, options: dict) -> Optional[dict]:
+        """
+        Return the candidate languages, as ISO 639-1 codes or None for all
+        of them, and the length above which texts are sampled, or None if
+        an option is not valid.
+        """
+        languages = self.get_option(options, "Languages", evaluation)
+        if languages is SymbolAutomatic:
+            codes = None
+        else:
+            codes = []
+            if isinstance(languages, ListExpression):
+                codes = [
+                    language_code(name.value) if isinstance(name, String) else None
+                    for name in languages.elements
+                ]
+            if not codes or None in codes:
+                evaluation.message(self.get_name(), "langs", languages)
+                return None
+            codes = frozenset(codes)
+
+        method = self.get_option(options, "Method", evaluation)
+        py_method = (
+            "Automatic" if method is SymbolAutomatic else method.get_string_value()
+        )
+        if py_method not in sample_lengths:
+            evaluation.message(self.get_name(), "method", method)
+            return None
+        return {"codes": codes, "sample_length": sample_lengths[py_method]}
+
+    @staticmethod
+    def _language(code: str) -> Union[Symbol, String]:
+        name = language_name(code)
+        if name is None:
+            return SymbolFailed
+        return String(name)
+
+    def _ranking(self, ranked: list) -> ListExpression:
+        return ListExpression(
+            *[
+                Expression(SymbolRule, self._language(code), Real(probability))
+                for code, probability in ranked
+            ]
+        )
+
+    def eval(
+        self, text: String, evaluation: Evaluation, options: dict
+    ) -> Optional[Union[Symbol, String]]:
+        "LanguageIdentify[text_String, OptionsPattern[LanguageIdentify]]"
 
         # an alternative: https://github.com/Mimino666/langdetect
 
-        code, _ = langid.classify(text.value)
-        language = pycountry.languages.get(alpha_2=code)
-        if language is None:
-            return SymbolFailed
-        return String(language.name)
+        settings = self._settings(evaluation, options)
+        if settings is None:
+            return
+        ((code, _),) = classify([text.value], **settings)
+        return self._language(code)
+
+    def eval_list(
+        self, texts, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        "LanguageIdentify[texts_List, OptionsPattern[LanguageIdentify]]"
+        if not all(isinstance(text, String) for text in texts.elements):
+            return
+        settings = self._settings(evaluation, options)
+        if settings is None:
+            return
+        return ListExpression(
+            *[
+                self._language(code)
+                for code, _ in classify(
+                    [text.value for text in texts.elements], **settings
+                )
+            ]
+        )
+
+    def eval_n(
+        self, text: String, n: Integer, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        "LanguageIdentify[text_String, n_Integer, OptionsPattern[LanguageIdentify]]"
+        settings = self._settings(evaluation, options)
+        if settings is None or n.value < 1:
+            return
+        (ranked,) = rank([text.value], n.value, **settings)
+        return self._ranking(ranked)
+
+    def eval_list_n(
+        self, texts, n: Integer, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        "LanguageIdentify[texts_List, n_Integer, OptionsPattern[LanguageIdentify]]"
+        if not all(isinstance(text, String) for text in texts.elements):
+            return
+        settings = self._settings(evaluation, options)
+        if settings is None or n.value < 1:
+            return
+        ranked = rank([text.value for text in texts.elements], n.value, **settings)
+        return ListExpression(*[self._ranking(item) for item in ranked])
+
+    def eval_spans(
+        self, text: String, unit: String, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        "LanguageIdentify[text_String, unit_String, OptionsPattern[LanguageIdentify]]"
+        if unit.value not in ("Sentence", "Paragraph"):
+            evaluation.message(self.get_name(), "unit", unit)
+            return
+        settings = self._settings(evaluation, options)
+        if settings is None:
+            return
+        return ListExpression(
+            *[
+                ListExpression(
+                    ListExpression(Integer(start + 1), Integer(end)),
+                    self._language(code),
+                    Real(probability),
+                )
+                for start, end, code, probability in language_spans(
+                    text.value, unit.value, **settings
+                )
+            ]
+        )
@@ -6,15 +6,49 @@ This module uses pattern.en to change the form of a word.
 
 """
 
+from typing import Callable, Optional
+
 from mathics.core.atoms import String
-from mathics.core.builtin import Builtin
 from mathics.core.evaluation import Evaluation
-from pattern.en import pluralize
+from mathics.core.list import ListExpression
+
+from pymathics.natlang.inflection import Inflections
+from pymathics.natlang.nltk import _WordListBuiltin
 
 sort_order = "Word manipulation"
 
 
-class Pluralize(Builtin):
+class _InflectionBuiltin(_WordListBuiltin):
+    """
+    Base class for builtins that look up inflected forms of English words
+    in the table built from the WordNet lemmas.
+    """
+
+    # The inflection table is for English only.
+    options = {}
+    requires = ("nltk", "pattern")
+
+    # The method of Inflections giving the form of a word, set by each
+    # builtin.
+    _inflect: Callable[[Inflections, str], str]
+
+    def eval(self, word: String, evaluation: Evaluation) -> String:
+        "%(name)s[word_String]"
+        return String(self._inflect(self._inflections(), word.value))
+
+    def eval_list(self, words, evaluation: Evaluation) -> Optional[ListExpression]:
+        "%(name)s[words_List]"
+        if not all(isinstance(w, String) for w in words.elements):
+            return
+        inflections = self._inflections()
+        forms = {}
+        for w in words.elements:
+            if w.value not in forms:
+                forms[w.value] = String(self._inflect(inflections, w.value))
+        return ListExpression(*(forms[w.value] for w in words.elements))
+
+
+class Pluralize(_InflectionBuiltin):
     """
     <url>:WMA link:
     https://reference.wolfram.com/language/ref/Pluralize.html</url>
@@ -22,16 +56,43 @@ class Pluralize(Builtin):
     <dl>
       <dt>'Pluralize'[$word$]
       <dd>returns the plural form of $word$.
+
+      <dt>'Pluralize'[{$word_1$, $word_2$, ...}]
+      <dd>returns the plural form of each $word_i$.
     </dl>
 
     >> Pluralize["potato"]
      = potatoes
+
+    >> Pluralize[{"try", "potato", "try"}]
+     = {tries, potatoes, tries}
     """
 
-    requires = ("pattern",)
     summary_text = "retrieve the pluralized form of a word"
 
-    def eval(self, word: String, evaluation: Evaluation) -> String:
-        "Pluralize[word_String]"
+    _inflect = staticmethod(Inflections.plural)
+
+
+class Singularize(_InflectionBuiltin):
+    """
+    <url>:Grammatical number:
+    https://en.wikipedia.org/wiki/Grammatical_number</url>
+
+    <dl>
+      <dt>'Singularize'[$word$]
+      <dd>returns the singular form of $word$.
+
+      <dt>'Singularize'[{$word_1$, $word_2$, ...}]
+      <dd>returns the singular form of each $word_i$.
+    </dl>
+
+    >> Singularize["potatoes"]
+     = potato
+
+    >> Singularize[{"tries", "mice"}]
+     = {try, mouse}
+    """
+
+    summary_text = "retrieve the singular form of a word"
 
-        return String(pluralize(word.value))
+    _inflect = staticmethod(Inflections.singular)
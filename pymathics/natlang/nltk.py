@@ -3,18 +3,43 @@
 """
 nltk backend
 """
+import hashlib
+import os
 import re
+import threading
+from collections.abc import Mapping
 from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
 
 import nltk
-from pattern.text.en import lexeme, pluralize
+from nltk.corpus.reader.util import find_corpus_fileids
+from nltk.data import ZipFilePathPointer
 
 from mathics.builtin.codetables import iso639_3
 from mathics.core.atoms import String
-from mathics.core.builtin import Builtin, MessageException
+from mathics.core.element import ElementsProperties
 from mathics.core.evaluation import Evaluation
+from mathics.core.list import ListExpression
 from mathics.core.symbols import strip_context
 
+from pymathics.natlang.inflection import Inflections
+from pymathics.natlang.instrumentation import _InstrumentedBuiltin, timed
+from pymathics.natlang.lexicon import (
+    MappedStringTable,
+    RelationGraph,
+    Thesaurus,
+    WordIndex,
+    WordTable,
+    _file_pos,
+)
+from pymathics.natlang.util import (
+    NatlangError,
+    StringTable,
+    cached_file,
+    load_once,
+    string_table,
+)
+
 # Don't consider this for user documentation
 no_doc = True
 
@@ -51,7 +76,464 @@ def _parse_nltk_lookup_error(e):
         return "unknown"
 
 
-class _WordNetBuiltin(Builtin):
+# Adjectives may carry a syntactic marker, e.g. "galore(ip)".
+_syntactic_marker = re.compile(r"\(.*\)$")
+
+
+def _synset_records(wordnet):
+    """
+    Read the synsets directly from the WordNet data files, yielding
+    ``(pos, offset, lemma_names, pointers)`` for each of them, where
+    ``pointers`` are ``(symbol, pos, offset, source_target)`` tuples.
+    """
+    for name in ("noun", "verb", "adj", "adv"):
+        with wordnet.abspath("data.%s" % name).open() as data_file:
+            for line in data_file:
+                if line.startswith(b"  "):  # license header
+                    continue
+                fields = line.split()
+                i = 4 + 2 * int(fields[3], 16)
+                lemma_names = [
+                    _syntactic_marker.sub("", field.decode("utf-8"))
+                    for field in fields[4:i:2]
+                ]
+                pointers = [
+                    (
+                        fields[j].decode(),
+                        fields[j + 2].decode(),
+                        int(fields[j + 1]),
+                        fields[j + 3].decode(),
+                    )
+                    for j in range(i + 1, i + 1 + 4 * int(fields[i]), 4)
+                ]
+                yield fields[2].decode(), int(fields[0]), lemma_names, pointers
+
+
+def _hypernym_pointers(wordnet):
+    """
+    Yield the hypernym and instance hypernym pointers of every synset.
+    """
+    for pos, offset, _, pointers in _synset_records(wordnet):
+        hypernyms = [
+            (target_pos, target_offset)
+            for symbol, target_pos, target_offset, _ in pointers
+            if symbol in ("@", "@i")
+        ]
+        yield pos, offset, hypernyms
+
+
+def _lemma_counts(wordnet) -> Dict[str, int]:
+    """
+    Return how often each lemma was tagged in the semantic concordance, as
+    listed in the WordNet file ``cntlist.rev``.
+    """
+    counts = {}
+    with wordnet.abspath("cntlist.rev").open() as count_file:
+        for line in count_file:
+            fields = line.split()
+            if len(fields) == 3:
+                lemma = fields[0].split(b"%", 1)[0].decode("utf-8")
+                counts[lemma] = counts.get(lemma, 0) + int(fields[2])
+    return counts
+
+
+def _morphy_lemmatizer(wordnet) -> Callable[[str], Optional[str]]:
+    """
+    Return a function giving the lemma of an English word without knowing
+    its part of speech: of the base forms WordNet's morphological analysis
+    finds for the word, the one most often tagged in the semantic
+    concordance, or None if there is none.
+    """
+    counts = _lemma_counts(wordnet)
+
+    def lemma(word: str) -> Optional[str]:
+        form = word.lower().replace(" ", "_")
+        best = None
+        for rank, pos in enumerate("nvar"):
+            for base in wordnet._morphy(form, pos):
+                key = (-counts.get(base, 0), rank, len(base), base)
+                if best is None or key < best:
+                    best = key
+        return best[-1].replace("_", " ") if best else None
+
+    return lemma
+
+
+def _thesaurus_synsets(wordnet, language_code, omw_lemmas=None):
+    """
+    Yield ``(pos, lemma_names, antonym_names)`` for each synset, with the
+    names in the language of ``language_code``, whose lemmas are
+    ``omw_lemmas`` if it is not English.
+
+    Antonymy relates English lemmas; in any other language the antonyms of a
+    synset are the lemmas of the synsets its English lemmas are antonyms of.
+    """
+    english_names = {}
+    antonym_pointers = {}
+    for pos, offset, lemma_names, pointers in _synset_records(wordnet):
+        key = (_file_pos[pos], offset)
+        english_names[key] = lemma_names
+        antonym_pointers[key] = [
+            ((_file_pos[target_pos], target_offset), int(source_target[2:], 16))
+            for symbol, target_pos, target_offset, source_target in pointers
+            if symbol == "!"
+        ]
+
+    if language_code == "eng":
+        for key, lemma_names in english_names.items():
+            antonyms = [
+                english_names[target][number - 1]
+                for target, number in antonym_pointers[key]
+                if target in english_names and number
+            ]
+            yield key[0], lemma_names, antonyms
+        return
+
+    names = {
+        (_file_pos[synset_id[-1]], int(synset_id[:8])): lemma_names
+        for synset_id, lemma_names in omw_lemmas.items()
+    }
+    for key, lemma_names in names.items():
+        antonyms = [
+            name
+            for target, _ in antonym_pointers.get(key, ())
+            for name in names.get(target, ())
+        ]
+        yield key[0], lemma_names, antonyms
+
+
+def _omw_lemma_names(wordnet, tab_data: bytes, language_code) -> Dict[str, List[str]]:
+    """
+    Read the lemmas of an Open Multilingual Wordnet tab file, as NLTK's
+    ``custom_lemmas()`` does, mapping its WordNet 3.0 synset ids to the ids
+    used by the installed WordNet.
+    """
+    map30 = wordnet.map30
+    labels = ("lemma", language_code + ":lemma")
+    lemma_names = {}
+    for line in tab_data.decode("utf-8").splitlines():
+        if line.startswith("#"):
+            continue
+        fields = line.strip().split("\t")
+        if len(fields) < 3 or fields[1] not in labels:
+            continue
+        synset_id = fields[0]
+        if map30:
+            synset_id = map30.get(synset_id)
+            if synset_id is None:  # never in this WordNet
+                continue
+        elif synset_id.endswith("-a"):
+            if int(synset_id[:8]) in wordnet.satellite_offsets:
+                synset_id = synset_id[:-1] + "s"
+        name = fields[-1].strip().replace(" ", "_")
+        names = lemma_names.setdefault(synset_id, [])
+        if name not in names:
+            names.append(name)
+    return lemma_names
+
+
+class _LemmaNames(Mapping):
+    """
+    The lemma names by synset id of a language, read from its table in the
+    cache directory as they are looked up.
+    """
+
+    def __init__(self, table: MappedStringTable):
+        self._table = table
+
+    def __getitem__(self, synset_id: str) -> List[str]:
+        names = self._table.get(synset_id)
+        if names is None:
+            raise KeyError(synset_id)
+        return names.split("\t")
+
+    def __iter__(self) -> Iterator[str]:
+        return self._table.keys()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+def _omw_lemmas(wordnet, omw_root, language_code) -> Optional[tuple]:
+    """
+    Return the provenance (the directory of the tab file) and the lemmas by
+    synset id of ``language_code``, read from its tab file alone. The table
+    is saved in the cache directory, keyed by the path, size and
+    modification time of the tab file and the WordNet version.
+    """
+    fileids = find_corpus_fileids(
+        omw_root, r".*/wn-data-%s\.tab" % re.escape(language_code)
+    )
+    if not fileids:
+        return None
+    provenance = os.path.dirname(fileids[0])
+    tab_pointer = omw_root.join(fileids[0])
+
+    # The tab file is either a file or an entry of the corpus zip file.
+    if isinstance(tab_pointer, ZipFilePathPointer):
+        source = tab_pointer.zipfile.filename
+        stat = os.stat(source)
+        source += "/" + tab_pointer.entry
+    else:
+        source = tab_pointer.path
+        stat = os.stat(source)
+    key = "%s\n%d\n%d\n%s" % (
+        source,
+        stat.st_size,
+        stat.st_mtime_ns,
+        wordnet.get_version(),
+    )
+    digest = hashlib.sha1(key.encode("utf-8"))
+    name = "omw-%s-%s.bin" % (language_code, digest.hexdigest()[:16])
+
+    def build() -> Dict[str, List[str]]:
+        with tab_pointer.open() as tab_file:
+            tab_data = tab_file.read()
+        return _omw_lemma_names(wordnet, tab_data, language_code)
+
+    def write(path: str, lemma_names: Dict[str, List[str]]):
+        MappedStringTable.write(
+            path,
+            {synset_id: "\t".join(names) for synset_id, names in lemma_names.items()},
+        )
+
+    return provenance, cached_file(
+        name, lambda path: _LemmaNames(MappedStringTable(path)), build, write
+    )
+
+
+class _ThreadDataFiles(threading.local):
+    """
+    Stand-in for the map of the open data files of a WordNet reader, which
+    keeps the files of each thread, and of each forked process, apart.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.files = {}
+
+    def _files(self) -> dict:
+        # A forked process would share the offsets of its parent's files.
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.files = {}
+        return self.files
+
+    def get(self, pos, default=None):
+        return self._files().get(pos, default)
+
+    def __getitem__(self, pos):
+        return self._files()[pos]
+
+    def __setitem__(self, pos, data_file):
+        self._files()[pos] = data_file
+
+
+# The WordNet readers, by ISO 639-3 language code, and the tables built from
+# them.
+_wordnet_instances = {}
+_wordnet_readers = {}
+_omw_lemma_tables = {}
+_relation_graphs = {}
+_thesauri = {}
+_word_tables = {}
+_word_lists = {}
+_word_indexes = {}
+_inflections_tables = {}
+
+
+def _missing_corpus(corpus: str) -> NatlangError:
+    return NatlangError("NLTK's %s corpus is not installed" % corpus, "package", corpus)
+
+
+def _init_omw_language(wordnet, omw_root, language_code) -> bool:
+    """
+    Load the lemmas of a language from its Open Multilingual Wordnet tab
+    file only, instead of letting NLTK scan every tab file.
+    """
+    omw_lemmas = _omw_lemmas(wordnet, omw_root, language_code)
+    if omw_lemmas is None:
+        return False
+    provenance, lemma_names = omw_lemmas
+
+    synset_ids = {}
+    for synset_id in sorted(lemma_names):
+        for name in lemma_names[synset_id]:
+            synset_id_list = synset_ids.setdefault(name.lower(), [])
+            if synset_id not in synset_id_list:
+                synset_id_list.append(synset_id)
+    # These are the tables custom_lemmas() fills in: lemmas by synset,
+    # synsets by lemma, and definitions and examples, which are unused.
+    wordnet._lang_data[language_code] = [lemma_names, synset_ids, {}, {}]
+    wordnet.provenances[language_code] = provenance
+    _omw_lemma_tables[language_code] = lemma_names
+    return True
+
+
+def _init_wordnet(language_code: str):
+    try:
+        wordnet_resource = nltk.data.find("corpora/wordnet2022")
+        _init_nltk_maps()
+    except LookupError:
+        raise _missing_corpus("wordnet2022")
+
+    def load_reader():
+        omw = nltk.corpus.util.LazyCorpusLoader(
+            "omw",
+            nltk.corpus.reader.CorpusReader,
+            r".*/wn-data-.*\.tab",
+            encoding="utf8",
+        )
+        reader = nltk.corpus.reader.wordnet.WordNetCorpusReader(wordnet_resource, omw)
+        # Reading a synset seeks its data file, so each thread needs its own
+        # files.
+        reader._data_file_map = _ThreadDataFiles()
+        return reader
+
+    # All the languages share one reader.
+    wordnet = load_once(_wordnet_readers, str(wordnet_resource), load_reader)
+
+    if language_code not in wordnet.langs():
+        for corpus in ("omw-1.4", "omw"):
+            try:
+                omw_root = nltk.data.find("corpora/" + corpus)
+                break
+            except LookupError:
+                pass
+        else:
+            raise _missing_corpus("omw-1.4")
+
+        if not _init_omw_language(wordnet, omw_root, language_code):
+            raise NatlangError(
+                'language "%s" is not in the Open Multilingual Wordnet' % language_code,
+                "lang",
+                language_code,
+            )
+
+    return wordnet
+
+
+def load_wordnet(language_code: str):
+    """
+    Return the WordNet reader of ``language_code``, an ISO 639-3 code,
+    loaded once.
+    """
+
+    def load():
+        try:
+            return _init_wordnet(language_code)
+        except LookupError as e:
+            raise _missing_corpus(_parse_nltk_lookup_error(e))
+
+    return load_once(_wordnet_instances, language_code, load)
+
+
+def relation_graph(wordnet) -> RelationGraph:
+    # Relations are the same for every language, so the graph is shared by
+    # all the readers of a WordNet installation.
+    return load_once(
+        _relation_graphs,
+        str(wordnet.root),
+        lambda: RelationGraph(_hypernym_pointers(wordnet)),
+    )
+
+
+def _wordnet_error(err: Exception) -> NatlangError:
+    return NatlangError("WordNet error: %s" % err, "wordnet", str(err))
+
+
+def load_thesaurus(language_code: str) -> Thesaurus:
+    wordnet = load_wordnet(language_code)
+
+    def load():
+        try:
+            return Thesaurus(
+                _thesaurus_synsets(
+                    wordnet, language_code, _omw_lemma_tables.get(language_code, {})
+                ),
+                # Look English words up under every base form WordNet's
+                # morphological analysis finds, as synsets() does.
+                wordnet._morphy if language_code == "eng" else None,
+            )
+        except nltk.corpus.reader.wordnet.WordNetError as err:
+            raise _wordnet_error(err)
+
+    return load_once(_thesauri, language_code, load)
+
+
+def load_word_table(language_code: str) -> WordTable:
+    wordnet = load_wordnet(language_code)
+
+    def load():
+        try:
+            words_by_type = {
+                "All": wordnet.all_lemma_names(None, language_code),
+            }
+            for ilk, filtered_pos in _wordnet_type_to_pos.items():
+                words_by_type[ilk] = [
+                    word
+                    for pos in filtered_pos
+                    for word in wordnet.all_lemma_names(pos, language_code)
+                ]
+            return WordTable(words_by_type)
+        except nltk.corpus.reader.wordnet.WordNetError as err:
+            raise _wordnet_error(err)
+
+    return load_once(_word_tables, language_code, load)
+
+
+def load_words(language_code: str, ilk: str) -> Sequence[str]:
+    """
+    Return the sorted words of type ``ilk``, such as "Noun" or "All".
+    """
+    word_table = load_word_table(language_code)
+    if not word_table.has_type(ilk):
+        raise _wordnet_error(
+            "type: %s should be in %s" % (ilk, _wordnet_type_to_pos.keys())
+        )
+    return word_table.subset(ilk)
+
+
+def load_word_list(language_code: str, ilk: str) -> ListExpression:
+    """
+    Return the words of type ``ilk`` as a list of String atoms.
+    """
+
+    def load():
+        # The list is cached whole, so its atoms are built once anyway; they
+        # would only fill the table used for per-call results.
+        return ListExpression(
+            *(String(word) for word in load_words(language_code, ilk)),
+            elements_properties=ElementsProperties(True, True, True),
+        )
+
+    return load_once(_word_lists, (language_code, ilk), load)
+
+
+def load_word_index(language_code: str) -> WordIndex:
+    return load_once(
+        _word_indexes,
+        language_code,
+        lambda: WordIndex(load_words(language_code, "All")),
+    )
+
+
+def load_inflections() -> Inflections:
+    """
+    Return the inflection table of the English WordNet lemmas.
+    """
+
+    def load():
+        word_table = load_word_table("eng")
+        return Inflections.load(
+            "eng",
+            *(word_table.subset(ilk) for ilk in ("Noun", "Verb", "Adjective")),
+        )
+
+    return load_once(_inflections_tables, "eng", load)
+
+
+class _WordNetBuiltin(_InstrumentedBuiltin):
     requires = ("nltk",)
 
     options = {
@@ -65,41 +547,10 @@ class _WordNetBuiltin(Builtin):
         "wordnet": "WordNet returned the following error: ``",
     }
 
-    _wordnet_instances = {}
-
     def _language_name(self, evaluation: Evaluation, options: dict):
         return self.get_option(options, "Language", evaluation)
 
-    def _init_wordnet(self, evaluation: Evaluation, language_name, language_code):
-        try:
-            wordnet_resource = nltk.data.find("corpora/wordnet2022")
-            _init_nltk_maps()
-        except LookupError:
-            evaluation.message(self.get_name(), "package", "wordnet2022")
-            return None
-
-        try:
-            omw = nltk.corpus.util.LazyCorpusLoader(
-                "omw",
-                nltk.corpus.reader.CorpusReader,
-                r".*/wn-data-.*\.tab",
-                encoding="utf8",
-            )
-        except LookupError:
-            evaluation.message(self.get_name(), "package", "omw")
-            return None
-
-        wordnet = nltk.corpus.reader.wordnet.WordNetCorpusReader(wordnet_resource, omw)
-
-        if language_code not in wordnet.langs():
-            evaluation.message(
-                self.get_name(), "lang", language_name, strip_context(self.get_name())
-            )
-            return None
-
-        return wordnet
-
-    def _load_wordnet(self, evaluation: Evaluation, language_name) -> tuple:
+    def _wordnet_language_code(self, language_name, evaluation) -> Optional[str]:
         language_code = None
         if isinstance(language_name, String):
             language_code = iso639_3.get(language_name.value)
@@ -107,21 +558,52 @@ class _WordNetBuiltin(Builtin):
             evaluation.message(
                 self.get_name(), "lang", language_name, strip_context(self.get_name())
             )
-            return None, None
+            return None
+        return language_code
+
+    def _wordnet_data(self, function: Callable, language_name, evaluation, *arguments):
+        """
+        Return ``function(language_code, *arguments)``, a WordNet engine
+        called with the code of ``language_name``, or None, with a message,
+        if the WordNet data of the language cannot be loaded.
+        """
+        language_code = self._wordnet_language_code(language_name, evaluation)
+        if language_code is None:
+            return None
+        try:
+            return function(language_code, *arguments)
+        except NatlangError as e:
+            e.message(self.get_name(), evaluation, language_name)
+            return None
 
-        wordnet = _WordNetBuiltin._wordnet_instances.get(language_code)
+    def _load_wordnet(self, evaluation: Evaluation, language_name) -> tuple:
+        wordnet = self._wordnet_data(load_wordnet, language_name, evaluation)
         if not wordnet:
-            try:
-                wordnet = self._init_wordnet(evaluation, language_name, language_code)
-            except LookupError as e:
-                evaluation.message(
-                    self.get_name(), "package", _parse_nltk_lookup_error(e)
-                )
-                return None, None
+            return None, None
+        return wordnet, iso639_3[language_name.value]
+
+    @staticmethod
+    def _strings(language_name: String) -> StringTable:
+        """
+        Return the table of the shared String atoms of the words of the
+        WordNet of ``language_name``.
+        """
+        return string_table(iso639_3.get(language_name.value, language_name.value))
 
-            _WordNetBuiltin._wordnet_instances[language_code] = wordnet
+    _relation_graph = staticmethod(relation_graph)
 
-        return wordnet, language_code
+    def _thesaurus(self, evaluation: Evaluation, language_name) -> Optional[Thesaurus]:
+        return self._wordnet_data(load_thesaurus, language_name, evaluation)
+
+    @staticmethod
+    def _parse_word(word):
+        if isinstance(word, String):
+            return word.value.lower()
+        elif word.get_head_name() == "System`List":
+            if len(word.elements) == 3 and all(
+                isinstance(s, String) for s in word.elements
+            ):
+                return tuple(s.value for s in word.elements)
 
     @staticmethod
     def _decode_synset(syn):
@@ -190,6 +672,7 @@ class _WordNetBuiltin(Builtin):
                         )
                         break
 
+    @timed("WordNet senses")
     def _senses(self, word, wordnet, language_code):
         if isinstance(word, tuple):  # find forms like ["tree", "Noun", "WoodyPlant"]
             for syn, form in _WordNetBuiltin._iterate_senses(
@@ -203,52 +686,61 @@ class _WordNetBuiltin(Builtin):
 
 
 class _WordListBuiltin(_WordNetBuiltin):
-    _dictionary = {}
+    def _word_table(self, language_name, evaluation) -> Optional[WordTable]:
+        return self._wordnet_data(load_word_table, language_name, evaluation)
 
-    def _words(self, language_name, ilk, evaluation):
-        wordnet, language_code = self._load_wordnet(evaluation, language_name)
+    def _words(self, language_name, ilk, evaluation) -> Optional[Sequence[str]]:
+        return self._wordnet_data(load_words, language_name, evaluation, ilk)
 
-        if not wordnet:
-            return
-
-        key = "%s.%s" % (language_code, ilk)
-        words = self._dictionary.get(key)
-        if not words:
-            try:
-                if ilk == "All":
-                    filtered_pos = [None]
-                else:
-                    try:
-                        filtered_pos = _wordnet_type_to_pos[ilk]
-                    except KeyError:
-                        evaluation.message(
-                            self.get_name(),
-                            "wordnet",
-                            "type: %s should be in %s"
-                            % (ilk, _wordnet_type_to_pos.keys()),
-                        )
-                        return
+    def _word_list(self, language_name, ilk, evaluation) -> Optional[ListExpression]:
+        return self._wordnet_data(load_word_list, language_name, evaluation, ilk)
 
-                words = []
-                for pos in filtered_pos:
-                    words.extend(list(wordnet.all_lemma_names(pos, language_code)))
-                words.sort()
-                self._dictionary[key] = words
-            except nltk.corpus.reader.wordnet.WordNetError as err:
-                evaluation.message(self.get_name(), "wordnet", str(err))
-                return
+    @staticmethod
+    def _inflections() -> Inflections:
+        """
+        Return the inflection table of the English WordNet lemmas, or just
+        the rules if WordNet is not available. The rules are enough to
+        inflect words, so a missing WordNet is not reported.
+        """
+        try:
+            return load_inflections()
+        except NatlangError:
+            return Inflections()
 
-        return words
+    def _word_index(self, language_name, evaluation) -> Optional[WordIndex]:
+        return self._wordnet_data(load_word_index, language_name, evaluation)
 
 
 class WordProperty:
-    def __init__(self, syn_form, wordnet, language_code):
+    def __init__(
+        self,
+        syn_form,
+        wordnet,
+        language_code,
+        relation_graph=None,
+        relation_depth=None,
+        inflections=None,
+    ):
         self.syn_form = syn_form
         self.wordnet = wordnet
         self.language_code = language_code
+        # Functions returning the RelationGraph and the Inflections, which
+        # are only loaded when a property needs them.
+        self.relation_graph = relation_graph
+        self.relation_depth = relation_depth
+        self.inflections = inflections
+        # Related synsets are shared between the senses of a batch of words,
+        # so their forms are resolved only once.
+        self._syn_forms = {}
 
     def syn(self, syn):
-        return self.syn_form(_WordNetBuiltin.syn(syn, self.wordnet, self.language_code))
+        form = self._syn_forms.get(syn)
+        if form is None:
+            form = self.syn_form(
+                _WordNetBuiltin.syn(syn, self.wordnet, self.language_code)
+            )
+            self._syn_forms[syn] = form
+        return form
 
     @staticmethod
     def _synonymous_lemmas(syn):
@@ -281,6 +773,22 @@ class WordProperty:
     def narrower_terms(self, syn, desc):
         return [self.syn(s) for s in syn.hyponyms()]
 
+    def _closure(self, syn, upward):
+        graph = self.relation_graph()
+        node = graph.node(syn.pos(), syn.offset())
+        if node is None:
+            return []
+        return [
+            self.syn(self.wordnet.synset_from_pos_and_offset(*graph.key(n)))
+            for n in graph.closure(node, upward, self.relation_depth)
+        ]
+
+    def all_broader_terms(self, syn, desc):
+        return self._closure(syn, True)
+
+    def all_narrower_terms(self, syn, desc):
+        return self._closure(syn, False)
+
     def usage_field(self, syn, desc):
         return syn.usage_domains()
 
@@ -303,20 +811,13 @@ class WordProperty:
         return [self.syn(s) for s in syn.causes()]
 
     def inflected_forms(self, syn, desc):
-        try:
-            word, pos, _ = desc
-            if pos == "Verb":
-
-                return [w for w in reversed(lexeme(word)) if w != word]
-            elif pos == "Noun":
-                return [pluralize(word)]
-            elif pos == "Adjective":
-                from pattern.en import comparative, superlative
-
-                return [comparative(word), superlative(word)]
-            else:
-                return []
-        except ImportError:
-            raise MessageException(
-                "General", "unavailable", 'WordData[_, "InflectedForms"]', "pattern"
-            )
+        word, pos, _ = desc
+        inflections = self.inflections() if self.inflections else Inflections()
+        if pos == "Verb":
+            return [w for w in reversed(inflections.verb_forms(word)) if w != word]
+        elif pos == "Noun":
+            return [inflections.plural(word)]
+        elif pos == "Adjective":
+            return inflections.adjective_forms(word)
+        else:
+            return []
@@ -19,11 +19,25 @@ from mathics.core.convert.python import from_python
 from mathics.core.evaluation import Evaluation
 from mathics.core.list import ListExpression
 
-from pymathics.natlang.spacy import _cases, _pos_tags, _position, _SpacyBuiltin
+from pymathics.natlang.spacy import (
+    _cases,
+    _pos_tags,
+    _position,
+    _SpacyBuiltin,
+    _strings,
+)
 
 sort_order = "Text Normalization"
 
 
+def _words(doc):
+    """
+    Yield the tokens of ``doc`` that are not punctuation.
+    """
+    punctuation = spacy.parts_of_speech.PUNCT
+    return (word for word in doc if word.pos != punctuation)
+
+
 class DeleteStopwords(_SpacyBuiltin):
     """
     Delete <url>:stop words:https://en.wikipedia.org/wiki/Stop_word</url>(\
@@ -104,6 +118,10 @@ class TextCases(_SpacyBuiltin):
     >> TextCases["Saul, Peter and Mr Johnes say hello.", "Person", 3][[2;;3]]
      = {Peter, Johnes}
 
+    With 'Language -> Automatic', the language of each run of sentences is \
+    identified, and each run is parsed with the model of its language:
+    >> TextCases["I was in London last year. Ich war letztes Jahr in Berlin.", "City", Language -> Automatic]
+     = {London, Berlin}
     """
 
     summary_text = "list cases of words of a certain form in a text"
@@ -112,18 +130,19 @@ class TextCases(_SpacyBuiltin):
         self, text: String, form, evaluation: Evaluation, options: dict
     ):
         "TextCases[text_String, form_,  OptionsPattern[TextCases]]"
-        doc = self._nlp(text.value, evaluation, options)
-        if doc:
-            return ListExpression(*[String(t.text) for t in _cases(doc, form)])
+        docs = self._docs(text.value, evaluation, options)
+        if docs:
+            return ListExpression(*_strings(docs, lambda doc: _cases(doc, form)))
 
     def eval_string_form_n(
         self, text: String, form, n: Integer, evaluation: Evaluation, options: dict
     ):
         "TextCases[text_String, form_, n_Integer,  OptionsPattern[TextCases]]"
-        doc = self._nlp(text.value, evaluation, options)
-        if doc:
-            items = islice((t.text for t in _cases(doc, form)), n.value)
-            return ListExpression(*(from_python(item) for item in items))
+        docs = self._docs(text.value, evaluation, options)
+        if docs:
+            return ListExpression(
+                *islice(_strings(docs, lambda doc: _cases(doc, form)), n.value)
+            )
 
 
 class TextPosition(_SpacyBuiltin):
@@ -285,6 +304,10 @@ class TextWords(_SpacyBuiltin):
     >> TextWords["Bruder Jakob, Schläfst du noch?", 2]
      = {Bruder, Jakob}
 
+    With 'Language -> Automatic', each run of sentences is split with the \
+    model of its language:
+    >> TextWords["Good morning. Guten Morgen, wie geht's?", Language -> Automatic]
+     = {Good, morning, Guten, Morgen, wie, geht's}
     """
 
     summary_text = "list the words in a string"
@@ -293,21 +316,12 @@ class TextWords(_SpacyBuiltin):
         self, text: String, evaluation: Evaluation, options: dict
     ) -> Optional[ListExpression]:
         "TextWords[text_String, OptionsPattern[]]"
-        doc = self._nlp(text.value, evaluation, options)
-        if doc:
-            punctuation = spacy.parts_of_speech.PUNCT
-            return ListExpression(
-                *[String(word.text) for word in doc if word.pos != punctuation],
-            )
+        docs = self._docs(text.value, evaluation, options)
+        if docs:
+            return ListExpression(*_strings(docs, _words))
 
     def eval_n(self, text: String, n: Integer, evaluation: Evaluation, options: dict):
         "TextWords[text_String, n_Integer, OptionsPattern[]]"
-        doc = self._nlp(text.value, evaluation, options)
-        if doc:
-            punctuation = spacy.parts_of_speech.PUNCT
-            return ListExpression(
-                *itertools.islice(
-                    (String(word.text) for word in doc if word.pos != punctuation),
-                    n.value,
-                ),
-            )
+        docs = self._docs(text.value, evaluation, options)
+        if docs:
+            return ListExpression(*itertools.islice(_strings(docs, _words), n.value))
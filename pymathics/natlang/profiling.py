@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+Profiling of slow natlang evaluations
+
+When profiling is on, the evaluations of the natlang builtins are profiled
+with cProfile, or, with the "spaCy" method, the time of each component of
+the spaCy pipelines they run is measured. The profile of an evaluation that
+takes longer than a threshold is written to a directory, which keeps the
+most recent ones, with a JSON file giving the builtin, its options, the
+number of characters of its arguments and the time it took.
+
+Profiling is turned on with ``enable()`` or the NatlangProfile builtin, or
+from the start by setting the environment variable MATHICS3_NATLANG_PROFILE
+to the directory. MATHICS3_NATLANG_PROFILE_THRESHOLD then sets the threshold
+in seconds, and MATHICS3_NATLANG_PROFILE_METHOD the method.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+import warnings
+from typing import Callable, Optional
+
+# Don't consider this for user documentation
+no_doc = True
+
+methods = ("cProfile", "spaCy")
+
+# Profiles kept in the directory; older ones are removed.
+max_profiles = 100
+
+
+class _Settings:
+    def __init__(self, directory: str, threshold: float, method: str):
+        if method not in methods:
+            raise ValueError("unknown profiling method %s" % method)
+        self.directory = directory
+        self.threshold = threshold
+        self.method = method
+
+
+_settings: Optional[_Settings] = None
+_current = threading.local()
+_lock = threading.Lock()
+_count = 0
+
+
+def enable(directory: str, threshold: float = 1.0, method: str = "cProfile"):
+    """
+    Profile the evaluations of the natlang builtins, keeping those longer
+    than ``threshold`` seconds in ``directory``.
+    """
+    global _settings
+    os.makedirs(directory, exist_ok=True)
+    _settings = _Settings(directory, threshold, method)
+
+
+def disable():
+    global _settings
+    _settings = None
+
+
+def _rotate(directory: str):
+    """
+    Remove the oldest profiles beyond ``max_profiles``.
+    """
+    names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    for name in names[: max(0, len(names) - max_profiles)]:
+        stem = name[: -len(".json")]
+        for suffix in (".json", ".prof"):
+            try:
+                os.unlink(os.path.join(directory, stem + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def _write(settings: _Settings, record: dict, profile: Optional[cProfile.Profile]):
+    global _count
+    with _lock:
+        _count += 1
+        # Names sort in the order profiles are written.
+        stem = "%s-%d-%06d-%s" % (
+            time.strftime("%Y%m%d-%H%M%S"),
+            os.getpid(),
+            _count,
+            record["Builtin"],
+        )
+        path = os.path.join(settings.directory, stem)
+        if profile is not None:
+            profile.dump_stats(path + ".prof")
+            record["Profile"] = stem + ".prof"
+        with open(path + ".json", "w") as record_file:
+            json.dump(record, record_file, indent=2)
+        _rotate(settings.directory)
+
+
+def profiled(name: str, size: Callable[..., int]):
+    """
+    Decorator profiling the evaluations of the builtin ``name``. ``size``,
+    called with the arguments of the evaluation, gives the number of
+    characters it processes.
+
+    Evaluations within an evaluation being profiled are part of its profile.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            settings = _settings
+            if settings is None or getattr(_current, "components", None) is not None:
+                return function(*args, **kwargs)
+
+            profile = cProfile.Profile() if settings.method == "cProfile" else None
+            _current.components = {}
+            start = time.perf_counter()
+            try:
+                if profile is not None:
+                    try:
+                        profile.enable()
+                    except ValueError:  # another profiler is running
+                        profile = None
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    if profile is not None:
+                        profile.disable()
+            finally:
+                seconds = time.perf_counter() - start
+                components, _current.components = _current.components, None
+                if seconds >= settings.threshold:
+                    options = kwargs.get("options") or {}
+                    record = {
+                        "Builtin": name,
+                        "Seconds": seconds,
+                        "Characters": size(*args, **kwargs),
+                        "Options": {
+                            key.split("`")[-1]: value.get_string_value() or str(value)
+                            for key, value in options.items()
+                        },
+                        "Method": settings.method,
+                    }
+                    if components:
+                        record["Components"] = components
+                    try:
+                        _write(settings, record, profile)
+                    except OSError as e:
+                        # The evaluation itself went fine: don't fail it, nor
+                        # the next ones, because the profiles can't be kept.
+                        warnings.warn(
+                            "natlang profiling disabled: %s" % e, RuntimeWarning
+                        )
+                        disable()
+
+        return wrapper
+
+    return decorator
+
+
+def pipe(nlp, texts: list, disable=()) -> list:
+    """
+    Run the spaCy pipeline ``nlp`` on ``texts`` as ``nlp.pipe()`` does,
+    timing each of its components when an evaluation is being profiled
+    with the "spaCy" method.
+    """
+    settings = _settings
+    components = getattr(_current, "components", None)
+    if settings is None or settings.method != "spaCy" or components is None:
+        return list(nlp.pipe(texts, disable=list(disable)))
+
+    def add(component: str, seconds: float):
+        components[component] = components.get(component, 0.0) + seconds
+
+    start = time.perf_counter()
+    docs = [nlp.make_doc(text) for text in texts]
+    add("tokenizer", time.perf_counter() - start)
+    for component, process in nlp.pipeline:
+        if component in disable:
+            continue
+        start = time.perf_counter()
+        if hasattr(process, "pipe"):
+            docs = list(process.pipe(docs))
+        else:
+            docs = [process(doc) for doc in docs]
+        add(component, time.perf_counter() - start)
+    return docs
+
+
+def _enable_from_environment():
+    """
+    Turn profiling on as the environment variables say. Bad settings are
+    reported with a warning rather than failing the import of the module.
+    """
+    directory = os.environ.get("MATHICS3_NATLANG_PROFILE")
+    if not directory:
+        return
+    try:
+        enable(
+            directory,
+            float(os.environ.get("MATHICS3_NATLANG_PROFILE_THRESHOLD", "1.0")),
+            os.environ.get("MATHICS3_NATLANG_PROFILE_METHOD", "cProfile"),
+        )
+    except (ValueError, OSError) as e:
+        warnings.warn("natlang profiling not enabled: %s" % e, RuntimeWarning)
+
+
+_enable_from_environment()
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Natural Language Resources
+
+The models, word lists and tables of the natlang builtins are loaded the \
+first time they are needed. The time spent in the builtins, in loading \
+these resources and in the engines behind the builtins can be recorded, \
+and slow evaluations profiled.
+
+A server with pre-forked workers loads them once in its parent process, \
+and freezes them, so that the workers share their pages copy-on-write \
+instead of each loading its own copy.
+"""
+
+import gc
+from typing import List, Optional, Sequence
+
+from mathics.builtin.codetables import iso639_3
+from mathics.core.atoms import String
+from mathics.core.builtin import Builtin
+from mathics.core.convert.python import from_python
+from mathics.core.evaluation import Evaluation
+from mathics.core.list import ListExpression
+from mathics.core.symbols import SymbolFalse, SymbolNull, SymbolTrue
+
+from pymathics.natlang import instrumentation, profiling
+from pymathics.natlang.langid import _base_identifier, language_code
+from pymathics.natlang.nltk import (
+    _wordnet_type_to_pos,
+    load_inflections,
+    load_thesaurus,
+    load_word_index,
+    load_word_list,
+    load_word_table,
+    load_wordnet,
+    relation_graph,
+)
+from pymathics.natlang.spacy import _language_codes, _model, _vocab
+from pymathics.natlang.textual_analysis import (
+    _language_code,
+    _lookup_function,
+    _spelling_index,
+    _stem_function,
+    _tokenizer,
+)
+from pymathics.natlang.util import NatlangError
+
+sort_order = "Natural Language Resources"
+
+
+def _wordnet_language_code(language_name: str) -> str:
+    code = iso639_3.get(language_name)
+    if code is None:
+        raise NatlangError(
+            'language "%s" is not in WordNet' % language_name, "lang", language_name
+        )
+    return code
+
+
+def _load_spacy(language_name: str) -> bool:
+    code = _language_codes.get(language_name)
+    if code is None:
+        return False
+    _model(code)
+    _vocab(code)
+    return True
+
+
+def _load_wordnet(language_name: str) -> bool:
+    code = _wordnet_language_code(language_name)
+    relation_graph(load_wordnet(code))
+    load_word_table(code).has_word("")  # builds the set of the words
+    for ilk in ("All", *_wordnet_type_to_pos):
+        load_word_list(code, ilk)
+    load_word_index(code)
+    load_thesaurus(code)
+    if code == "eng":
+        load_inflections()
+    return True
+
+
+def _load_lemmas(language_name: str) -> bool:
+    code = _language_code(language_name)
+    if code is None:
+        return False
+    _lookup_function(code)
+    return True
+
+
+def _load_spelling(language_name: str) -> bool:
+    # The index is memory-mapped, so every process shares it anyway; loading
+    # it first builds it, which would otherwise be done by each process.
+    _spelling_index(_wordnet_language_code(language_name))
+    return True
+
+
+def _load_stemmer(language_name: str) -> bool:
+    code = _language_code(language_name)
+    if code is None:
+        return False
+    try:
+        _stem_function(code)
+    except NatlangError:
+        return False  # no stemmer for the language
+    _tokenizer(code)
+    return True
+
+
+# Resources loaded for each language, in this order: WordNet first, as the
+# English lemmas and the SymSpell indexes are built from it.
+_loaders = {
+    "WordNet": _load_wordnet,
+    "spaCy": _load_spacy,
+    "Lemmas": _load_lemmas,
+    "SymSpell": _load_spelling,
+    "WordStem": _load_stemmer,
+}
+
+
+def preload(
+    languages: Sequence[str] = ("English",), evaluation=None, freeze: bool = True
+) -> List[str]:
+    """
+    Load the resources of the natlang builtins for ``languages``, and the
+    langid model, and return the names of those that could be loaded.
+    Messages about the others are emitted to ``evaluation``, if given, as
+    messages of ``NatlangPreload``.
+
+    With ``freeze``, the objects allocated so far are then moved out of
+    the reach of the garbage collector, so that collections in processes
+    forked afterwards do not write to, and thus copy, their pages.
+    """
+    loaded = []
+    for language_name in languages:
+        for resource, load in _loaders.items():
+            try:
+                if not load(language_name):
+                    continue
+            except NatlangError as e:
+                if evaluation is not None:
+                    e.message(
+                        NatlangPreload.get_name(), evaluation, String(language_name)
+                    )
+                continue
+            loaded.append("%s %s" % (language_name, resource))
+
+    _base_identifier()
+    language_code("English")  # fills the table of language names
+    loaded.append("LanguageIdentify")
+
+    # The tables of the forms of TextCases and TextPosition, _forms, are
+    # built when the builtins are imported, before this.
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return loaded
+
+
+class NatlangPreload(Builtin):
+    """
+    <url>:gc.freeze:
+    https://docs.python.org/3/library/gc.html#gc.freeze</url>
+
+    <dl>
+      <dt>'NatlangPreload'[]
+      <dd>loads the English models, word lists and tables of the natlang \
+          builtins, and returns the list of the resources loaded.
+
+      <dt>'NatlangPreload'[{$language_1$, $language_2$, ...}]
+      <dd>loads those of the languages $language_i$.
+    </dl>
+
+    Processes forked from the kernel afterwards share these resources \
+    instead of each loading its own copy. With 'Freeze -> True', the objects \
+    allocated so far are also moved out of the reach of the garbage \
+    collector, whose collections in the forked processes would otherwise \
+    copy the pages holding them.
+
+    >> MemberQ[NatlangPreload[], "English WordNet"]
+     = True
+    """
+
+    options = {
+        "Freeze": "False",
+    }
+
+    messages = {
+        "freeze": "Freeze `1` should be True or False.",
+        "lang": 'Language "`1`" is currently not supported with `2`[].',
+        "package": "NLTK's `` corpus is not installed. Please install it using nltk.download().",
+        "runtime": "Spacy gave the following error: ``",
+        "wordnet": "WordNet returned the following error: ``",
+    }
+
+    summary_text = "load the natlang resources before forking"
+
+    def eval(self, evaluation: Evaluation, options: dict) -> Optional[ListExpression]:
+        "NatlangPreload[OptionsPattern[NatlangPreload]]"
+        return self._preload(["English"], evaluation, options)
+
+    def eval_languages(
+        self, languages, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        "NatlangPreload[languages_List, OptionsPattern[NatlangPreload]]"
+        if all(isinstance(language, String) for language in languages.elements):
+            return self._preload(
+                [language.value for language in languages.elements],
+                evaluation,
+                options,
+            )
+
+    def _preload(
+        self, languages: list, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        freeze = self.get_option(options, "Freeze", evaluation)
+        if freeze is not SymbolTrue and freeze is not SymbolFalse:
+            evaluation.message(self.get_name(), "freeze", freeze)
+            return
+        return ListExpression(
+            *(
+                String(name)
+                for name in preload(languages, evaluation, freeze is SymbolTrue)
+            )
+        )
+
+
+class NatlangProfile(Builtin):
+    """
+    <url>:cProfile:
+    https://docs.python.org/3/library/profile.html</url>
+
+    <dl>
+      <dt>'NatlangProfile'[$directory$]
+      <dd>profiles the evaluations of the natlang builtins, and writes \
+          those of the slow ones to $directory$.
+
+      <dt>'NatlangProfile'[False]
+      <dd>stops profiling.
+    </dl>
+
+    An evaluation is slow if it takes longer than the 'Threshold' option, \
+    in seconds. With 'Method -> "cProfile"', its profile is written as a \
+    '.prof' file, which 'pstats' reads; with 'Method -> "spaCy"', the time \
+    of each component of the spaCy pipelines it runs is measured. A JSON \
+    file gives the builtin, its options, the number of characters of its \
+    arguments and the time it took. The directory keeps the most recent \
+    profiles.
+
+    Profiling can also be turned on from the start by setting the \
+    environment variable 'MATHICS3_NATLANG_PROFILE' to the directory.
+
+    >> directory = FileNameJoin[{$TemporaryDirectory, "natlang-profiles"}];
+    >> NatlangProfile[directory, Threshold -> 0];
+    >> WordStem["towers"];
+    >> NatlangProfile[False];
+    >> Length[FileNames["*WordStem.json", directory]] > 0
+     = True
+    """
+
+    options = {
+        "Method": '"cProfile"',
+        "Threshold": "1",
+    }
+
+    messages = {
+        "method": 'Method `1` should be "cProfile" or "spaCy".',
+        "threshold": "Threshold `1` should be a nonnegative number of seconds.",
+        "dir": "Cannot write profiles to `1`: `2`.",
+    }
+
+    summary_text = "profile the slow evaluations of natlang builtins"
+
+    def eval(self, directory: String, evaluation: Evaluation, options: dict):
+        "NatlangProfile[directory_String, OptionsPattern[NatlangProfile]]"
+        method = self.get_option(options, "Method", evaluation)
+        py_method = method.get_string_value()
+        if py_method not in profiling.methods:
+            evaluation.message(self.get_name(), "method", method)
+            return
+        threshold = self.get_option(options, "Threshold", evaluation)
+        py_threshold = threshold.round_to_float()
+        if py_threshold is None or py_threshold < 0:
+            evaluation.message(self.get_name(), "threshold", threshold)
+            return
+        try:
+            profiling.enable(directory.value, py_threshold, py_method)
+        except OSError as e:
+            evaluation.message(self.get_name(), "dir", directory, String(e.strerror))
+            return
+        return SymbolNull
+
+    def eval_stop(self, evaluation: Evaluation):
+        "NatlangProfile[False]"
+        profiling.disable()
+        return SymbolNull
+
+
+class NatlangStatistics(Builtin):
+    """
+    <url>:Profiling:
+    https://en.wikipedia.org/wiki/Profiling_(computer_programming)</url>
+
+    <dl>
+      <dt>'NatlangStatistics'[]
+      <dd>returns the statistics recorded about the natlang builtins.
+
+      <dt>'NatlangStatistics'[True]
+      <dd>starts recording statistics.
+
+      <dt>'NatlangStatistics'[False]
+      <dd>stops recording statistics.
+
+      <dt>'NatlangStatistics'["Reset"]
+      <dd>forgets the statistics recorded so far.
+    </dl>
+
+    Statistics are recorded from the start if the environment variable \
+    'MATHICS3_NATLANG_STATISTICS' is set. They give, under "Calls", the \
+    number of calls of each builtin and of the engines behind them, their \
+    total time in seconds, the number of characters they processed and a \
+    histogram of their latencies; under "Loads", the number and total time \
+    of the loads of models and tables; and under "Caches", the hits and \
+    misses of the caches.
+
+    >> NatlangStatistics[True]; NatlangStatistics["Reset"];
+    >> WordStem[{"towers", "houses"}];
+    >> Keys["Calls" /. NatlangStatistics[]]
+     = {WordStem}
+    >> "Calls" /. ("WordStem" /. ("Calls" /. NatlangStatistics[]))
+     = 1
+    >> NatlangStatistics[False];
+    """
+
+    messages = {
+        "arg": 'Argument `1` should be True, False or "Reset".',
+    }
+
+    summary_text = "report the time spent in the natlang builtins"
+
+    def eval(self, evaluation: Evaluation):
+        "NatlangStatistics[]"
+        return from_python(instrumentation.statistics())
+
+    def eval_set(self, flag, evaluation: Evaluation):
+        "NatlangStatistics[flag_]"
+        if flag is SymbolTrue or flag is SymbolFalse:
+            instrumentation.enable(flag is SymbolTrue)
+        elif flag.get_string_value() == "Reset":
+            instrumentation.reset()
+        else:
+            evaluation.message(self.get_name(), "arg", flag)
+            return
+        return SymbolNull
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local server holding the natlang models for several Mathics3 kernels.
+
+Each kernel loads its own spaCy models, WordNet reader and spelling
+dictionaries. Started with::
+
+    python -m pymathics.natlang.server [socket]
+
+one process holds them for all the kernels of a host. When the environment
+variable MATHICS3_NATLANG_SERVER names the Unix socket of a running server,
+kernels send it the texts to parse and the words to correct or to look up
+in a thesaurus. When it is not set, or the server cannot be reached, they
+do the work themselves.
+
+A request is a JSON object. The response is a JSON object, followed by the
+parsed documents as a spaCy ``DocBin`` if it says it is ``binary``. Each is
+sent as a frame: its length, on four bytes, and its data.
+"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from pymathics.natlang.util import NatlangError
+
+# Don't consider this for user documentation
+no_doc = True
+
+_frame_header = struct.Struct("!I")
+
+# Seconds to wait for the server to answer a request before doing the work
+# in-process.
+request_timeout = 30.0
+
+_connections = threading.local()
+
+
+def socket_path() -> Optional[str]:
+    return os.environ.get("MATHICS3_NATLANG_SERVER") or None
+
+
+def _send(connection: socket.socket, data: bytes):
+    connection.sendall(_frame_header.pack(len(data)) + data)
+
+
+def _receive(stream) -> bytes:
+    header = stream.read(_frame_header.size)
+    if len(header) < _frame_header.size:
+        raise ConnectionError("connection closed")
+    (size,) = _frame_header.unpack(header)
+    data = stream.read(size)
+    if len(data) < size:
+        raise ConnectionError("connection closed")
+    return data
+
+
+def _close_connection():
+    connection = getattr(_connections, "connection", None)
+    _connections.connection = None
+    if connection is not None:
+        connection[1].close()
+        connection[0].close()
+
+
+def request(op: str, **arguments) -> Optional[Tuple[dict, Optional[bytes]]]:
+    """
+    Send a request to the server, if there is one. Return the response and
+    its binary data, or None when the request should be handled in-process;
+    raise NatlangError when the server could not do the work.
+    """
+    path = socket_path()
+    if path is None:
+        return None
+    try:
+        connection = getattr(_connections, "connection", None)
+        if connection is None:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                client.settimeout(request_timeout)
+                client.connect(path)
+            except OSError:
+                client.close()
+                raise
+            connection = _connections.connection = (client, client.makefile("rb"))
+        client, stream = connection
+        client.settimeout(request_timeout)
+        _send(client, json.dumps(dict(arguments, op=op)).encode("utf-8"))
+        response = json.loads(_receive(stream))
+        data = _receive(stream) if response.get("binary") else None
+    except (socket.timeout, OSError, ValueError):
+        # The answer to a request that timed out may still come: the
+        # connection is dropped so that it is not read as the next one.
+        _close_connection()
+        return None
+    if "error" in response:
+        return None
+    if "failure" in response:
+        raise NatlangError(*response["failure"])
+    return response, data
+
+
+class _Batcher:
+    """
+    Queue of texts to parse with one model. A thread parses the texts queued
+    by every connection together, once ``wait`` seconds have passed since the
+    first one or ``size`` texts are queued.
+    """
+
+    def __init__(self, parse: Callable[[List[str]], list], wait: float, size: int):
+        self._parse = parse
+        self._queue = queue.Queue()
+        self.wait = wait
+        self.size = size
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, texts: List[str]) -> Future:
+        future = Future()
+        self._queue.put((texts, future))
+        return future
+
+    def _run(self):
+        while True:
+            jobs = [self._queue.get()]
+            count = len(jobs[0][0])
+            deadline = time.monotonic() + self.wait
+            while count < self.size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    jobs.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+                count += len(jobs[-1][0])
+
+            try:
+                docs = self._parse([text for texts, _ in jobs for text in texts])
+            except Exception as e:
+                for _, future in jobs:
+                    future.set_exception(e)
+                continue
+            start = 0
+            for texts, future in jobs:
+                future.set_result(docs[start : start + len(texts)])
+                start += len(texts)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                message = json.loads(_receive(self.rfile))
+            except (ConnectionError, ValueError):
+                return
+            data = None
+            try:
+                response, data = self.server.answer(message)
+            except NatlangError as e:
+                response = {"failure": [str(e), e.tag, *e.arguments]}
+            except Exception as e:
+                response = {"error": "%s: %s" % (type(e).__name__, e)}
+            response["binary"] = data is not None
+            try:
+                _send(self.connection, json.dumps(response).encode("utf-8"))
+                if data is not None:
+                    _send(self.connection, data)
+            except OSError:
+                return
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Server answering the requests of the kernels of a host, each connection
+    in its own thread.
+    """
+
+    daemon_threads = True
+
+    # Texts to parse are batched for at most batch_wait seconds.
+    batch_wait = 0.005
+    batch_size = 256
+
+    def __init__(self, path: str):
+        super().__init__(path, _Handler)
+        self._batchers = {}
+        self._lock = threading.Lock()
+
+    def server_bind(self):
+        # The socket is created accessible to its owner only, rather than
+        # restricted once anyone could have connected to it.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def _batcher(self, model, key) -> _Batcher:
+        with self._lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                disable = list(key[1])
+                batcher = self._batchers[key] = _Batcher(
+                    lambda texts: list(model.pipe(texts, disable=disable)),
+                    self.batch_wait,
+                    self.batch_size,
+                )
+        return batcher
+
+    def answer(self, message: dict) -> Tuple[dict, Optional[bytes]]:
+        op = message["op"]
+        if op == "parse":
+            from spacy.tokens import DocBin
+
+            from pymathics.natlang.spacy import _model
+
+            language_code = message["language"]
+            model = _model(language_code)
+            key = (language_code, tuple(message.get("disable", ())))
+            docs = self._batcher(model, key).submit(message["texts"]).result()
+            return {"result": True}, DocBin(docs=docs).to_bytes()
+        elif op == "spelling":
+            from pymathics.natlang.textual_analysis import _local_corrections
+
+            corrections = _local_corrections(
+                message["words"], message["method"], message["language"]
+            )
+            return {"result": [list(corrections(w)) for w in message["words"]]}, None
+        elif op == "related":
+            from pymathics.natlang.linguistic_data import _related_words
+
+            related = _related_words(
+                message["words"], message["language"], message["relation"]
+            )
+            return {"result": [related[word] for word in message["words"]]}, None
+        raise ValueError("unknown request %s" % op)
+
+
+def main(argv: Optional[List[str]] = None):
+    arguments = sys.argv[1:] if argv is None else argv
+    path = arguments[0] if arguments else socket_path()
+    if path is None:
+        sys.exit("usage: python -m pymathics.natlang.server socket")
+
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            sys.exit("%s exists and is not a socket" % path)
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+            sys.exit("a server is already listening on %s" % path)
+        except OSError:
+            os.unlink(path)  # left by a server that stopped
+        finally:
+            probe.close()
+
+    with Server(path) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
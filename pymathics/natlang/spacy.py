@@ -9,16 +9,21 @@ Spacy tools
 
 import heapq
 import re
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 import spacy
 
 from mathics.core.atoms import String
-from mathics.core.builtin import Builtin
 from mathics.core.evaluation import Evaluation
 from mathics.core.symbols import strip_context
-from mathics.core.systemsymbols import SymbolAlternatives
-from spacy.tokens import Span
+from mathics.core.systemsymbols import SymbolAlternatives, SymbolAutomatic
+from spacy.tokens import DocBin, Span, Token
+
+from pymathics.natlang import profiling
+from pymathics.natlang.instrumentation import _InstrumentedBuiltin, timed
+from pymathics.natlang.langid import language_spans
+from pymathics.natlang.server import request
+from pymathics.natlang.util import NatlangError, load_once, string_table
 
 no_doc = True
 
@@ -135,10 +140,8 @@ def _make_forms():
         "Sentence": lambda doc: (sent for sent in doc.sents),
         "Paragraph": lambda doc: _fragments(doc, re.compile(r"^[\n][\n]+$")),
         "Line": lambda doc: _fragments(doc, re.compile(r"^[\n]$")),
-        "URL": lambda doc: (token for token in doc if token.orth_.like_url()),
-        "EmailAddress": lambda doc: (
-            token for token in doc if token.orth_.like_email()
-        ),
+        "URL": lambda doc: (token for token in doc if token.like_url),
+        "EmailAddress": lambda doc: (token for token in doc if token.like_email),
     }
 
     def filter_named_entity(label):
@@ -180,7 +183,99 @@ def _position(t):
         return 1 + t.idx, t.idx + len(t.text)
 
 
-class _SpacyBuiltin(Builtin):
+def _strings(docs: list, items: Callable[..., Iterable]) -> Iterator[String]:
+    """
+    Yield the shared String atoms of the tokens and spans ``items(doc)`` of
+    each of ``docs``. Tokens are looked up by the orth of their lexeme, so
+    that the text of a word already seen is not built again.
+    """
+    for doc in docs:
+        table = string_table(doc.lang_)
+        for item in items(doc):
+            if isinstance(item, Token):
+                atom = table.get(item.orth)
+                if atom is None:
+                    atom = table.add(item.orth, item.text)
+                yield atom
+            else:
+                yield table.string(item.text)
+
+
+# Languages with a spaCy model, and the codes of their models.
+_language_codes = {
+    "English": "en",
+    "German": "de",
+}
+
+_model_names = {
+    "en": "en_core_web_md",
+    "de": "de_core_news_md",
+}
+
+_spacy_instances = {}
+_vocabularies = {}
+
+
+def _model(language_code: str) -> spacy.language.Language:
+    """
+    Return the spaCy model of ``language_code``, loaded once.
+    """
+    if language_code not in _model_names:
+        raise NatlangError(
+            'language "%s" has no spaCy model' % language_code, "lang", language_code
+        )
+
+    def load():
+        try:
+            instance = spacy.load(_model_names[language_code])
+
+            # "via" parameter no longer exists. This was used in MATHICS3_SPACY_DATA
+            # if "MATHICS3_SPACY_DATA" in os.environ:
+            #     instance = spacy.load(
+            #         language_code, via=os.environ["MATHICS3_SPACY_DATA"]
+            #     )
+            # else:
+            #     instance = spacy.load(f"{language_code}_core_web_md")
+
+            return instance
+        except (OSError, RuntimeError) as e:
+            raise NatlangError(str(e), "runtime", str(e))
+
+    return load_once(_spacy_instances, language_code, load)
+
+
+def _vocab(language_code: str) -> spacy.vocab.Vocab:
+    """
+    Return the vocabulary of a blank pipeline for the language, which
+    has the lexical attributes of the words without loading a model.
+    """
+    return load_once(
+        _vocabularies,
+        language_code,
+        lambda: spacy.blank(language_code).vocab,
+    )
+
+
+@timed(
+    "spaCy pipe",
+    size=lambda language_code, texts, *args, **kwargs: sum(map(len, texts)),
+)
+def _pipe(language_code: str, texts: list, disable=(), remote: bool = True) -> list:
+    """
+    Return the docs of ``texts``, parsed by the natlang server if one is
+    running and ``remote`` is true, or else by the model of the language.
+    """
+    if remote:
+        response = request(
+            "parse", language=language_code, texts=texts, disable=list(disable)
+        )
+        if response is not None:
+            doc_bin = DocBin().from_bytes(response[1])
+            return list(doc_bin.get_docs(_vocab(language_code)))
+    return profiling.pipe(_model(language_code), texts, disable)
+
+
+class _SpacyBuiltin(_InstrumentedBuiltin):
     requires = ("spacy",)
 
     options = {
@@ -192,59 +287,93 @@ class _SpacyBuiltin(Builtin):
         "lang": 'Language "`1`" is currently not supported with `2`[].',
     }
 
-    _language_codes = {
-        "English": "en",
-        "German": "de",
-    }
-
-    _spacy_instances = {}
+    # Whether the work can be sent to the natlang server.
+    _remote = True
 
     def _load_spacy(self, evaluation: Evaluation, options: dict):
-        language_code = None
+        language_code = self._language_code(evaluation, options)
+        if not language_code:
+            return None
+        return self._spacy_model(language_code, evaluation)
+
+    def _language_code(self, evaluation: Evaluation, options: dict) -> Optional[str]:
         language_name = self.get_option(options, "Language", evaluation)
         if language_name is None:
             language_name = String("Undefined")
+        return self._spacy_language_code(language_name, evaluation)
+
+    def _spacy_language_code(
+        self, language_name, evaluation: Evaluation
+    ) -> Optional[str]:
+        language_code = None
         if isinstance(language_name, String):
-            language_code = _SpacyBuiltin._language_codes.get(language_name.value)
+            language_code = _language_codes.get(language_name.value)
         if not language_code:
             evaluation.message(
                 self.get_name(), "lang", language_name, strip_context(self.get_name())
             )
             return None
+        return language_code
 
-        instance = _SpacyBuiltin._spacy_instances.get(language_code)
-        if instance:
-            return instance
-
+    def _spacy_model(self, language_code: str, evaluation: Evaluation):
         try:
-            instance = spacy.load(f"{language_code}_core_web_md")
-
-            # "via" parameter no longer exists. This was used in MATHICS3_SPACY_DATA
-            # if "MATHICS3_SPACY_DATA" in os.environ:
-            #     instance = spacy.load(
-            #         language_code, via=os.environ["MATHICS3_SPACY_DATA"]
-            #     )
-            # else:
-            #     instance = spacy.load(f"{language_code}_core_web_md")
+            return _model(language_code)
+        except NatlangError as e:
+            e.message(self.get_name(), evaluation)
+            return None
 
-            _SpacyBuiltin._spacy_instances[language_code] = instance
-            return instance
-        except RuntimeError as e:
-            evaluation.message(self.get_name(), "runtime", str(e))
+    def _parse(
+        self, language_code: str, texts: list, evaluation: Evaluation, disable=()
+    ) -> Optional[list]:
+        """
+        Return the docs of ``texts``, or None, with a message, if they
+        cannot be parsed.
+        """
+        try:
+            return _pipe(language_code, texts, disable, self._remote)
+        except NatlangError as e:
+            e.message(self.get_name(), evaluation)
             return None
 
     def _nlp(self, text, evaluation, options) -> Optional[spacy.tokens.doc.Doc]:
-        nlp = self._load_spacy(evaluation, options)
-        if not nlp:
+        language_code = self._language_code(evaluation, options)
+        if not language_code:
             return None
-        return nlp(text)
+        docs = self._parse(language_code, [text], evaluation)
+        return docs[0] if docs else None
+
+    def _docs(self, text: str, evaluation: Evaluation, options: dict) -> Optional[list]:
+        """
+        Return the docs of ``text``. With ``Language -> Automatic``, the
+        language of each run of sentences is identified, the runs of each
+        language are parsed in one batch by the model of that language, and
+        their docs are returned in the order of the text.
+        """
+        if self.get_option(options, "Language", evaluation) is not SymbolAutomatic:
+            doc = self._nlp(text, evaluation, options)
+            return [doc] if doc else None
+
+        codes = frozenset(_language_codes.values())
+        spans = list(language_spans(text, "Sentence", codes))
+        runs = {}
+        for i, (start, end, code, _) in enumerate(spans):
+            runs.setdefault(code, []).append(i)
+        docs = [None] * len(spans)
+        for code, indices in runs.items():
+            texts = [text[spans[i][0] : spans[i][1]] for i in indices]
+            run_docs = self._parse(code, texts, evaluation)
+            if run_docs is None:
+                return None
+            for i, doc in zip(indices, run_docs):
+                docs[i] = doc
+        return docs or None
 
     def _is_stop_lambda(self, evaluation: Evaluation, options: dict):
-        nlp = self._load_spacy(evaluation, options)
-        if not nlp:
+        language_code = self._language_code(evaluation, options)
+        if not language_code:
             return None
 
-        vocab = nlp.vocab
+        vocab = _vocab(language_code)
 
         def is_stop(word):
             return vocab[word].is_stop
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+"""
+Spelling correction with a symmetric delete index over a word list.
+"""
+
+import hashlib
+import mmap
+import zlib
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from pymathics.natlang.util import cached_file, write_atomically
+
+# Don't consider this for user documentation
+no_doc = True
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """
+    Return ``word`` and the strings obtained by deleting up to
+    ``max_distance`` of its characters.
+    """
+    deletes = {word}
+    edge = [word]
+    for _ in range(max_distance):
+        edge = [
+            item[:i] + item[i + 1 :]
+            for item in edge
+            if len(item) > 1
+            for i in range(len(item))
+        ]
+        edge = [item for item in edge if item not in deletes]
+        deletes.update(edge)
+    return deletes
+
+
+def _distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Optimal string alignment distance (Levenshtein distance with
+    transpositions) between ``a`` and ``b``, or None if it is larger than
+    ``max_distance``.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        char = a[i - 1]
+        row_minimum = i
+        for j in range(1, len(b) + 1):
+            distance = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char != b[j - 1]),
+            )
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before_previous[j - 2] + 1)
+            current[j] = distance
+            if distance < row_minimum:
+                row_minimum = distance
+        if row_minimum > max_distance:
+            return None
+        before_previous, previous = previous, current
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+
+def _match_case(word: str, suggestion: str) -> str:
+    if len(word) > 1 and word.isupper():
+        return suggestion.upper()
+    if word[:1].isupper():
+        return suggestion[:1].upper() + suggestion[1:]
+    return suggestion
+
+
+def _key(delete: str) -> int:
+    return zlib.crc32(delete.encode("utf-8"))
+
+
+class SpellingIndex:
+    """
+    Symmetric delete index, as in SymSpell. Every word is indexed under the
+    strings obtained by deleting up to ``max_distance`` characters from its
+    first ``prefix_length`` characters, so that the candidate corrections of
+    a word are found by generating its own deletes.
+
+    The index holds the sorted words, their frequencies and the sorted
+    (CRC-32 of a delete, word number) pairs, and is memory-mapped from a
+    file. Hash collisions only add candidates, and every candidate is checked
+    by computing its edit distance. Suggestions are ranked by edit distance
+    and then by frequency.
+
+    ``check()`` and ``suggest()`` work as those of ``enchant.Dict``.
+    """
+
+    magic = b"NLSPEL01"
+    max_distance = 2
+    prefix_length = 7
+    limit = 10
+
+    def __init__(self, buffer):
+        if buffer[: len(self.magic)] != self.magic:
+            raise ValueError("not a spelling index")
+        self._buffer = buffer
+        view = memoryview(buffer)
+        position = len(self.magic)
+        count, pair_count = view[position : position + 8].cast("I")
+        position += 8
+        self._count = count
+        self._offsets = view[position : position + 4 * (count + 1)].cast("I")
+        position += 4 * (count + 1)
+        self._frequencies = view[position : position + 4 * count].cast("I")
+        position += 4 * count
+        position += -position % 8
+        self._pairs = view[position : position + 8 * pair_count].cast("Q")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _word(self, i: int) -> bytes:
+        return self._buffer[self._offsets[i] : self._offsets[i + 1]]
+
+    def _position(self, word: str) -> Optional[int]:
+        encoded = word.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._word(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._word(low) == encoded:
+            return low
+        return None
+
+    def check(self, word: str) -> bool:
+        return self._position(word.lower()) is not None
+
+    def suggest(self, word: str) -> List[str]:
+        lower = word.lower()
+        candidates = set()
+        pairs = self._pairs
+        for delete in _deletes(lower[: self.prefix_length], self.max_distance):
+            key = _key(delete)
+            start = bisect_left(pairs, key << 32)
+            end = bisect_left(pairs, (key + 1) << 32, start)
+            candidates.update(pair & 0xFFFFFFFF for pair in pairs[start:end])
+
+        ranked = []
+        for i in candidates:
+            candidate = self._word(i).decode("utf-8")
+            distance = _distance(lower, candidate, self.max_distance)
+            if distance is not None:
+                ranked.append((distance, -self._frequencies[i], candidate))
+        ranked.sort()
+        return [_match_case(word, candidate) for _, _, candidate in ranked][
+            : self.limit
+        ]
+
+    @classmethod
+    def encode(cls, frequencies: Dict[str, int]) -> bytes:
+        words = sorted(frequencies)
+        offsets = array("I")
+        position = len(cls.magic) + 8 + 4 * (2 * len(words) + 1)
+        position += -position % 8
+        pairs = array("Q")
+        for i, word in enumerate(words):
+            for delete in _deletes(word[: cls.prefix_length], cls.max_distance):
+                pairs.append(_key(delete) << 32 | i)
+        pairs = array("Q", sorted(pairs))
+        position += 8 * len(pairs)
+
+        encoded_words = [word.encode("utf-8") for word in words]
+        for encoded in encoded_words:
+            offsets.append(position)
+            position += len(encoded)
+        offsets.append(position)
+
+        header = cls.magic + array("I", [len(words), len(pairs)]).tobytes()
+        header += offsets.tobytes()
+        header += array("I", (frequencies[word] for word in words)).tobytes()
+        header += bytes(-len(header) % 8)
+        return header + pairs.tobytes() + b"".join(encoded_words)
+
+    @classmethod
+    def load(
+        cls,
+        language_code: str,
+        words: Sequence[str],
+        frequencies: Callable[[], Dict[str, int]],
+    ) -> "SpellingIndex":
+        """
+        Open the index built from the word list ``words``, building and
+        saving it first if needed, from the frequencies of the words to
+        index. If it cannot be saved, it is kept in memory.
+        """
+        digest = hashlib.sha1(
+            ("%d %d\n" % (cls.max_distance, cls.prefix_length)).encode("utf-8")
+        )
+        digest.update("\n".join(words).encode("utf-8"))
+        name = "spelling-%s-%s.bin" % (language_code, digest.hexdigest()[:16])
+
+        def write(path: str, index: "SpellingIndex"):
+            write_atomically(path, lambda index_file: index_file.write(index._buffer))
+
+        return cached_file(
+            name, cls.open, lambda: cls(cls.encode(frequencies())), write
+        )
+
+    @classmethod
+    def open(cls, path: str) -> "SpellingIndex":
+        with open(path, "rb") as index_file:
+            return cls(mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ))
@@ -8,10 +8,14 @@ https://reference.wolfram.com/language/guide/TextAnalysis.html</url> guide.
 
 # This module uses both enchant, nltk and spacy. Maybe we want to split this further.
 
-from typing import Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
 
 import enchant
 import nltk
+import pycountry
 import spacy
 
 from mathics.core.atoms import Integer, Real, String
@@ -19,11 +23,29 @@ from mathics.core.builtin import Builtin
 from mathics.core.evaluation import Evaluation
 from mathics.core.expression import Expression
 from mathics.core.list import ListExpression
-from mathics.core.symbols import SymbolList, SymbolTrue
+from mathics.core.symbols import SymbolList, SymbolTrue, strip_context
 from mathics.eval.nevaluator import eval_N
-
-from pymathics.natlang.spacy import _SpacyBuiltin
-from pymathics.natlang.util import merge_dictionaries
+from spacy.tokens import Span
+
+from pymathics.natlang.instrumentation import _InstrumentedBuiltin, timed
+from pymathics.natlang.nltk import (
+    _lemma_counts,
+    _morphy_lemmatizer,
+    _WordListBuiltin,
+    _WordNetBuiltin,
+    load_inflections,
+    load_word_table,
+    load_wordnet,
+)
+from pymathics.natlang.server import request
+from pymathics.natlang.spacy import _forms, _pipe, _SpacyBuiltin
+from pymathics.natlang.spelling import SpellingIndex
+from pymathics.natlang.util import (
+    LRUCache,
+    NatlangError,
+    load_once,
+    merge_dictionaries,
+)
 
 sort_order = "Text Analysis"
 
@@ -59,7 +81,326 @@ class Containing(Builtin):
     summary_text = "specify a container for matching"
 
 
-class SpellingCorrectionList(Builtin):
+def _stop_words(language_code: str) -> Sequence[str]:
+    """
+    Return the stop words spaCy knows for the language of the ISO 639-3
+    ``language_code``, without loading any model.
+    """
+    language = pycountry.languages.get(alpha_3=language_code)
+    code = getattr(language, "alpha_2", None)
+    if code:
+        try:
+            return spacy.util.get_lang_class(code).Defaults.stop_words
+        except ImportError:
+            pass
+    return ()
+
+
+def _language_code(language_name: str) -> Optional[str]:
+    """
+    Return the ISO 639-3 code of the language ``language_name``, or None.
+    """
+    language = pycountry.languages.get(name=language_name)
+    return getattr(language, "alpha_3", None)
+
+
+def _unsupported(engine: str, language_code: str) -> NatlangError:
+    return NatlangError(
+        'language "%s" is not supported by %s' % (language_code, engine),
+        "lang",
+        language_code,
+    )
+
+
+# The enchant dictionaries of the languages, by ISO 639-3 code.
+_enchant_languages = {
+    "eng": "en_US",  # en_GB, en_AU
+    "deu": "de_DE",
+    "fra": "fr_FR",
+}
+
+spelling_methods = ("Enchant", "SymSpell")
+
+_thread_dictionaries = threading.local()
+_spelling_indexes = {}
+_suggestions = {}
+_spelling_executor = None
+_spelling_executor_lock = threading.Lock()
+
+# Number of suggestion lists kept for each language and method.
+suggestions_cache_size = 4096
+spelling_workers = min(8, os.cpu_count() or 1)
+
+
+def _enchant_dictionary(locale: str):
+    # An enchant dictionary cannot be shared between threads.
+    dictionaries = _thread_dictionaries.__dict__
+    d = dictionaries.get(locale)
+    if d is None:
+        d = dictionaries[locale] = enchant.Dict(locale)
+    return d
+
+
+def _map(function, words: list) -> list:
+    """
+    Apply ``function`` to ``words`` on a pool of threads, which enchant runs
+    in parallel as it releases the GIL.
+    """
+    global _spelling_executor
+    if len(words) < 2:
+        return [function(word) for word in words]
+    with _spelling_executor_lock:
+        if _spelling_executor is None:
+            _spelling_executor = ThreadPoolExecutor(
+                spelling_workers, thread_name_prefix="natlang-spelling"
+            )
+    return list(_spelling_executor.map(function, words))
+
+
+def _spelling_index(language_code: str) -> SpellingIndex:
+    """
+    Return the symmetric delete index of the WordNet words of
+    ``language_code``, an ISO 639-3 code.
+    """
+    index = _spelling_indexes.get(language_code)
+    if index is not None:
+        return index
+
+    wordnet = load_wordnet(language_code)
+    word_table = load_word_table(language_code)
+
+    def load():
+        return SpellingIndex.load(language_code, word_table.words, frequencies)
+
+    def frequencies():
+        counts = _lemma_counts(wordnet) if language_code == "eng" else {}
+        result = {}
+
+        def add(word, count):
+            if "_" not in word and " " not in word:
+                result[word] = max(result.get(word, 0), count)
+
+        for lemma in word_table.words:
+            add(lemma.lower(), counts.get(lemma, 0))
+
+        # WordNet only has base forms, so the inflected forms of English
+        # lemmas are added with the counts of their lemmas.
+        if language_code == "eng":
+            inflections = load_inflections()
+            for lemma in word_table.subset("Noun"):
+                add(inflections.plural(lemma), counts.get(lemma, 0))
+            for lemma in word_table.subset("Verb"):
+                for form in inflections.verb_forms(lemma):
+                    add(form, counts.get(lemma, 0))
+            for lemma in word_table.subset("Adjective"):
+                for form in inflections.adjective_forms(lemma):
+                    add(form, counts.get(lemma, 0))
+
+        # Neither are function words; they are the most frequent ones.
+        top = max(result.values(), default=0) + 1
+        for word in _stop_words(language_code):
+            if word.isalpha():
+                add(word, top)
+        return result
+
+    return load_once(_spelling_indexes, language_code, load)
+
+
+def _spelling_corrections(
+    words: list, method: str, language_code: str
+) -> Callable[[str], Optional[tuple]]:
+    """
+    Return a function giving the suggestions of ``method``, one of
+    ``spelling_methods``, for a word in ``words``, which the natlang server
+    computes if one is running.
+    """
+    if method not in spelling_methods:
+        raise ValueError("unknown spelling method %s" % method)
+    words = list(dict.fromkeys(words))
+    response = request("spelling", method=method, language=language_code, words=words)
+    if response is not None:
+        return dict(zip(words, map(tuple, response[0]["result"]))).get
+    return _local_corrections(words, method, language_code)
+
+
+def _local_corrections(
+    words: list, method: str, language_code: str
+) -> Callable[[str], Optional[tuple]]:
+    """
+    Compute the suggestions for ``words`` once for each distinct word not
+    already in the cache.
+    """
+    if method == "Enchant":
+        locale = _enchant_languages.get(language_code)
+        if locale is None:
+            raise _unsupported("enchant", language_code)
+
+        def correct(word):
+            d = _enchant_dictionary(locale)
+            return (word,) if d.check(word) else tuple(d.suggest(word))
+
+        parallel = True
+    elif method == "SymSpell":
+        index = _spelling_index(language_code)
+
+        def correct(word):
+            return (word,) if index.check(word) else tuple(index.suggest(word))
+
+        # The index is pure Python, so threads would not help.
+        parallel = False
+    else:
+        raise ValueError("unknown spelling method %s" % method)
+
+    key = (method, language_code)
+    cache = load_once(
+        _suggestions,
+        key,
+        lambda: LRUCache(suggestions_cache_size, "Spelling %s %s" % key),
+    )
+
+    found = {}
+    missing = []
+    for word in dict.fromkeys(words):
+        if not word:
+            found[word] = ()
+            continue
+        suggestions = cache.get(word)
+        if suggestions is None:
+            missing.append(word)
+        else:
+            found[word] = suggestions
+    for word, suggestions in zip(missing, _suggest(correct, missing, parallel)):
+        cache[word] = found[word] = suggestions
+    return found.get
+
+
+@timed(
+    "Spelling suggestions",
+    size=lambda correct, words, parallel: sum(map(len, words)),
+)
+def _suggest(correct, words: list, parallel: bool) -> list:
+    if parallel:
+        return _map(correct, words)
+    return [correct(word) for word in words]
+
+
+class _SpellingBuiltin(_WordListBuiltin):
+    """
+    Common code for the builtins that correct the spelling of words, with
+    enchant or with a symmetric delete index of the WordNet words.
+    """
+
+    options = merge_dictionaries(
+        _WordListBuiltin.options,
+        {
+            "Method": '"Enchant"',
+        },
+    )
+
+    messages = merge_dictionaries(
+        _WordListBuiltin.messages,
+        {
+            "method": 'Method `1` should be "Enchant" or "SymSpell".',
+        },
+    )
+
+    methods = spelling_methods
+
+    def _corrections(self, words, evaluation: Evaluation, options: dict):
+        """
+        Return a function giving the suggestions for a word in ``words``,
+        with the method and language set by ``options``.
+        """
+        language_name = self.get_option(options, "Language", evaluation)
+        if not isinstance(language_name, String):
+            return
+
+        method = self.get_option(options, "Method", evaluation)
+        py_method = method.get_string_value()
+        if py_method not in self.methods:
+            evaluation.message(self.get_name(), "method", method)
+            return
+        language_code = self._wordnet_language_code(language_name, evaluation)
+        if language_code is None:
+            return
+        try:
+            return _spelling_corrections(words, py_method, language_code)
+        except NatlangError as e:
+            e.message(self.get_name(), evaluation, language_name)
+
+
+class SpellingCorrect(_SpellingBuiltin, _SpacyBuiltin):
+    """
+    <url>:Spelling correction:
+    https://en.wikipedia.org/wiki/Spell_checker</url>
+
+    <dl>
+      <dt>'SpellingCorrect'[$text$]
+      <dd>returns $text$ with each misspelled word replaced by its first \
+          spelling correction.
+    </dl>
+
+    Stop words, numbers, URLs, e-mail addresses and named entities are left \
+    as they are, and so is the spacing of $text$. The options are those of \
+    'SpellingCorrectionList'.
+
+    >> SpellingCorrect["The hipopotamus lives in Africa."]
+     = The hippopotamus lives in Africa.
+    """
+
+    messages = merge_dictionaries(_SpacyBuiltin.messages, _SpellingBuiltin.messages)
+    requires = ("enchant", "nltk", "spacy")
+    summary_text = "correct the spelling of the words in a text"
+
+    # Forms whose tokens are not checked.
+    _skipped_forms = (
+        "URL",
+        "EmailAddress",
+        "Number",
+        "Person",
+        "Company",
+        "Quantity",
+        "CurrencyAmount",
+        "Country",
+    )
+
+    def eval(self, text: String, evaluation: Evaluation, options: dict):
+        "SpellingCorrect[text_String, OptionsPattern[SpellingCorrect]]"
+        doc = self._nlp(text.value, evaluation, options)
+        if doc is None:
+            return
+        skipped = set()
+        for form in self._skipped_forms:
+            for t in _forms[form](doc):
+                if isinstance(t, Span):
+                    skipped.update(range(t.start, t.end))
+                else:
+                    skipped.add(t.i)
+        candidates = [
+            token
+            for token in doc
+            if token.is_alpha and not token.is_stop and token.i not in skipped
+        ]
+
+        corrections = self._corrections(
+            [token.text for token in candidates], evaluation, options
+        )
+        if corrections is None:
+            return
+        replacements = {}
+        for token in candidates:
+            suggestions = corrections(token.text)
+            if suggestions:
+                replacements[token.i] = suggestions[0]
+        return String(
+            "".join(
+                replacements.get(token.i, token.text) + token.whitespace_
+                for token in doc
+            )
+        )
+
+
+class SpellingCorrectionList(_SpellingBuiltin):
     """
     <url>:WMA link:
     https://reference.wolfram.com/language/ref/SpellingCorrectionList.html</url>
@@ -67,56 +408,59 @@ class SpellingCorrectionList(Builtin):
     <dl>
       <dt>'SpellingCorrectionList'[$word$]
       <dd>returns a list of suggestions for spelling corrected versions of $word$.
+
+      <dt>'SpellingCorrectionList'[{$word_1$, $word_2$, ...}]
+      <dd>returns the list of suggestions for each $word_i$.
     </dl>
 
     Results may differ depending on which dictionaries can be found by enchant.
 
     >> SpellingCorrectionList["hipopotamus"]
      = {hippopotamus...}
-    """
-
-    options = {
-        "Language": '"English"',
-    }
 
-    messages = {
-        "lang": "SpellingCorrectionList does not support `1` as a language.",
-    }
-
-    _languages = {
-        "English": "en_US",  # en_GB, en_AU
-        "German": "de_DE",
-        "French": "fr_FR",
-    }
+    With 'Method -> "SymSpell"', suggestions come from an index of the \
+    WordNet words of the language instead, ranked by edit distance and \
+    frequency. The index is built once and kept in the cache directory:
+    >> SpellingCorrectionList["hipopotamus", Method -> "SymSpell"]
+     = {hippopotamus...}
 
-    _dictionaries = {}
+    Each distinct word of a list is looked up once, and recent results are \
+    cached:
+    >> SpellingCorrectionList[{"hipopotamus", "couch", "hipopotamus"}]
+     = {{hippopotamus...}, {couch}, {hippopotamus...}}
+    """
 
+    messages = merge_dictionaries(
+        _SpellingBuiltin.messages,
+        {
+            "lang": "SpellingCorrectionList does not support `1` as a language.",
+        },
+    )
     summary_text = "look for spelling correction candidates of a word"
 
     def eval(
         self, word: String, evaluation: Evaluation, options: dict
     ) -> Optional[ListExpression]:
         "SpellingCorrectionList[word_String, OptionsPattern[SpellingCorrectionList]]"
+        corrections = self._corrections([word.value], evaluation, options)
+        if corrections is not None:
+            return ListExpression(*(String(w) for w in corrections(word.value)))
 
-        language_name = self.get_option(options, "Language", evaluation)
-        if not isinstance(language_name, String):
-            return
-        language_code = SpellingCorrectionList._languages.get(language_name.value, None)
-        if not language_code:
-            evaluation.message("SpellingCorrectionList", "lang", language_name)
+    def eval_list(
+        self, words, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        "SpellingCorrectionList[words_List, OptionsPattern[SpellingCorrectionList]]"
+        if not all(isinstance(w, String) for w in words.elements):
             return
-
-        d = SpellingCorrectionList._dictionaries.get(language_code, None)
-        if not d:
-            d = enchant.Dict(language_code)
-            SpellingCorrectionList._dictionaries[language_code] = d
-
-        py_word = word.value
-
-        if d.check(py_word):
-            return ListExpression(word)
-        else:
-            return ListExpression(*(String(word) for word in d.suggest(py_word)))
+        py_words = [w.value for w in words.elements]
+        corrections = self._corrections(py_words, evaluation, options)
+        if corrections is not None:
+            return ListExpression(
+                *(
+                    ListExpression(*(String(w) for w in corrections(py_word)))
+                    for py_word in py_words
+                )
+            )
 
 
 class WordCount(_SpacyBuiltin):
@@ -235,6 +579,9 @@ class WordSimilarity(_SpacyBuiltin):
     )
     summary_text = "measure similarity of two texts"
 
+    # The natlang server does not send the word vectors similarities need.
+    _remote = False
+
     def eval(
         self, text1: String, text2: String, evaluation: Evaluation, options: dict
     ) -> Optional[Real]:
@@ -294,7 +641,68 @@ class WordSimilarity(_SpacyBuiltin):
                     return result[0]
 
 
-class WordStem(Builtin):
+_stem_functions = {}
+_tokenizers = {}
+
+# Number of stems kept for each language.
+stem_cache_size = 65536
+
+
+def _stem_function(language_code: str) -> Callable[[str], str]:
+    """
+    Return a function stemming words of ``language_code``, an ISO 639-3
+    code, which remembers the most recent stems.
+    """
+
+    def load():
+        language = pycountry.languages.get(alpha_3=language_code)
+        name = language.name.lower() if language else None
+        if name == "english":
+            stemmer = nltk.stem.porter.PorterStemmer()
+        elif name in nltk.stem.SnowballStemmer.languages:
+            stemmer = nltk.stem.SnowballStemmer(name)
+        else:
+            raise _unsupported("the NLTK stemmers", language_code)
+        cache = LRUCache(stem_cache_size, "Stems " + language_code)
+
+        def stem(word: str) -> str:
+            result = cache.get(word)
+            if result is None:
+                result = cache[word] = stemmer.stem(word)
+            return result
+
+        return stem
+
+    return load_once(_stem_functions, language_code, load)
+
+
+def _tokenizer(language_code: str):
+    def load():
+        language = pycountry.languages.get(alpha_3=language_code)
+        code = getattr(language, "alpha_2", None)
+        try:
+            return spacy.blank(code or "xx").tokenizer
+        except (ImportError, ValueError):
+            return spacy.blank("xx").tokenizer  # multi-language
+
+    return load_once(_tokenizers, language_code, load)
+
+
+def _stem_text(text: str, stem: Callable[[str], str], language_code: str) -> str:
+    """
+    Return the stem of the word ``text``, or, if it contains whitespace, the
+    text with each of its alphabetic tokens stemmed.
+    """
+    if not any(c.isspace() for c in text):
+        return stem(text)
+    doc = _tokenizer(language_code)(text)
+    return "".join(
+        (stem(token.text) if token.is_alpha else token.text) + token.whitespace_
+        for token in doc
+    )
+
+
+class WordStem(_InstrumentedBuiltin):
     """
     <url>:WMA link:
     https://reference.wolfram.com/language/ref/WordStem.html</url>
@@ -305,39 +713,327 @@ class WordStem(Builtin):
 
       <dt>'WordStem'[{$word_1$, $word_2$, ...}]
       <dd>returns a stemmed form for list of $word$, thereby reducing an inflected form to its root.
+
+      <dt>'WordStem'[$text$]
+      <dd>returns $text$ with each of its words stemmed.
     </dl>
 
+    English words are stemmed with the Porter stemmer; the option 'Language' \
+    selects a Snowball stemmer for other languages.
+
+    A string is taken as a text when it contains whitespace. A text is split \
+    into tokens, its alphabetic tokens are stemmed, and its punctuation and \
+    spacing are kept; any other string is stemmed whole, as a single word.
+
     >> WordStem["towers"]
      = tower
 
     >> WordStem[{"heroes", "roses", "knights", "queens"}]
      = {hero, rose, knight, queen}
+
+    >> WordStem["The knights ride their horses."]
+     = the knight ride their hors.
+
+    >> WordStem["caminando", Language -> "Spanish"]
+     = camin
     """
 
-    _stemmer = None
+    options = {
+        "Language": '"English"',
+    }
+
+    messages = {
+        "lang": 'Language "`1`" is currently not supported with `2`[].',
+    }
 
     requires = ("nltk",)
     summary_text = "retrieve the stem of a word"
 
-    @staticmethod
-    def _get_porter_stemmer():
-        if WordStem._stemmer is None:
-            WordStem._stemmer = nltk.stem.porter.PorterStemmer()
-        return WordStem._stemmer
-
     @staticmethod
     def porter(w):
-        return WordStem._get_porter_stemmer().stem(w)
+        return _stem_function("eng")(w)
 
-    def eval(self, word: String, evaluation: Evaluation) -> String:
-        "WordStem[word_String]"
-        stemmer = self._get_porter_stemmer()
-        return String(stemmer.stem(word.value))
+    def _stem(self, evaluation: Evaluation, options: dict) -> Optional[tuple]:
+        """
+        Return the stemming function of the language set by ``options``,
+        and the code of the language.
+        """
+        language_name = self.get_option(options, "Language", evaluation)
+        language_code = None
+        if isinstance(language_name, String):
+            language_code = _language_code(language_name.value)
+        if language_code is not None:
+            try:
+                return _stem_function(language_code), language_code
+            except NatlangError:
+                pass
+        evaluation.message(
+            self.get_name(), "lang", language_name, strip_context(self.get_name())
+        )
+        return None
+
+    def eval(self, word: String, evaluation: Evaluation, options: dict) -> String:
+        "WordStem[word_String, OptionsPattern[WordStem]]"
+        stemmer = self._stem(evaluation, options)
+        if stemmer is None:
+            return
+        stem, language_code = stemmer
+        return String(_stem_text(word.value, stem, language_code))
 
-    def eval_list(self, words, evaluation: Evaluation) -> Optional[ListExpression]:
-        "WordStem[words_List]"
+    def eval_list(
+        self, words, evaluation: Evaluation, options: dict
+    ) -> Optional[ListExpression]:
+        "WordStem[words_List, OptionsPattern[WordStem]]"
         if all(isinstance(w, String) for w in words.elements):
-            stemmer = self._get_porter_stemmer()
-            return ListExpression(
-                *[String(stemmer.stem(w.value)) for w in words.elements]
+            stemmer = self._stem(evaluation, options)
+            if stemmer is None:
+                return
+            stem, language_code = stemmer
+            # Each distinct string is stemmed once.
+            stems = {}
+            for w in words.elements:
+                if w.value not in stems:
+                    stems[w.value] = String(_stem_text(w.value, stem, language_code))
+            return ListExpression(*[stems[w.value] for w in words.elements])
+
+
+lemma_methods = ("Lookup", "Rule")
+
+_lookup_functions = {}
+
+# Number of lemmas kept for each language.
+lemma_cache_size = 65536
+
+
+def _lemma_table(language_code: str):
+    """
+    Return spaCy's lemma lookup table for ``language_code``, or None if
+    there is none.
+    """
+    language = pycountry.languages.get(alpha_3=language_code)
+    code = getattr(language, "alpha_2", None)
+    if not code:
+        return None
+    try:
+        nlp = spacy.blank(code)
+        nlp.add_pipe("lemmatizer", config={"mode": "lookup"})
+        # The tables come with the spacy-lookups-data package.
+        nlp.initialize()
+        return nlp.get_pipe("lemmatizer").lookups.get_table("lemma_lookup")
+    except (ImportError, ValueError):
+        return None
+
+
+def _lookup_function(language_code: str) -> Callable[[str], str]:
+    """
+    Return a function giving the lemma of a word of ``language_code``, an
+    ISO 639-3 code, from spaCy's lookup table for the language, or, for
+    English, from the base forms WordNet finds. Neither needs a tagger or a
+    parser.
+    """
+
+    def load():
+        table = _lemma_table(language_code)
+        if table is not None:
+
+            def lookup(word: str) -> Optional[str]:
+                return table.get(word) or table.get(word.lower())
+
+        elif language_code == "eng":
+            lookup = _morphy_lemmatizer(load_wordnet(language_code))
+        else:
+            raise _unsupported("the lemma tables", language_code)
+
+        cache = LRUCache(lemma_cache_size, "Lemmas " + language_code)
+
+        def lemma(word: str) -> str:
+            result = cache.get(word)
+            if result is None:
+                result = cache[word] = lookup(word) or word
+            return result
+
+        return lemma
+
+    return load_once(_lookup_functions, language_code, load)
+
+
+def _lemmatize(texts: list, method: str, language_code: str) -> list:
+    """
+    Return, for each of ``texts``, the list of its tokens paired with their
+    lemmas found by ``method``, one of ``lemma_methods``.
+    """
+    if method == "Lookup":
+        lemma = _lookup_function(language_code)
+        return [
+            [
+                (token, lemma(token.text) if token.is_alpha else token.text)
+                for token in doc
+            ]
+            for doc in _tokenizer(language_code).pipe(texts)
+        ]
+    elif method == "Rule":
+        language = pycountry.languages.get(alpha_3=language_code)
+        # The lemmatizer only needs the parts of speech.
+        docs = _pipe(
+            getattr(language, "alpha_2", None) or language_code,
+            texts,
+            disable=("parser", "ner"),
+        )
+        return [[(token, token.lemma_) for token in doc] for doc in docs]
+    raise ValueError("unknown lemmatization method %s" % method)
+
+
+def _lemma_words(lemmas: list) -> List[str]:
+    """
+    Return the lemmas of the words among the tokens of ``lemmas``.
+    """
+    return [lemma for token, lemma in lemmas if not (token.is_punct or token.is_space)]
+
+
+def _lemma_text(lemmas: list) -> str:
+    """
+    Return the text of the tokens of ``lemmas`` with each word replaced by
+    its lemma.
+    """
+    return "".join(lemma + token.whitespace_ for token, lemma in lemmas)
+
+
+class _LemmaBuiltin(_WordNetBuiltin, _SpacyBuiltin):
+    """
+    Common code for the builtins that lemmatize words, either from lookup
+    tables or with the rule-based lemmatizer of the spaCy pipeline.
+    """
+
+    options = merge_dictionaries(
+        _SpacyBuiltin.options,
+        {
+            "Method": '"Lookup"',
+        },
+    )
+
+    messages = merge_dictionaries(
+        merge_dictionaries(_SpacyBuiltin.messages, _WordNetBuiltin.messages),
+        {
+            "method": 'Method `1` should be "Lookup" or "Rule".',
+        },
+    )
+
+    requires = ("nltk", "spacy")
+
+    methods = lemma_methods
+
+    def _lemmas(self, texts: list, evaluation: Evaluation, options: dict):
+        """
+        Return, for each of ``texts``, the list of its tokens paired with
+        their lemmas.
+        """
+        method = self.get_option(options, "Method", evaluation)
+        py_method = method.get_string_value()
+        if py_method not in self.methods:
+            evaluation.message(self.get_name(), "method", method)
+            return
+        language_name = self.get_option(options, "Language", evaluation)
+        language_code = None
+        if isinstance(language_name, String):
+            language_code = _language_code(language_name.value)
+        if language_code is None:
+            evaluation.message(
+                self.get_name(), "lang", language_name, strip_context(self.get_name())
+            )
+            return
+        try:
+            return _lemmatize(texts, py_method, language_code)
+        except NatlangError as e:
+            e.message(self.get_name(), evaluation, language_name)
+
+
+class TextLemmas(_LemmaBuiltin):
+    """
+    <url>:Lemmatisation:
+    https://en.wikipedia.org/wiki/Lemmatisation</url>
+
+    <dl>
+      <dt>'TextLemmas'[$text$]
+      <dd>returns the lemmas of the words in $text$.
+
+      <dt>'TextLemmas'[{$text_1$, $text_2$, ...}]
+      <dd>returns the lemmas of the words in each $text_i$.
+    </dl>
+
+    With 'Method -> "Lookup"', the default, each word is looked up in a \
+    table, which is fast but does not consider the part of speech of the \
+    word in $text$. 'Method -> "Rule"' runs the tagger of the spaCy \
+    pipeline and applies the lemmatization rules to the tagged words.
+
+    >> TextLemmas["The geese were running."]
+     = {The, goose, be, run}
+
+    >> TextLemmas[{"Dogs bark.", "Cats sleep."}, Method -> "Rule"]
+     = {{dog, bark}, {cat, sleep}}
+    """
+
+    summary_text = "list the lemmas of the words in a text"
+
+    @staticmethod
+    def _words(lemmas: list) -> ListExpression:
+        return ListExpression(*[String(lemma) for lemma in _lemma_words(lemmas)])
+
+    def eval(self, text: String, evaluation: Evaluation, options: dict):
+        "TextLemmas[text_String, OptionsPattern[TextLemmas]]"
+        lemmas = self._lemmas([text.value], evaluation, options)
+        if lemmas is not None:
+            return self._words(lemmas[0])
+
+    def eval_list(self, texts, evaluation: Evaluation, options: dict):
+        "TextLemmas[texts_List, OptionsPattern[TextLemmas]]"
+        if all(isinstance(text, String) for text in texts.elements):
+            lemmas = self._lemmas(
+                [text.value for text in texts.elements], evaluation, options
             )
+            if lemmas is not None:
+                return ListExpression(*[self._words(item) for item in lemmas])
+
+
+class WordLemma(_LemmaBuiltin):
+    """
+    <url>:Lemma:
+    https://en.wikipedia.org/wiki/Lemma_(morphology)</url>
+
+    <dl>
+      <dt>'WordLemma'[$word$]
+      <dd>returns the lemma, or dictionary form, of $word$.
+
+      <dt>'WordLemma'[{$word_1$, $word_2$, ...}]
+      <dd>returns the lemma of each $word_i$.
+    </dl>
+
+    The options are those of 'TextLemmas'. Unlike 'WordStem', the result is \
+    a word.
+
+    >> WordLemma["geese"]
+     = goose
+
+    >> WordLemma[{"running", "was", "running"}]
+     = {run, be, run}
+    """
+
+    summary_text = "retrieve the lemma of a word"
+
+    def eval(self, word: String, evaluation: Evaluation, options: dict):
+        "WordLemma[word_String, OptionsPattern[WordLemma]]"
+        lemmas = self._lemmas([word.value], evaluation, options)
+        if lemmas is not None:
+            return String(_lemma_text(lemmas[0]))
+
+    def eval_list(self, words, evaluation: Evaluation, options: dict):
+        "WordLemma[words_List, OptionsPattern[WordLemma]]"
+        if all(isinstance(w, String) for w in words.elements):
+            # Each distinct word is lemmatized once.
+            distinct = list(dict.fromkeys(w.value for w in words.elements))
+            lemmas = self._lemmas(distinct, evaluation, options)
+            if lemmas is None:
+                return
+            results = {
+                word: String(_lemma_text(item)) for word, item in zip(distinct, lemmas)
+            }
+            return ListExpression(*[results[w.value] for w in words.elements])
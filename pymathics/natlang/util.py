@@ -4,11 +4,261 @@
 utils
 """
 
+import os
+import tempfile
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Hashable, Optional
+
+from mathics.core.atoms import String
+from mathics.core.symbols import strip_context
+
+from pymathics.natlang import instrumentation
+
 # Don't consider this for user documentation
 no_doc = True
 
+# The lock of each key being loaded, with the number of threads using it,
+# by the id of its cache and the key. An entry is dropped when the last of
+# these threads is done, so the cache outlives it and its id is not reused.
+_load_locks = {}
+_load_locks_lock = threading.Lock()
+
+# Shared String atoms kept for each language.
+interned_strings = 1 << 16
+_string_tables = {}
+
+
+class NatlangError(Exception):
+    """
+    The work of a natlang engine could not be done, e.g. because a model is
+    not installed or a language is not supported. The builtins emit it as
+    their message ``tag`` with ``arguments``; its text says the same for
+    Python callers.
+    """
+
+    def __init__(self, text: str, tag: str, *arguments: str):
+        super().__init__(text)
+        self.tag = tag
+        self.arguments = arguments
+
+    def message(self, name: str, evaluation, language_name=None):
+        """
+        Emit the message ``tag`` of the builtin ``name``. Its short name
+        follows ``arguments``, for the messages that name the builtin. An
+        unsupported language is named ``language_name``, as the builtin was
+        given it, rather than by the code the engine knows it by.
+        """
+        arguments = self.arguments
+        if self.tag == "lang" and language_name is not None:
+            arguments = (language_name,)
+        evaluation.message(name, self.tag, *arguments, strip_context(name))
+
 
 def merge_dictionaries(a, b):
     c = a.copy()
     c.update(b)
     return c
+
+
+def load_once(cache: dict, key: Hashable, load: Callable[[], Any]) -> Any:
+    """
+    Return ``cache[key]``, computing it with ``load()`` if it is missing.
+
+    Threads asking for the same missing key wait for a single call of
+    ``load()``. A result of None reports a failure and is not cached, so
+    that the next call tries again. Loads are recorded by the instrumentation
+    under the name of the function calling ``load_once()``.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    lock_key = (id(cache), key)
+    with _load_locks_lock:
+        entry = _load_locks.get(lock_key)
+        if entry is None:
+            entry = _load_locks[lock_key] = [threading.RLock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            value = cache.get(key)
+            if value is None:
+                if instrumentation.enabled():
+                    start = time.perf_counter()
+                    value = load()
+                    instrumentation.record_load(
+                        load.__qualname__.split(".<locals>")[0],
+                        time.perf_counter() - start,
+                    )
+                else:
+                    value = load()
+                if value is not None:
+                    cache[key] = value
+    finally:
+        with _load_locks_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del _load_locks[lock_key]
+    return value
+
+
+def cache_path(name: str) -> str:
+    """
+    Return the path of the file ``name`` in the directory where data derived
+    from the corpora is kept between sessions, creating the directory if
+    needed. The directory can be set with the environment variable
+    MATHICS3_NATLANG_CACHE.
+    """
+    directory = os.environ.get("MATHICS3_NATLANG_CACHE")
+    if not directory:
+        directory = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "Mathics3",
+            "natlang",
+        )
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, name)
+
+
+def write_atomically(path: str, write: Callable[[BinaryIO], None]):
+    """
+    Write the file ``path`` with ``write(file)``. The file is replaced
+    atomically, so that readers never see a partial file.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            write(file)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def cached_file(
+    name: str,
+    read: Callable[[str], Any],
+    build: Callable[[], Any],
+    write: Callable[[str, Any], None],
+) -> Any:
+    """
+    Return ``read(path)`` for the file ``name`` in the cache directory.
+
+    If the file is missing, or ``read()`` raises ValueError because it is not
+    a file of the expected kind, the value is computed with ``build()`` and
+    saved with ``write(path, value)`` first. If the cache directory cannot be
+    used, the value built is returned instead.
+    """
+    path = None
+    try:
+        path = cache_path(name)
+        if os.path.exists(path):
+            return read(path)
+    except ValueError:
+        pass  # not the expected kind of file: rebuild it
+    except OSError:
+        path = None
+
+    value = build()
+    if path is not None:
+        try:
+            write(path, value)
+            return read(path)
+        except OSError:
+            pass
+    return value
+
+
+class LRUCache:
+    """
+    Mapping that keeps at most ``size`` items, dropping the least recently
+    used one when a new item does not fit. It can be shared by threads.
+
+    It counts its hits and misses, which the instrumentation reports under
+    ``name``, if given.
+    """
+
+    _missing = object()
+
+    def __init__(self, size: int, name: Optional[str] = None):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._items = {}
+        self._lock = threading.Lock()
+        if name is not None:
+            instrumentation.register_cache(name, self)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._items.pop(key, self._missing)
+            if value is self._missing:
+                self.misses += 1
+                return default
+            self.hits += 1
+            # Reinsert to keep the most recently used items last.
+            self._items[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            if len(self._items) >= self.size:
+                del self._items[next(iter(self._items))]
+            self._items[key] = value
+
+
+class StringTable:
+    """
+    Shared String atoms of the words of a language, so that the words that
+    recur in results are built once. Atoms are looked up by a key: the text
+    itself, or a hash standing for it, such as the orth of a spaCy lexeme,
+    which avoids building the text of a token for an atom already there.
+
+    It keeps at most ``size`` atoms, dropping the least recently used ones.
+    """
+
+    def __init__(self, size: int, name: Optional[str] = None):
+        self._atoms = LRUCache(size, name)
+
+    def __len__(self) -> int:
+        return len(self._atoms)
+
+    def get(self, key: Hashable) -> Optional[String]:
+        return self._atoms.get(key)
+
+    def add(self, key: Hashable, text: str) -> String:
+        """
+        Return the atom of ``text``, under ``key`` from now on.
+        """
+        atom = String(text)
+        self._atoms[key] = atom
+        return atom
+
+    def string(self, text: str) -> String:
+        """
+        Return the shared atom of ``text``.
+        """
+        atom = self._atoms.get(text)
+        if atom is None:
+            atom = self.add(text, text)
+        return atom
+
+
+def string_table(language: str) -> StringTable:
+    """
+    Return the table of the shared String atoms of ``language``.
+    """
+    return load_once(
+        _string_tables,
+        language,
+        lambda: StringTable(interned_strings, "Strings %s" % language),
+    )
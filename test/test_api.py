@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from .helper import session
+
+TEXT = "Hickory, dickory, dock! The mouse ran up the clock."
+
+
+def test_api_matches_builtins():
+    session.evaluate('LoadModule["pymathics.natlang"]')
+    from pymathics.natlang import api
+
+    for name, arguments, str_expr in (
+        ("text_words", ([TEXT],), '{TextWords["%s"]}' % TEXT),
+        ("text_sentences", ([TEXT],), '{TextSentences["%s"]}' % TEXT),
+        (
+            "word_stems",
+            (["heroes", "roses", "heroes"],),
+            'WordStem[{"heroes", "roses", "heroes"}]',
+        ),
+        (
+            "word_lemmas",
+            (["geese", "running", "geese"],),
+            'WordLemma[{"geese", "running", "geese"}]',
+        ),
+        ("synonyms", (["big"],), 'Synonyms[{"big"}]'),
+        ("antonyms", (["big"],), 'Antonyms[{"big"}]'),
+        (
+            "dictionary_lookup",
+            ("baker.*", "English", 3),
+            'DictionaryLookup["baker" ~~ ___, 3]',
+        ),
+        (
+            "dictionary_word_q",
+            (["couch", "couches", "meep-meep"],),
+            'DictionaryWordQ[{"couch", "couches", "meep-meep"}]',
+        ),
+        (
+            "pluralize",
+            (["try", "potato", "try"],),
+            'Pluralize[{"try", "potato", "try"}]',
+        ),
+        (
+            "identify_languages",
+            (["eins zwei drei", "one two three"],),
+            'LanguageIdentify[{"eins zwei drei", "one two three"}]',
+        ),
+    ):
+        result = getattr(api, name)(*arguments)
+        expected = session.evaluate(str_expr).to_python(string_quotes=False)
+        assert result == expected, name
+
+
+def test_api_without_session():
+    # The engines do not need a Mathics3 session, nor the builtins loaded.
+    script = (
+        "from pymathics.natlang import api; "
+        "print(api.word_stems(['heroes', 'roses']), api.pluralize(['try']))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "['hero', 'rose'] ['tries']"
+
+
+def test_api_errors():
+    session.evaluate('LoadModule["pymathics.natlang"]')
+    from pymathics.natlang import api
+
+    assert api.synonyms(["big", "fdasfdsafdsa"])[1] is None
+    with pytest.raises(api.NatlangError):
+        api.text_words([TEXT], "Klingon")
+    with pytest.raises(api.NatlangError):
+        api.synonyms(["big"], "Klingon")
+    with pytest.raises(ValueError):
+        api.spelling_corrections(["hipopotamus"], method="Guess")
+
+
+def test_aio_coalesces_concurrent_requests(monkeypatch):
+    session.evaluate('LoadModule["pymathics.natlang"]')
+    from pymathics.natlang import aio, api
+
+    batches = []
+
+    def text_words(texts, language="English"):
+        batches.append(list(texts))
+        return [text.split() for text in texts]
+
+    monkeypatch.setattr(api, "text_words", text_words)
+
+    async def requests():
+        return await asyncio.gather(
+            *(aio.text_words(["word %d" % i]) for i in range(5)),
+            aio.text_words([]),
+        )
+
+    results = asyncio.run(requests())
+    assert results == [[["word", str(i)]] for i in range(5)] + [[]]
+    assert batches == [["word %d" % i for i in range(5)]]
+
+
+def test_aio_covers_api():
+    from pymathics.natlang import aio, api
+
+    for name in api.__all__:
+        if name != "NatlangError":
+            assert asyncio.iscoroutinefunction(getattr(aio, name, None)), name
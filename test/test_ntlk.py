@@ -21,6 +21,144 @@ def test_natlang():
             "True",
             "WordList",
         ),
+        (
+            'DictionaryLookup["baker" ~~ ___, 3]',
+            '{"baker", "baker\'s dozen", "baker\'s eczema"}',
+            "DictionaryLookup with a prefix",
+        ),
+        (
+            'MemberQ[DictionaryLookup[___ ~~ "ness"], "happiness"]',
+            "True",
+            "DictionaryLookup with a suffix",
+        ),
+        (
+            'DictionaryWordQ[{"couch", "couches", "meep-meep", 3}]',
+            "{True, True, False, False}",
+            "DictionaryWordQ on a list",
+        ),
+        (
+            'DictionaryWordQ["couches", IncludeInflections -> False]',
+            "False",
+            "DictionaryWordQ without inflections",
+        ),
+        (
+            'WordData[{"riverside", "riverside"}, {"Definitions", "PorterStem"}]',
+            '{{{{"riverside", "Noun", "Bank"} -> "the bank of a river"}, "riversid"}, '
+            '{{{"riverside", "Noun", "Bank"} -> "the bank of a river"}, "riversid"}}',
+            "WordData on lists of words and properties",
+        ),
+        (
+            'WordNetSimilarity[{{"dog", "dog"}, {"dog", "fdasfdsafdsa"}}]',
+            '{1., Missing["NotAvailable"]}',
+            "WordNetSimilarity on a list of pairs",
+        ),
+        (
+            'Antonyms[{"big", "fdasfdsafdsa"}]',
+            '{{"little", "small"}, Missing["UnknownWord"]}',
+            "Antonyms on a list",
+        ),
+        (
+            'Pluralize[{"potato", "try"}]',
+            '{"potatoes", "tries"}',
+            "Pluralize on a list",
+        ),
+        (
+            'Singularize["potatoes"]',
+            '"potato"',
+            "Singularize",
+        ),
+        (
+            'SpellingCorrectionList[{"couch", "couch"}]',
+            '{{"couch"}, {"couch"}}',
+            "SpellingCorrectionList on a list",
+        ),
+        (
+            'First /@ SpellingCorrectionList[{"hipopotamus", "teh"}, Method -> "SymSpell"]',
+            '{"hippopotamus", "the"}',
+            "SpellingCorrectionList with the SymSpell method",
+        ),
+        (
+            'SpellingCorrect["The hipopotamus  lives in Africa."]',
+            '"The hippopotamus  lives in Africa."',
+            "SpellingCorrect",
+        ),
+        (
+            'WordStem[{"towers", "caminando", "towers"}]',
+            '{"tower", "caminando", "tower"}',
+            "WordStem on a list",
+        ),
+        (
+            'WordStem[{"the towers fell", "towers", "the towers fell"}]',
+            '{"the tower fell", "tower", "the tower fell"}',
+            "WordStem on a list of texts",
+        ),
+        (
+            'WordStem["caminando", Language -> "Spanish"]',
+            '"camin"',
+            "WordStem in Spanish",
+        ),
+        (
+            'WordLemma[{"geese", "running", "geese"}]',
+            '{"goose", "run", "goose"}',
+            "WordLemma on a list",
+        ),
+        (
+            'TextLemmas[{"Dogs bark.", "Cats sleep."}, Method -> "Rule"]',
+            '{{"dog", "bark"}, {"cat", "sleep"}}',
+            "TextLemmas on a list with the rule-based lemmatizer",
+        ),
+        (
+            'LanguageIdentify[{"eins zwei drei", "one two three"}]',
+            '{"German", "English"}',
+            "LanguageIdentify on a list",
+        ),
+        (
+            'LanguageIdentify["ciao a tutti", Languages -> {"English", "Italian"}]',
+            '"Italian"',
+            "LanguageIdentify with a restricted set of languages",
+        ),
+        (
+            'Keys[LanguageIdentify["eins zwei drei", 2]]',
+            '{"German", "Luxembourgish"}',
+            "LanguageIdentify ranking",
+        ),
+        (
+            'LanguageIdentify[StringRepeat["one two three four five ", 5000], Method -> "Sample"]',
+            '"English"',
+            "LanguageIdentify sampling a long text",
+        ),
+        (
+            'LanguageIdentify["The weather is nice today. Das Wetter ist heute schön.", "Sentence"][[All, ;;2]]',
+            '{{{1, 26}, "English"}, {{28, 54}, "German"}}',
+            "LanguageIdentify by sentence",
+        ),
+        (
+            'NatlangStatistics[True]; NatlangStatistics["Reset"]; '
+            'LanguageIdentify[{"eins zwei drei", "one two three"}]',
+            '{"German", "English"}',
+            "LanguageIdentify with NatlangStatistics[True]",
+        ),
+        (
+            'Keys[LanguageIdentify["eins zwei drei", 2]]',
+            '{"German", "Luxembourgish"}',
+            "LanguageIdentify ranking with NatlangStatistics[True]",
+        ),
+        (
+            '{"Calls", "Characters"} /. ({"langid classify", "langid rank"} '
+            '/. ("Calls" /. NatlangStatistics[]))',
+            "{{1, 27}, {1, 14}}",
+            "NatlangStatistics of LanguageIdentify",
+        ),
+        (
+            "NatlangStatistics[False]",
+            "Null",
+            "NatlangStatistics[False]",
+        ),
+        (
+            'TextCases["I was in London last year. Ich war letztes Jahr in Berlin.", "City", Language -> Automatic]',
+            '{"London", "Berlin"}',
+            "TextCases dispatching sentences to the model of their language",
+        ),
         (
             'TextWords["Hickory, dickory, dock! The mouse ran up the clock."]',
             '{"Hickory", "dickory", "dock", "The", "mouse", "ran", "up", "the", "clock"}',
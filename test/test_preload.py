@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import gc
+import os
+
+import pytest
+
+from .helper import session
+
+SMAPS_ROLLUP = "/proc/self/smaps_rollup"
+
+
+def memory_kb(*fields) -> int:
+    """
+    Sum the ``fields`` of the memory map of the current process, in kB.
+    """
+    total = 0
+    with open(SMAPS_ROLLUP) as smaps:
+        for line in smaps:
+            name, _, value = line.partition(":")
+            if name in fields:
+                total += int(value.split()[0])
+    return total
+
+
+def child_unique_kb() -> int:
+    """
+    Fork a child that uses the natlang builtins and then collects garbage,
+    and return the memory it does not share with its parent, in kB.
+    """
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_end)
+            session.evaluate('TextWords["The geese were running to London."]')
+            session.evaluate('Synonyms["big"]')
+            session.evaluate('WordLemma["geese"]')
+            gc.collect()
+            unique = memory_kb("Private_Clean", "Private_Dirty")
+            os.write(write_end, str(unique).encode("ascii"))
+        finally:
+            os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end, "rb") as pipe:
+        unique = int(pipe.read() or -1)
+    os.waitpid(pid, 0)
+    return unique
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "fork") or not os.path.exists(SMAPS_ROLLUP),
+    reason="needs fork() and /proc/self/smaps_rollup",
+)
+def test_preload_shares_memory_with_children():
+    session.evaluate('LoadModule["pymathics.natlang"]')
+    from pymathics.natlang.resources import preload
+
+    # A child forked before the resources are preloaded and frozen.
+    control = child_unique_kb()
+    assert control > 0, control
+    try:
+        loaded = preload(["English"])
+        assert "English WordNet" in loaded, loaded
+        assert "English spaCy" in loaded, loaded
+
+        for _ in range(2):
+            unique = child_unique_kb()
+            assert 0 <= unique < control, (control, unique)
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from .helper import session
+
+TEXT = "Hickory, dickory, dock! The mouse ran up the clock."
+
+
+def evaluate(str_expr: str):
+    return session.evaluate(str_expr).to_python(string_quotes=False)
+
+
+@pytest.fixture
+def natlang_server(tmp_path):
+    """
+    Start a server in a thread on a socket in ``tmp_path``, and yield its
+    path and the list of the operations it is asked for.
+    """
+    session.evaluate('LoadModule["pymathics.natlang"]')
+    from pymathics.natlang import server
+
+    ops = []
+
+    class RecordingServer(server.Server):
+        def answer(self, message: dict):
+            ops.append(message["op"])
+            if message["op"] == "sleep":
+                time.sleep(message["seconds"])
+                return {"result": True}, None
+            return super().answer(message)
+
+    path = str(tmp_path / "natlang.sock")
+    with RecordingServer(path) as instance:
+        threading.Thread(target=instance.serve_forever, daemon=True).start()
+        try:
+            yield path, ops
+        finally:
+            instance.shutdown()
+            server._close_connection()
+
+
+def test_server_round_trips(natlang_server, monkeypatch):
+    path, ops = natlang_server
+    assert stat.S_ISSOCK(os.stat(path).st_mode)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    words = evaluate('TextWords["%s"]' % TEXT)
+    corrections = evaluate('SpellingCorrectionList["hipopotamus"]')
+
+    monkeypatch.setenv("MATHICS3_NATLANG_SERVER", path)
+    assert evaluate('TextWords["%s"]' % TEXT) == words
+    assert evaluate('SpellingCorrectionList["hipopotamus"]') == corrections
+    assert ops == ["parse", "spelling"]
+
+
+def test_server_fallbacks(natlang_server, monkeypatch, tmp_path):
+    from pymathics.natlang import server
+
+    path, ops = natlang_server
+    words = evaluate('TextWords["%s"]' % TEXT)
+
+    # No server listening on the socket: the work is done in-process.
+    monkeypatch.setenv("MATHICS3_NATLANG_SERVER", str(tmp_path / "missing.sock"))
+    assert evaluate('TextWords["%s"]' % TEXT) == words
+
+    # The server does not answer in time.
+    monkeypatch.setenv("MATHICS3_NATLANG_SERVER", path)
+    monkeypatch.setattr(server, "request_timeout", 0.1)
+    assert server.request("sleep", seconds=1) is None
+    assert ops == ["sleep"]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+from pymathics.natlang import util
+
+
+def test_load_once_loads_once_for_concurrent_threads():
+    cache = {}
+    calls = []
+    start = threading.Barrier(8)
+
+    def load():
+        calls.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return "value"
+
+    def worker():
+        start.wait()
+        results.append(util.load_once(cache, "key", load))
+
+    results = []
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1, calls
+    assert results == ["value"] * 8
+    assert cache == {"key": "value"}
+    assert not util._load_locks
+
+
+def test_load_once_does_not_cache_none():
+    cache = {}
+    results = iter([None, "value"])
+    calls = []
+
+    def load():
+        calls.append(None)
+        return next(results)
+
+    assert util.load_once(cache, "key", load) is None
+    assert "key" not in cache
+    assert util.load_once(cache, "key", load) == "value"
+    assert util.load_once(cache, "key", load) == "value"
+    assert len(calls) == 2
+    assert not util._load_locks